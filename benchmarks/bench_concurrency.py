@@ -0,0 +1,62 @@
+"""
+Measure how long N parallel MCP tool calls take against the fake ChartMogul API.
+
+The blocking baseline calls api_client directly from the event loop, which is how
+the tools behaved before they were moved onto the worker pool. Identical parallel
+calls share one API request.
+
+Usage: python benchmarks/bench_concurrency.py [--calls 8] [--latency 0.2]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("CHARTMOGUL_TOKEN", "benchmark")
+
+from fake_api import FakeChartMogul  # noqa: E402
+from chartmogul_mcp import api_client, mcp_server  # noqa: E402
+
+
+async def _timed(coros):
+    start = time.perf_counter()
+    await asyncio.gather(*coros)
+    return time.perf_counter() - start
+
+
+async def main(calls, latency):
+    # Measure the tool calls, not the client-side rate limit.
+    api_client.rate_limiter.rate = 0
+    with FakeChartMogul(latency=latency) as fake:
+        server = mcp_server.ChartMogulMcp()
+        server.config.uri = fake.uri
+
+        async def blocking(uuid):
+            return api_client.retrieve_customer(server.config, uuid)
+
+        def tool(uuid):
+            return server.mcp.call_tool("retrieve_customer", {"uuid": uuid})
+
+        single = await _timed([tool("cus_00000")])
+        baseline = await _timed([blocking(f"cus_{n:05d}") for n in range(calls)])
+        parallel = await _timed([tool(f"cus_{n:05d}") for n in range(calls)])
+        fake.reset_counters()
+        identical = await _timed([tool("cus_00000") for _ in range(calls)])
+        identical_requests = fake.requests
+
+    print(f"API latency:                      {latency * 1000:8.1f} ms")
+    print(f"1 tool call:                      {single * 1000:8.1f} ms")
+    print(f"{calls} calls blocking the event loop: {baseline * 1000:8.1f} ms")
+    print(f"{calls} parallel tool calls:           {parallel * 1000:8.1f} ms")
+    print(f"{calls} identical parallel tool calls: {identical * 1000:8.1f} ms, "
+          f"{identical_requests} API requests ({api_client.in_flight.collapsed} calls collapsed)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.latency))
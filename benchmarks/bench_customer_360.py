@@ -0,0 +1,62 @@
+"""
+Time describing one customer with separate calls and with the customer 360 composite.
+
+Separately, the customer, its subscriptions, activities, notes, opportunities and tasks are
+fetched one after the other; the composite fetches them concurrently.
+
+Usage: python benchmarks/bench_customer_360.py [--latency 0.1] [--repeat 5]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("CHARTMOGUL_TOKEN", "benchmark")
+
+from fake_api import FakeChartMogul  # noqa: E402
+from chartmogul_mcp import api_client  # noqa: E402
+
+
+def separate(config, uuid):
+    api_client.retrieve_customer(config, uuid)
+    api_client.list_customer_subscriptions(config, uuid, 20)
+    api_client.list_customer_activities(config, uuid, 20)
+    api_client.list_customer_notes(config, uuid, limit=10)
+    api_client.list_opportunities(config, uuid, limit=10)
+    api_client.list_tasks(config, uuid, limit=10)
+
+
+def composite(config, uuid):
+    result = api_client.retrieve_customer_360(config, uuid)
+    assert result is not None and not result["failed"], "customer 360 failed"
+
+
+def timed(fake, func, config, repeat):
+    fake.reset_counters()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(config, "cus_00001")
+    return (time.perf_counter() - start) / repeat, fake.requests // repeat
+
+
+def main(latency, repeat):
+    logging.disable(logging.INFO)
+    with FakeChartMogul(latency=latency) as fake:
+        config = api_client.init_chartmogul_config()
+        config.uri = fake.uri
+        one_by_one = timed(fake, separate, config, repeat)
+        combined = timed(fake, composite, config, repeat)
+
+    print(f"One customer, {latency * 1000:.1f} ms API latency, mean of {repeat} runs")
+    print(f"Separate calls: {one_by_one[0] * 1000:8.1f} ms, {one_by_one[1]} requests")
+    print(f"Customer 360:   {combined[0] * 1000:8.1f} ms, {combined[1]} requests")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.latency, args.repeat)
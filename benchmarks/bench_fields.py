@@ -0,0 +1,60 @@
+"""
+Compare converting whole SDK records with converting only a selection of their fields.
+
+Both convert the same synthetic payload of SDK Invoice and Customer objects, hydrated once
+up front; the projected output must equal the whole output with the other fields dropped.
+
+Usage: python benchmarks/bench_fields.py [--invoices 10000] [--repeat 3]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("CHARTMOGUL_TOKEN", "benchmark")
+
+import chartmogul  # noqa: E402
+from fake_api import _customer, _invoice  # noqa: E402
+from chartmogul_mcp import serializers  # noqa: E402
+
+# A typical selection per resource: identifiers plus the few values a question is about.
+FIELDS = {
+    "invoices": ["uuid", "date", "line_items.amount_in_cents", "line_items.subscription_uuid"],
+    "customers": ["uuid", "name", "mrr", "attributes.tags"],
+}
+
+
+def best_of(repeat, func, records):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = [func(record) for record in records]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main(invoices, repeat):
+    payloads = {
+        "invoices": chartmogul.Invoice._schema.load([_invoice(i) for i in range(invoices)], many=True),
+        "customers": chartmogul.Customer._schema.load([_customer(i) for i in range(invoices // 10)], many=True),
+    }
+    for name, payload in payloads.items():
+        node = serializers.projection(FIELDS[name])
+        whole_time, whole = best_of(repeat, serializers.serialize, payload)
+        fields_time, projected = best_of(repeat, lambda record: serializers.serialize(record, node), payload)
+        assert projected == serializers.project(whole, node), f"projected output differs for {name}"
+        whole_size, fields_size = len(json.dumps(whole)), len(json.dumps(projected))
+        print(f"{len(payload):6d} {name:9s} whole: {whole_time * 1000:8.1f} ms, {whole_size / 1024:8.1f} kB   "
+              f"{len(FIELDS[name])} fields: {fields_time * 1000:8.1f} ms, {fields_size / 1024:8.1f} kB   "
+              f"({whole_time / fields_time:.1f}x faster, {whole_size / fields_size:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--invoices", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.invoices, args.repeat)
@@ -0,0 +1,54 @@
+"""
+Time a long activities listing walked as one cursor chain and split into concurrent date shards.
+
+Every page of a cursor chain waits for the previous one; shards of the date range each walk
+their own chain at the same time, so the listing takes about as long as its longest shard.
+
+Usage: python benchmarks/bench_list_shards.py [--records 6000] [--shards 1 2 4 8] [--latency 0.05]
+"""
+import argparse
+import datetime
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("CHARTMOGUL_TOKEN", "benchmark")
+
+from fake_api import START, FakeChartMogul  # noqa: E402
+from chartmogul_mcp import api_client  # noqa: E402
+
+
+def run(fake, config, records, shards):
+    fake.reset_counters()
+    start = time.perf_counter()
+    activities = api_client.list_activities(config, START, START + datetime.timedelta(hours=records - 1),
+                                            None, None, None, shards=shards)
+    assert activities is not None and len(activities) == records, "activities listing failed"
+    return time.perf_counter() - start, fake.requests, activities
+
+
+def main(records, shard_counts, latency):
+    logging.disable(logging.INFO)
+    # Measure the listings, not the client-side rate limit.
+    api_client.rate_limiter.rate = 0
+    with FakeChartMogul(latency=latency, records=records) as fake:
+        config = api_client.init_chartmogul_config()
+        config.uri = fake.uri
+        results = [(shards, run(fake, config, records, shards)) for shards in shard_counts]
+
+    print(f"{records} activities, {latency * 1000:.1f} ms API latency")
+    reference = results[0][1][2]
+    for shards, (elapsed, requests, activities) in results:
+        same = "same records" if list(activities) == list(reference) else "DIFFERENT records"
+        print(f"{shards:2d} shards: {elapsed * 1000:8.1f} ms, {requests:3d} requests, {same}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=6000)
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+    main(args.records, args.shards, args.latency)
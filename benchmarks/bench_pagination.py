@@ -0,0 +1,54 @@
+"""
+Time paging through list_invoices with and without prefetching the next page.
+
+Without prefetching every page waits for the previous one to be parsed; with it,
+the next request is already in flight while parse_object works on the current page.
+
+Usage: python benchmarks/bench_pagination.py [--records 2000] [--latency 0.02] [--prefetch 2]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("CHARTMOGUL_TOKEN", "benchmark")
+
+from fake_api import FakeChartMogul  # noqa: E402
+from chartmogul_mcp import api_client, utils  # noqa: E402
+
+
+def run(fake, config, records, prefetch):
+    utils.PAGE_PREFETCH = prefetch
+    fake.reset_counters()
+    start = time.perf_counter()
+    invoices = api_client.list_invoices(config, limit=records)
+    elapsed = time.perf_counter() - start
+    assert invoices is not None, "listing failed"
+    return elapsed, len(invoices), fake.requests
+
+
+def main(records, latency, prefetch):
+    logging.disable(logging.INFO)
+    with FakeChartMogul(latency=latency, records=records) as fake:
+        config = api_client.init_chartmogul_config()
+        config.uri = fake.uri
+        api_client.list_invoices(config, limit=20)
+
+        serial = run(fake, config, records, 0)
+        pipelined = run(fake, config, records, prefetch)
+
+    print(f"{records} invoices, {latency * 1000:.1f} ms API latency")
+    print(f"Sequential pages:      {serial[0] * 1000:8.1f} ms, {serial[1]:5d} invoices, {serial[2]:3d} requests")
+    print(f"Prefetch depth {prefetch}:      {pipelined[0] * 1000:8.1f} ms, "
+          f"{pipelined[1]:5d} invoices, {pipelined[2]:3d} requests")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--prefetch", type=int, default=2)
+    args = parser.parse_args()
+    main(args.records, args.latency, args.prefetch)
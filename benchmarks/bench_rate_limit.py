@@ -0,0 +1,56 @@
+"""
+Tag customers in bulk against a rate-limited fake API, with and without the request scheduler.
+
+Without retries (as before the scheduler) throttled customers fail. With retries only, the
+requests run into 429 responses and wait for the API's Retry-After delay; with the client-side
+limit they go out at the allowed rate in the first place.
+
+Usage: python benchmarks/bench_rate_limit.py [--customers 100] [--api-limit 10] [--latency 0.02]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("CHARTMOGUL_TOKEN", "benchmark")
+
+from fake_api import FakeChartMogul  # noqa: E402
+from chartmogul_mcp import api_client, utils  # noqa: E402
+from chartmogul_mcp.ratelimit import RateLimiter  # noqa: E402
+
+
+def run(fake, config, customers, rate, max_retries):
+    api_client.rate_limiter = RateLimiter(rate=rate, burst=max(1, int(rate)), max_retries=max_retries)
+    fake.reset_counters()
+    time.sleep(1)  # let the fake API's own bucket fill up again
+    start = time.perf_counter()
+    result = api_client.bulk_add_customer_tags(config, ["benchmark"], uuids=[f"cus_{n:05d}" for n in range(customers)])
+    elapsed = time.perf_counter() - start
+    return elapsed, len(result["succeeded"]), fake.requests, fake.throttled
+
+
+def main(customers, api_limit, latency):
+    logging.disable(logging.ERROR)
+    utils.BATCH_PARALLELISM = 16
+    with FakeChartMogul(latency=latency, rate_limit=api_limit) as fake:
+        config = api_client.init_chartmogul_config()
+        config.uri = fake.uri
+        runs = (("No retries", run(fake, config, customers, 0, 0)),
+                ("Retries only", run(fake, config, customers, 0, 20)),
+                (f"Limit {api_limit:g}/s", run(fake, config, customers, api_limit, 20)))
+
+    print(f"{customers} customers tagged, API limit {api_limit:g} requests/s, {latency * 1000:.1f} ms latency")
+    for name, (elapsed, succeeded, requests, throttled) in runs:
+        print(f"{name:16s} {elapsed * 1000:8.1f} ms, {succeeded:4d} succeeded, "
+              f"{requests:4d} requests, {throttled:4d} throttled")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--customers", type=int, default=100)
+    parser.add_argument("--api-limit", type=float, default=10)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+    main(args.customers, args.api_limit, args.latency)
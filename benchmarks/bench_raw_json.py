@@ -0,0 +1,61 @@
+"""
+Compare SDK object hydration with the raw JSON fast path on a large invoice pull.
+
+Both modes go through the pooled async transport, so the difference is the CPU and memory
+spent turning responses into parse_object output. The outputs are checked to be equal.
+
+Usage: python benchmarks/bench_raw_json.py [--invoices 2000] [--repeat 3]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("CHARTMOGUL_TOKEN", "benchmark")
+
+from fake_api import FakeChartMogul  # noqa: E402
+from chartmogul_mcp import api_client, utils  # noqa: E402
+
+
+def run(config, invoices, raw_json, repeat):
+    utils.RAW_JSON = raw_json
+    best = None
+    for _ in range(repeat):
+        start = time.process_time()
+        result = api_client.list_invoices(config, limit=invoices)
+        elapsed = time.process_time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    api_client.list_invoices(config, limit=invoices)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def main(invoices, repeat):
+    logging.disable(logging.INFO)
+    utils.ASYNC_TRANSPORT = True
+    with FakeChartMogul(latency=0, records=invoices) as fake:
+        config = api_client.init_chartmogul_config()
+        config.uri = fake.uri
+        api_client.list_invoices(config, limit=20)
+
+        sdk_time, sdk_peak, sdk = run(config, invoices, False, repeat)
+        raw_time, raw_peak, raw = run(config, invoices, True, repeat)
+        api_client.get_transport().close()
+    assert sdk == raw, "raw JSON output differs from the SDK path"
+
+    print(f"{invoices} invoices, CPU time of the calling process and peak traced memory")
+    print(f"SDK objects:  {sdk_time * 1000:8.1f} ms CPU, {sdk_peak / 2 ** 20:6.1f} MiB peak")
+    print(f"Raw JSON:     {raw_time * 1000:8.1f} ms CPU, {raw_peak / 2 ** 20:6.1f} MiB peak")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--invoices", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.invoices, args.repeat)
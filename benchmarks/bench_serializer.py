@@ -0,0 +1,65 @@
+"""
+Compare the schema-compiled serializer with the original recursive parse_object.
+
+Both convert the same synthetic payload of SDK Invoice objects (with nested line items
+and transactions), hydrated once up front, and must produce identical output.
+
+Usage: python benchmarks/bench_serializer.py [--invoices 10000] [--repeat 3]
+"""
+import argparse
+import datetime
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("CHARTMOGUL_TOKEN", "benchmark")
+
+import chartmogul  # noqa: E402
+from fake_api import _customer, _invoice  # noqa: E402
+from chartmogul_mcp import serializers  # noqa: E402
+
+
+def recursive_parse_object(obj):
+    # parse_object as it was before chartmogul_mcp.serializers.
+    if isinstance(obj, datetime.datetime) or isinstance(obj, datetime.date):
+        return obj.isoformat()
+    elif hasattr(obj, '__dict__'):
+        result = {}
+        for key, value in obj.__dict__.items():
+            result[key] = recursive_parse_object(value)
+        return result
+    elif isinstance(obj, list):
+        return [recursive_parse_object(item) for item in obj]
+    else:
+        return obj
+
+
+def best_of(repeat, func, records):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = [func(record) for record in records]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main(invoices, repeat):
+    records = chartmogul.Invoice._schema.load([_invoice(i) for i in range(invoices)], many=True)
+    customers = chartmogul.Customer._schema.load([_customer(i) for i in range(invoices // 10)], many=True)
+
+    for name, payload in (("invoices", records), ("customers", customers)):
+        old_time, old = best_of(repeat, recursive_parse_object, payload)
+        new_time, new = best_of(repeat, serializers.serialize, payload)
+        assert old == new, f"serializer output differs for {name}"
+        print(f"{len(payload):6d} {name:9s} recursive parse_object: {old_time * 1000:8.1f} ms   "
+              f"compiled serializer: {new_time * 1000:8.1f} ms   ({old_time / new_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--invoices", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.invoices, args.repeat)
@@ -0,0 +1,51 @@
+"""
+Time a full invoice and customer export walked as one cursor chain and fanned out per data source.
+
+The fake account spreads its records over four data sources; with fan-out, the listing of
+every source walks its own cursor chain at the same time.
+
+Usage: python benchmarks/bench_source_fan_out.py [--records 4000] [--latency 0.05]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("CHARTMOGUL_TOKEN", "benchmark")
+
+from fake_api import FakeChartMogul  # noqa: E402
+from chartmogul_mcp import api_client  # noqa: E402
+
+
+def run(fake, config, list_func, fan_out):
+    fake.reset_counters()
+    start = time.perf_counter()
+    records = list_func(config, limit=None, fan_out=fan_out)
+    assert records is not None and len(records) == fake.records, "export failed"
+    return time.perf_counter() - start, fake.requests, sorted(record["uuid"] for record in records)
+
+
+def main(records, latency):
+    logging.disable(logging.INFO)
+    # Measure the listings, not the client-side rate limit.
+    api_client.rate_limiter.rate = 0
+    with FakeChartMogul(latency=latency, records=records) as fake:
+        config = api_client.init_chartmogul_config()
+        config.uri = fake.uri
+        print(f"{records} records in 4 data sources, {latency * 1000:.1f} ms API latency")
+        for list_func in (api_client.list_invoices, api_client.list_customers):
+            chain = run(fake, config, list_func, False)
+            fan_out = run(fake, config, list_func, True)
+            same = "same records" if chain[2] == fan_out[2] else "DIFFERENT records"
+            print(f"{list_func.__name__:15s} one chain: {chain[0] * 1000:8.1f} ms, {chain[1]:3d} requests; "
+                  f"per source: {fan_out[0] * 1000:8.1f} ms, {fan_out[1]:3d} requests, {same}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=4000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+    main(args.records, args.latency)
@@ -0,0 +1,74 @@
+"""
+Measure the cold start of the MCP server: time to the first initialize and tools/list responses.
+
+The server is started as a stdio subprocess, like desktop clients do, and the time from spawning
+it to each response is taken over several runs. An import-time breakdown of `main` shows where
+the start-up goes, and whether the chartmogul SDK is imported before the first tool call.
+
+Usage: python benchmarks/bench_startup.py [--runs 5]
+"""
+import argparse
+import asyncio
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mcp import ClientSession, StdioServerParameters  # noqa: E402
+from mcp.client.stdio import stdio_client  # noqa: E402
+
+# Top-level packages reported in the import-time breakdown.
+PACKAGES = ["mcp", "pydantic", "httpx", "starlette", "dotenv", "chartmogul", "marshmallow", "requests",
+            "chartmogul_mcp"]
+
+
+async def cold_start():
+    server = StdioServerParameters(command=sys.executable, args=[os.path.join(ROOT, "main.py")], cwd=ROOT,
+                                   env={**os.environ, "CHARTMOGUL_TOKEN": "benchmark"})
+    start = time.perf_counter()
+    async with stdio_client(server, errlog=open(os.devnull, "w")) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            initialized = time.perf_counter() - start
+            tools = await session.list_tools()
+            listed = time.perf_counter() - start
+    return initialized, listed, len(tools.tools)
+
+
+def import_times():
+    # Cumulative import time of every top-level package, from python -X importtime.
+    output = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"], cwd=ROOT,
+                            env={**os.environ, "CHARTMOGUL_TOKEN": "benchmark"},
+                            capture_output=True, text=True).stderr
+    times = {}
+    for line in output.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)", line)
+        if match and match.group(3).split(".")[0] in PACKAGES and "." not in match.group(3):
+            times[match.group(3)] = max(times.get(match.group(3), 0), int(match.group(1)))
+    return times
+
+
+def main(runs):
+    results = [asyncio.run(cold_start()) for _ in range(runs)]
+    print(f"Cold start over {runs} runs, {results[0][2]} tools")
+    print(f"initialize: {statistics.median(r[0] for r in results) * 1000:8.1f} ms median")
+    print(f"tools/list: {statistics.median(r[1] for r in results) * 1000:8.1f} ms median")
+    times = import_times()
+    print("Import time of main by package (cumulative, only the first importer is counted):")
+    for package, micros in sorted(times.items(), key=lambda item: -item[1]):
+        print(f"  {package:15s} {micros / 1000:8.1f} ms")
+    for package in ("chartmogul", "marshmallow", "requests"):
+        if package not in times:
+            print(f"  {package:15s} not imported")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    main(args.runs)
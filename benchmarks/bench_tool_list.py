@@ -0,0 +1,64 @@
+"""
+Measure the tools/list response: its size and time, with full and with compact tool descriptions.
+
+The size is what every conversation with the server pays for in tokens, roughly one token per
+four bytes; the time is taken over an in-memory client session, so it includes serialization.
+Each listing is answered both by the stock FastMCP handler, which builds and dumps the tools for
+every request, and by the cached answer of CachedToolsMCP, which must be identical.
+
+Usage: python benchmarks/bench_tool_list.py [--requests 200]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("CHARTMOGUL_TOKEN", "benchmark")
+
+from mcp.shared.memory import create_connected_server_and_client_session  # noqa: E402
+from chartmogul_mcp import mcp_server, utils  # noqa: E402
+
+
+async def measure(compact, cached, requests):
+    utils.COMPACT_TOOLS = compact
+    server = mcp_server.ChartMogulMcp()
+    if not cached:
+        # Register the handler the way FastMCP does, building and dumping the list for every request.
+        server.mcp._mcp_server.list_tools()(uncached(server.mcp))
+    async with create_connected_server_and_client_session(server.mcp._mcp_server) as client:
+        tools = await client.list_tools()
+        start = time.perf_counter()
+        for _ in range(requests):
+            await client.list_tools()
+        elapsed = (time.perf_counter() - start) / requests
+    return tools, elapsed
+
+
+def uncached(mcp):
+    # The tools of CachedToolsMCP, built from scratch for every request.
+    async def list_tools():
+        mcp._listed_tools = None
+        return await mcp.list_tools()
+    return list_tools
+
+
+def main(requests):
+    logging.disable(logging.INFO)
+    print(f"tools/list over an in-memory session, mean of {requests} requests")
+    for compact in (False, True):
+        tools, uncached_time = asyncio.run(measure(compact, False, requests))
+        cached_tools, cached_time = asyncio.run(measure(compact, True, requests))
+        assert cached_tools == tools, "the cached listing differs"
+        size = len(tools.model_dump_json(by_alias=True, exclude_none=True))
+        print(f"{'Compact' if compact else 'Full':8s} {len(tools.tools)} tools: {size:7d} bytes (~{size // 4} tokens), "
+              f"built per request: {uncached_time * 1000:6.2f} ms, cached: {cached_time * 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+    main(args.requests)
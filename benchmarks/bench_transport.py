@@ -0,0 +1,59 @@
+"""
+Compare the SDK's per-request sessions with the pooled async transport.
+
+Runs the same retrieve calls from a pool of threads against the fake ChartMogul API
+and reports the wall-clock time and how many TCP connections the API had to accept.
+
+Usage: python benchmarks/bench_transport.py [--calls 200] [--threads 8] [--latency 0.005]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("CHARTMOGUL_TOKEN", "benchmark")
+
+from fake_api import FakeChartMogul  # noqa: E402
+from chartmogul_mcp import api_client, utils  # noqa: E402
+
+
+def run(fake, config, calls, threads):
+    api_client.retrieve_customer(config, "warm-up")
+    fake.reset_counters()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(lambda n: api_client.retrieve_customer(config, f"cus_{n:05d}"), range(calls)))
+    elapsed = time.perf_counter() - start
+    assert all(results), "some requests failed"
+    return elapsed, fake.connections
+
+
+def main(calls, threads, latency):
+    logging.disable(logging.INFO)
+    # Measure the transports, not the client-side rate limit.
+    api_client.rate_limiter.rate = 0
+    with FakeChartMogul(latency=latency) as fake:
+        config = api_client.init_chartmogul_config()
+        config.uri = fake.uri
+
+        utils.ASYNC_TRANSPORT = False
+        sdk_time, sdk_connections = run(fake, config, calls, threads)
+        utils.ASYNC_TRANSPORT = True
+        pooled_time, pooled_connections = run(fake, config, calls, threads)
+        api_client.get_transport().close()
+
+    print(f"{calls} calls from {threads} threads, {latency * 1000:.1f} ms API latency")
+    print(f"SDK sessions:     {sdk_time * 1000:8.1f} ms, {sdk_connections:4d} connections opened")
+    print(f"Async transport:  {pooled_time * 1000:8.1f} ms, {pooled_connections:4d} connections opened")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.005)
+    args = parser.parse_args()
+    main(args.calls, args.threads, args.latency)
@@ -0,0 +1,442 @@
+"""
+A local stand-in for the ChartMogul API, used by the benchmarks and the tests.
+
+It serves canned JSON for the endpoints the MCP server calls, waits a configurable
+latency before answering every request and counts the TCP connections it accepts,
+so the benchmarks can measure concurrency and connection reuse without a real account.
+"""
+import datetime
+import json
+import ssl
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+START = datetime.datetime(2024, 1, 1)
+
+
+def _customer(i):
+    return {
+        "id": i,
+        "uuid": f"cus_{i:05d}",
+        "external_id": f"ext_{i:05d}",
+        "name": f"Customer {i}",
+        "company": f"Company {i}",
+        "email": f"customer{i}@example.com",
+        "status": "Active",
+        "customer-since": (START + datetime.timedelta(days=i % 365)).isoformat() + "Z",
+        "attributes": {
+            "tags": ["important", f"segment-{i % 5}"],
+            "stripe": {},
+            "clearbit": {},
+            "custom": {"channel": "web", "seats": i % 20},
+        },
+        "address": {"address_zip": "10001", "city": "New York", "state": "NY", "country": "US"},
+        "data_source_uuid": f"ds_{i % 4}",
+        "data_source_uuids": [f"ds_{i % 4}"],
+        "external_ids": [f"ext_{i:05d}"],
+        "lead_created_at": None,
+        "free_trial_started_at": None,
+        "mrr": 1000 + i,
+        "arr": 12000 + 12 * i,
+        "billing-system-url": "https://dashboard.stripe.com/customers/cus",
+        "chartmogul-url": f"https://app.chartmogul.com/#customers/{i}",
+        "billing-system-type": "Stripe",
+        "currency": "USD",
+        "currency-sign": "$",
+        "website_url": None,
+    }
+
+
+def _invoice(i):
+    date = START + datetime.timedelta(hours=i)
+    return {
+        "uuid": f"inv_{i:05d}",
+        "external_id": f"INV-{i:05d}",
+        "customer_uuid": f"cus_{i % 500:05d}",
+        "data_source_uuid": f"ds_{i % 4}",
+        "currency": "USD",
+        "date": date.isoformat() + "Z",
+        "due_date": (date + datetime.timedelta(days=30)).isoformat() + "Z",
+        "line_items": [
+            {
+                "uuid": f"li_{i:05d}_{n}",
+                "external_id": None,
+                "type": "subscription",
+                "subscription_uuid": f"sub_{i:05d}",
+                "subscription_external_id": f"sub_ext_{i:05d}",
+                "plan_uuid": "pl_gold",
+                "prorated": False,
+                "service_period_start": date.isoformat() + "Z",
+                "service_period_end": (date + datetime.timedelta(days=30)).isoformat() + "Z",
+                "amount_in_cents": 5000,
+                "quantity": 1,
+                "discount_code": None,
+                "discount_amount_in_cents": 0,
+                "tax_amount_in_cents": 900,
+                "transaction_fees_in_cents": 0,
+                "account_code": None,
+            }
+            for n in range(2)
+        ],
+        "transactions": [
+            {
+                "uuid": f"tr_{i:05d}",
+                "external_id": None,
+                "type": "payment",
+                "date": date.isoformat() + "Z",
+                "result": "successful",
+            }
+        ],
+    }
+
+
+def _activity(i):
+    return {
+        "uuid": f"act_{i:05d}",
+        "customer-uuid": f"cus_{i % 500:05d}",
+        "customer-name": f"Customer {i % 500}",
+        "customer-external-id": f"ext_{i % 500:05d}",
+        "date": (START + datetime.timedelta(hours=i)).isoformat() + "Z",
+        "type": "new_biz",
+        "description": "purchased the Gold plan",
+        "activity-mrr": 5000,
+        "activity-mrr-movement": 5000,
+        "activity-arr": 60000,
+        "currency": "USD",
+        "subscription-external-id": f"sub_ext_{i:05d}",
+        "plan-external-id": "gold",
+    }
+
+
+def _subscription_event(i):
+    date = (START + datetime.timedelta(hours=i)).isoformat() + "Z"
+    return {
+        "id": i,
+        "data_source_uuid": f"ds_{i % 4}",
+        "customer_external_id": f"ext_{i % 500:05d}",
+        "subscription_set_external_id": None,
+        "subscription_external_id": f"sub_ext_{i:05d}",
+        "plan_external_id": "gold",
+        "event_date": date,
+        "effective_date": date,
+        "event_type": "subscription_start",
+        "external_id": f"se_{i:05d}",
+        "errors": {},
+        "created_at": date,
+        "updated_at": date,
+        "quantity": 1,
+        "currency": "USD",
+        "amount_in_cents": 5000,
+        "tax_amount_in_cents": 0,
+        "retracted_event_id": None,
+    }
+
+
+def _record(kind, i):
+    return {
+        "contacts": lambda: {"uuid": f"con_{i:05d}", "customer_uuid": f"cus_{i:05d}", "email": f"c{i}@example.com",
+                             "first_name": "Ada", "last_name": "Lovelace", "custom": {}},
+        "customer_notes": lambda: {"uuid": f"note_{i:05d}", "customer_uuid": f"cus_{i:05d}", "type": "note",
+                                   "text": "Called the customer", "author": "sales@example.com",
+                                   "created_at": START.isoformat() + "Z", "updated_at": START.isoformat() + "Z"},
+        "opportunities": lambda: {"uuid": f"opp_{i:05d}", "customer_uuid": f"cus_{i:05d}", "owner": "sales@example.com",
+                                  "pipeline": "New Business", "pipeline_stage": "Discovery",
+                                  "estimated_close_date": "2024-06-30", "currency": "USD",
+                                  "amount_in_cents": 100000, "type": "recurring", "forecast_category": "pipeline",
+                                  "win_likelihood": 30, "custom": {}, "created_at": START.isoformat() + "Z",
+                                  "updated_at": START.isoformat() + "Z"},
+        "tasks": lambda: {"task_uuid": f"task_{i:05d}", "customer_uuid": f"cus_{i:05d}", "task_details": "Follow up",
+                          "assignee": "sales@example.com", "due_date": "2024-06-30T00:00:00Z", "completed_at": None,
+                          "created_at": START.isoformat() + "Z", "updated_at": START.isoformat() + "Z"},
+        "plans": lambda: {"uuid": f"pl_{i:05d}", "data_source_uuid": f"ds_{i % 4}", "name": f"Plan {i}",
+                          "interval_count": 1, "interval_unit": "month", "external_id": f"plan_{i}"},
+        "plan_groups": lambda: {"uuid": f"plg_{i:05d}", "name": f"Group {i}", "plans_count": 2},
+        "subscriptions": lambda: {"id": i, "uuid": f"sub_{i:05d}", "external_id": f"sub_ext_{i:05d}", "plan": "Gold",
+                                  "quantity": 1, "mrr": 5000, "arr": 60000, "status": "active",
+                                  "billing-cycle": "month", "billing-cycle-count": 1,
+                                  "start-date": START.isoformat() + "Z", "end-date": START.isoformat() + "Z",
+                                  "currency": "USD", "currency-sign": "$"},
+    }[kind]()
+
+
+# Collection path -> (record factory, JSON root key).
+COLLECTIONS = {
+    "/v1/customers": (_customer, "entries"),
+    "/v1/customers/search": (_customer, "entries"),
+    "/v1/invoices": (_invoice, "invoices"),
+    "/v1/activities": (_activity, "entries"),
+    "/v1/subscription_events": (_subscription_event, "subscription_events"),
+    "/v1/contacts": (lambda i: _record("contacts", i), "entries"),
+    "/v1/customer_notes": (lambda i: _record("customer_notes", i), "entries"),
+    "/v1/opportunities": (lambda i: _record("opportunities", i), "entries"),
+    "/v1/tasks": (lambda i: _record("tasks", i), "entries"),
+    "/v1/plans": (lambda i: _record("plans", i), "plans"),
+    "/v1/plan_groups": (lambda i: _record("plan_groups", i), "plan_groups"),
+}
+
+METRICS = ["mrr", "arr", "arpa", "asp", "customer-count", "customer-churn-rate", "mrr-churn-rate", "ltv"]
+# Fields of the all metrics entries that have a percentage change, and the main field of single metrics.
+METRICS_ALL = ["customers", "customer-churn-rate", "arr", "asp", "mrr", "arpa", "mrr-churn-rate", "ltv"]
+_PRIMARY = set(METRICS_ALL)
+
+
+def _period_end(day, interval):
+    # Like ChartMogul, entries are dated at the last day of their interval period.
+    if interval == "week":
+        return day + datetime.timedelta(days=6 - day.weekday())
+    months = {"month": 1, "quarter": 3, "year": 12}.get(interval)
+    if months is None:
+        return day
+    month = (day.month - 1) // months * months + months
+    if month == 12:
+        return datetime.date(day.year, 12, 31)
+    return datetime.date(day.year, month + 1, 1) - datetime.timedelta(days=1)
+
+
+def _metrics_entries(name, start, end, interval="day"):
+    day = datetime.date.fromisoformat(start)
+    end = datetime.date.fromisoformat(end)
+    entries = []
+    while day <= end:
+        # The last period is cut off at the end date; point values only depend on the entry date,
+        # while rates depend on the days of the period inside the range, like those of the real API.
+        date = min(_period_end(day, interval), end)
+        n = date.toordinal() % 1000
+        days = (date - day).days + 1
+        values = {
+            "mrr": 100000 + n, "arr": 1200000 + 12 * n, "arpa": 1000 + n % 50, "asp": 1500 + n % 70,
+            "customers": 100 + n % 30, "customer-churn-rate": round(0.1 * days, 2),
+            "mrr-churn-rate": round(0.05 * days, 2), "ltv": 50000.0 + n,
+        }
+        if name == "all":
+            entry = dict(values)
+        elif name == "mrr":
+            entry = {"mrr": values["mrr"], "mrr-new-business": 1000, "mrr-expansion": 500, "mrr-contraction": -100,
+                     "mrr-churn": -200, "mrr-reactivation": 0}
+        elif name == "customer-count":
+            entry = {"customers": values["customers"]}
+        else:
+            entry = {name: values[name]}
+        entry["date"] = date.isoformat()
+        entries.append(entry)
+        day = date + datetime.timedelta(days=1)
+    # Percentage changes are against the previous entry of the response, so the first one is 0.
+    for previous, entry in zip([None] + entries, entries):
+        for metric in (METRICS_ALL if name == "all" else [key for key in entry if key in _PRIMARY][:1]):
+            change = 0.0
+            if previous is not None and previous[metric]:
+                change = round((entry[metric] - previous[metric]) / previous[metric] * 100, 2)
+            entry[metric + "-percentage-change" if name == "all" else "percentage-change"] = change
+    return entries
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # Bursts of parallel requests each open a connection; the default backlog of 5 resets them.
+    request_queue_size = 128
+
+    def get_request(self):
+        request = super().get_request()
+        with self.lock:
+            self.connections += 1
+        return request
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, keep-alive connections stall on delayed ACKs.
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, headers=None):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}") if length else {}
+
+    def _handle(self):
+        fake = self.server.fake
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.last_request = (self.command, self.path, self.headers.get("Authorization"))
+            throttled = fake.rate_limit is not None and not fake._take_token()
+            if throttled:
+                self.server.throttled += 1
+        if throttled:
+            self._read_body()
+            return self._send(429, {"error": "Too Many Requests"}, {"Retry-After": "1"})
+        time.sleep(fake.latency)
+        url = urlparse(self.path)
+        path = url.path.rstrip("/")
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        if self.command != "GET":
+            body = self._read_body()
+            if path.endswith("/attributes/custom"):
+                body = {"custom": {item["key"]: item["value"] for item in body["custom"]}}
+            return self._send(200 if self.command != "POST" else 201, {"uuid": "new_00001", **body})
+        if path == "/v1/account":
+            return self._send(200, {"name": "Example", "currency": "USD", "time_zone": "UTC",
+                                    "week_start_on": "monday", "id": "acc_1"})
+        if path.startswith("/v1/data_sources"):
+            sources = [{"uuid": f"ds_{n}", "name": f"Source {n}", "system": "Stripe", "status": "idle",
+                        "created_at": START.isoformat() + "Z"} for n in range(fake.sources)]
+            if path == "/v1/data_sources":
+                return self._send(200, {"data_sources": sources})
+            return self._send(200, next(s for s in sources if path.endswith(s["uuid"])))
+        if path.startswith("/v1/metrics/"):
+            name = path[len("/v1/metrics/"):]
+            return self._send(200, {"entries": _metrics_entries(name, query["start-date"], query["end-date"],
+                                                                query.get("interval") or "day")})
+        parts = path.split("/")
+        if len(parts) == 5 and parts[2] == "customers" and parts[4] in ("subscriptions", "activities"):
+            kind = parts[4]
+            factory = (lambda i: _record("subscriptions", i)) if kind == "subscriptions" else _activity
+            return self._page(factory, "entries", query)
+        if len(parts) == 5 and parts[2] == "plan_groups" and parts[4] == "plans":
+            return self._page(lambda i: _record("plans", i), "plans", query)
+        if path == "/v1/activities":
+            return self._page(_activity, "entries", query, self._activity_indices(query))
+        if path in ("/v1/customers", "/v1/invoices") and query.get("data_source_uuid"):
+            # Record i belongs to data source ds_{i % 4}.
+            factory, root_key = COLLECTIONS[path]
+            indices = [i for i in range(fake.records) if f"ds_{i % 4}" == query["data_source_uuid"]]
+            return self._page(factory, root_key, query, indices)
+        if path in COLLECTIONS:
+            factory, root_key = COLLECTIONS[path]
+            return self._page(factory, root_key, query)
+        if len(parts) == 4 and "/".join(parts[:3]) in COLLECTIONS:
+            factory, _ = COLLECTIONS["/".join(parts[:3])]
+            record = factory(0)
+            record["uuid"] = parts[3]
+            return self._send(200, record)
+        if len(parts) == 5 and parts[2] == "customers" and parts[4] == "attributes":
+            return self._send(200, _customer(0)["attributes"])
+        return self._send(404, {"error": f"Unknown path {path}"})
+
+    def _activity_indices(self, query):
+        # Activity i happens i hours after START; both ends of the date range are inclusive, and an
+        # end date without a time includes that whole day.
+        def hours(key, default):
+            if not query.get(key):
+                return default
+            moment = datetime.datetime.fromisoformat(query[key].replace(" ", "T")).replace(tzinfo=None)
+            if key == "end-date" and len(query[key]) == 10:
+                moment += datetime.timedelta(days=1) - datetime.timedelta(microseconds=1)
+            return (moment - START) / datetime.timedelta(hours=1)
+
+        first, last = hours("start-date", 0), hours("end-date", self.server.fake.records)
+        indices = [i for i in range(self.server.fake.records) if first <= i <= last]
+        return indices[::-1] if query.get("order") == "-date" else indices
+
+    def _page(self, factory, root_key, query, indices=None):
+        fake = self.server.fake
+        indices = range(fake.records) if indices is None else indices
+        per_page = min(int(query.get("per_page", 200)), fake.max_per_page)
+        offset = int(query.get("cursor") or 0)
+        if fake.fail_at is not None and offset >= fake.fail_at:
+            return self._send(500, {"error": "Internal Server Error"})
+        end = min(offset + per_page, len(indices))
+        self._send(200, {
+            root_key: [factory(i) for i in indices[offset:end]],
+            "has_more": end < len(indices),
+            "cursor": str(end) if end < len(indices) else None,
+        })
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _handle
+
+
+class FakeChartMogul:
+    """
+    Serve the fake ChartMogul API on a local port until stopped.
+
+    Every paginated collection holds `records` entries and accepts up to
+    `max_per_page` entries per page. With `rate_limit`, requests beyond that
+    many per second are answered with 429 and a Retry-After of one second.
+    With a `certfile` (holding the certificate and its key), the API is served over HTTPS,
+    like the real one.
+    """
+
+    def __init__(self, latency=0.05, records=100, max_per_page=200, sources=4, rate_limit=None, certfile=None):
+        self.latency = latency
+        self.rate_limit = rate_limit
+        # Pages starting at or after this record offset fail with 500 while it is set.
+        self.fail_at = None
+        self._tokens = float(rate_limit or 0)
+        self._updated = time.monotonic()
+        self.sources = sources
+        self.records = records
+        self.max_per_page = max_per_page
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self.scheme = "http"
+        if certfile is not None:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(certfile)
+            self._server.socket = context.wrap_socket(self._server.socket, server_side=True)
+            self.scheme = "https"
+        self._server.fake = self
+        self._server.lock = threading.Lock()
+        self._server.connections = 0
+        self._server.requests = 0
+        self._server.throttled = 0
+        self._server.last_request = None
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def uri(self):
+        """The base URI to use as `chartmogul.Config.uri`."""
+        host, port = self._server.server_address
+        return f"{self.scheme}://{host}:{port}/v1"
+
+    @property
+    def connections(self):
+        return self._server.connections
+
+    @property
+    def requests(self):
+        return self._server.requests
+
+    @property
+    def throttled(self):
+        return self._server.throttled
+
+    @property
+    def last_request(self):
+        """Method, path with query string and Authorization header of the last request."""
+        return self._server.last_request
+
+    def reset_counters(self):
+        with self._server.lock:
+            self._server.connections = 0
+            self._server.requests = 0
+            self._server.throttled = 0
+
+    def _take_token(self):
+        # Requests per second beyond rate_limit get a 429, like the real API (called under the server lock).
+        now = time.monotonic()
+        self._tokens = min(float(self.rate_limit), self._tokens + (now - self._updated) * self.rate_limit)
+        self._updated = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
@@ -1,23 +1,214 @@
+import copy
 import datetime
-import chartmogul
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from chartmogul_mcp import utils
-from chartmogul_mcp.utils import LOGGER
+from chartmogul_mcp.cache import TTLCache
+from chartmogul_mcp.pagination import MAX_PER_PAGE, PageResult, Paginator, ShardedPaginator
+from chartmogul_mcp.ratelimit import RateLimiter
+from chartmogul_mcp.singleflight import SingleFlight
+from chartmogul_mcp.utils import LOGGER, LazyModule
 
+# Imported on first use, see LazyModule.
+chartmogul = LazyModule('chartmogul')
+serializers = LazyModule('chartmogul_mcp.serializers')
+
+_transport = None
+_transport_lock = threading.Lock()
+# Requests of the default account wait for a token here, throttled and failed ones are retried by it.
+# Accounts served with their own API key have their own limiter, see init_tenant_config.
+rate_limiter = RateLimiter(rate=utils.RATE_LIMIT, burst=utils.RATE_LIMIT_BURST, max_retries=utils.MAX_RETRIES)
+# Identical read calls running at the same time share one upstream request and its parsed result.
+in_flight = SingleFlight()
+
+
+def _plain_adapter(retries, backoff_factor):
+    # The SDK's adapter, without retrying on statuses or raising a RetryError once its retries are spent.
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    return HTTPAdapter(max_retries=Retry(total=retries, backoff_factor=backoff_factor, raise_on_status=False))
+
+
+@functools.lru_cache(maxsize=None)
+def _patch_sdk_retries():
+    # Even with max_retries=0, the adapter the SDK mounts on https:// raises a RetryError on a 429,
+    # without the response and so without its Retry-After header, instead of handing it over to
+    # rate_limiter. The SDK builds that adapter with a private function, replaced once here; if an
+    # SDK upgrade removes it, fail instead of silently losing Retry-After.
+    retry_request = chartmogul.retry_request
+    if not callable(getattr(retry_request, '_retry_adapter', None)):
+        raise RuntimeError("chartmogul.retry_request._retry_adapter is gone; check how this SDK version "
+                           "retries 429 responses before using it.")
+    retry_request._retry_adapter = _plain_adapter
+
+
+def init_chartmogul_config(token=None):
+    # Retries are left to rate_limiter, which sees every request, instead of the SDK's per-request retries.
+    _patch_sdk_retries()
+    return chartmogul.Config(token or utils.CHARTMOGUL_TOKEN, max_retries=0)
+
+
+def init_tenant_config(token):
+    """
+    Create the config of an account served with its own API key.
+
+    Each account gets its own rate limiter, with the same settings as rate_limiter, as
+    ChartMogul limits the requests of every account separately.
+
+    Returns: A chartmogul.Config with a `rate_limiter` attribute.
+    """
+    config = init_chartmogul_config(token)
+    config.rate_limiter = RateLimiter(rate=rate_limiter.rate, burst=rate_limiter.burst,
+                                      max_retries=rate_limiter.max_retries)
+    return config
+
+
+def forget_tenant(config):
+    """Drop the metrics cached for the account of a config."""
+    metrics_cache.discard(lambda key: key[:2] == (config.uri, config.auth))
+
+
+def get_transport():
+    """
+    Return the shared async transport, creating it on first use.
+
+    Returns: The transport, or None if neither CHARTMOGUL_ASYNC_TRANSPORT nor CHARTMOGUL_RAW_JSON is enabled.
+    """
+    global _transport
+    if not (utils.ASYNC_TRANSPORT or utils.RAW_JSON):
+        return None
+    with _transport_lock:
+        if _transport is None:
+            from chartmogul_mcp.transport import AsyncTransport
+            _transport = AsyncTransport(pool_size=utils.HTTP_POOL_SIZE,
+                                        per_host=utils.HTTP_POOL_PER_HOST,
+                                        keepalive_expiry=utils.HTTP_KEEPALIVE_EXPIRY)
+    return _transport
+
+
+def _request(config, resource, method, **kwargs):
+    """
+    Send a request to the ChartMogul API through the rate limiter of its account, retrying it when
+    throttled or failed.
+
+    Only reads (list, search, retrieve and metrics) are retried after server or network errors.
+
+    Returns: The SDK object for the response, or its JSON-ready equivalent in raw JSON mode.
+    """
+    idempotent = method in ('all', 'search', 'retrieve') or resource is chartmogul.Metrics
+    return limiter_of(config).call(lambda: _send(config, resource, method, **kwargs), idempotent)
+
+
+def limiter_of(config):
+    """The rate limiter the requests of a config go through: its account's own, or rate_limiter."""
+    return getattr(config, 'rate_limiter', rate_limiter)
+
+
+def _send(config, resource, method, **kwargs):
+    """
+    Send a request once, through the async transport if enabled, otherwise through the SDK.
+
+    In raw JSON mode, list and metrics requests skip the SDK objects and come back with their
+    entries already converted to the output of parse_object.
+
+    Returns: The SDK object for the response, or its JSON-ready equivalent in raw JSON mode.
+    """
+    transport = get_transport()
+    if transport is None:
+        return getattr(resource, method)(config, **kwargs).get()
+    if utils.RAW_JSON and (method in ('all', 'search') or resource is chartmogul.Metrics):
+        return transport.request_json(config, resource, method, **kwargs)
+    return transport.request(config, resource, method, **kwargs)
+
+
+def _coalesced(func):
+    # Calls are identical when they go to the same account with the same arguments. Each caller gets
+    # its own shallow copy of the shared result, so that adding to or dropping from it stays private;
+    # the records in it are shared.
+    @functools.wraps(func)
+    def wrapper(config, *args, **kwargs):
+        key = (func.__name__, config.uri, config.auth, repr(args), repr(sorted(kwargs.items())))
+        result = in_flight.do(key, func, config, *args, **kwargs)
+        if isinstance(result, PageResult):
+            return PageResult(result, result.requests, result.cursor, result.has_more, result.error)
+        return copy.copy(result) if isinstance(result, (dict, list)) else result
+    return wrapper
+
+
+def _for_each(name, uuids, call, on_progress=None):
+    """
+    Call `call(uuid)` for every distinct uuid, at most BATCH_PARALLELISM at a time.
+
+    A failing uuid does not fail the others. on_progress, if given, is called with the number
+    of finished and total uuids after each one.
+
+    Returns: A tuple of the results keyed by uuid and the error messages keyed by uuid, both in input order.
+    """
+    uuids = list(dict.fromkeys(uuids))
+    outcomes = {}
+    if uuids:
+        with ThreadPoolExecutor(max_workers=max(1, min(utils.BATCH_PARALLELISM, len(uuids))),
+                                thread_name_prefix="chartmogul-batch") as pool:
+            futures = {pool.submit(call, uuid): uuid for uuid in uuids}
+            for future in as_completed(futures):
+                uuid = futures[future]
+                try:
+                    outcomes[uuid] = (future.result(), None)
+                except Exception as e:
+                    LOGGER.error(f"Error for {name} {uuid}: {str(e)}", exc_info=True)
+                    outcomes[uuid] = (None, str(e))
+                if on_progress is not None:
+                    on_progress(len(outcomes), len(uuids))
+    results = {uuid: outcomes[uuid][0] for uuid in uuids if outcomes[uuid][1] is None}
+    errors = {uuid: outcomes[uuid][1] for uuid in uuids if outcomes[uuid][1] is not None}
+    return results, errors
+
+
+def _retrieve_many(config, resource, name, uuids, fields=None):
+    """
+    Retrieve several objects of one resource from ChartMogul API concurrently.
+
+    Returns: A dict with "results" (objects keyed by uuid) and "errors" (messages keyed by uuid).
+    """
+    LOGGER.info(f"Retrieving {len(uuids)} {name}.")
+    parse = _parser(fields)
+    results, errors = _for_each(name, uuids, lambda uuid: parse(
+        _request(config, resource, 'retrieve', uuid=uuid)))
+    return {"results": results, "errors": errors}
+
+
+def _per_source(config, make_shard, limit, fields=None):
+    """
+    Fan a listing out over the account's data sources, walking one listing per source concurrently.
+
+    make_shard(data_source_uuid, fields) returns the Paginator of one source; make_shard(None, fields)
+    that of the whole account, which is walked instead when the limit is below a full page per source.
+
+    Returns: A ShardedPaginator handing out the records source after source, in the order the API lists the sources.
+    """
+    def shards():
+        sources = [parse_object(source)['uuid']
+                   for source in _request(config, chartmogul.DataSource, 'all').data_sources]
+        if len(sources) < 2 or (limit is not None and limit < len(sources) * MAX_PER_PAGE):
+            return [make_shard(None, shard_fields)]
+        return [make_shard(uuid, shard_fields) for uuid in sources]
+    shard_fields, parse = _keyed(fields)
+    # Customers merged across data sources are listed under each of them, but handed out once.
+    return ShardedPaginator(shards, limit, key='uuid', parallelism=utils.BATCH_PARALLELISM, parse=parse)
 
-def init_chartmogul_config():
-    return chartmogul.Config(utils.CHARTMOGUL_TOKEN)
 
 ## Account Endpoint
 
+@_coalesced
 def retrieve_account(config):
     """
     Retrieve the account information.
 
     """
     LOGGER.info(f"Retrieve account information.")
-    request = chartmogul.Account.retrieve(config)
     try:
-        account = parse_object(request.get())
+        account = parse_object(_request(config, chartmogul.Account, 'retrieve'))
     except Exception as e:
         LOGGER.error(f"Error retrieving customer: {str(e)}", exc_info=True)
         return None
@@ -26,7 +217,8 @@ def retrieve_account(config):
 
 ## Data sources Endpoints
 
-def list_sources(config, name=None, system=None):
+@_coalesced
+def list_sources(config, name=None, system=None, fields=None):
     """
     List all data sources from ChartMogul API.
 
@@ -34,26 +226,26 @@ def list_sources(config, name=None, system=None):
     """
     LOGGER.info(f"List data sources {name}, {system}.")
     all_sources = []
-    request = chartmogul.DataSource.all(config, name=name, system=system)
     try:
-        sources = request.get()
-        all_sources.extend([parse_object(entry) for entry in sources.data_sources])
+        sources = _request(config, chartmogul.DataSource, 'all', name=name, system=system)
+        parse = _parser(fields)
+        all_sources.extend([parse(entry) for entry in sources.data_sources])
     except Exception as e:
         LOGGER.error(f"Error listing data sources: {str(e)}", exc_info=True)
         return None
     return all_sources
 
 
-def retrieve_source(config, data_source_uuid):
+@_coalesced
+def retrieve_source(config, data_source_uuid, fields=None):
     """
     Retrieve a data source from ChartMogul API.
 
     Returns: The data source.
     """
     LOGGER.info(f"Retrieve data source for {data_source_uuid}.")
-    request = chartmogul.DataSource.retrieve(config, uuid=data_source_uuid)
     try:
-        source = parse_object(request.get())
+        source = parse_object(_request(config, chartmogul.DataSource, 'retrieve', uuid=data_source_uuid), fields)
     except Exception as e:
         LOGGER.error(f"Error retrieving data source: {str(e)}", exc_info=True)
         return None
@@ -62,36 +254,46 @@ def retrieve_source(config, data_source_uuid):
 
 ## Customers Endpoints
 
-def list_customers(config, data_source_uuid=None, external_id=None, status=None, system=None, limit=20) -> list:
+@_coalesced
+def list_customers(config, data_source_uuid=None, external_id=None, status=None, system=None, limit=20,
+                   cursor=None, fan_out=None, fields=None) -> list:
     """
     List all customers from ChartMogul API.
         
     Returns: A list of ChartMogul customers.
     """
     LOGGER.info(f"List customers for {data_source_uuid}, {external_id}, {status}, {system}.")
-    all_customers = []
-    has_more = True
-    cursor = None
-    per_page = 20
-    total = 0
-    while has_more and total < limit:
-        request = chartmogul.Customer.all(config,
-                                          data_source_uuid=data_source_uuid,
-                                          external_id=external_id,
-                                          status=status,
-                                          system=system,
-                                          cursor=cursor,
-                                          per_page=per_page)
-        try:
-            customers = request.get()
-            all_customers.extend([parse_object(entry) for entry in customers.entries])
-            total += per_page
-            has_more = customers.has_more
-            cursor = customers.cursor
-        except Exception as e:
-            LOGGER.error(f"Error fetching ChartMogul customers: {str(e)}", exc_info=True)
-            return None
-    return all_customers
+    try:
+        records = iter_customers(config, data_source_uuid, external_id, status, system, limit, cursor,
+                                 fan_out, fields=fields).collect()
+    except Exception as e:
+        LOGGER.error(f"Error fetching ChartMogul customers: {str(e)}", exc_info=True)
+        return None
+    if records.error is not None:
+        LOGGER.error(f"Error fetching ChartMogul customers after {len(records)} records: {records.error}")
+    return records
+
+
+def iter_customers(config, data_source_uuid=None, external_id=None, status=None, system=None, limit=None,
+                   cursor=None, fan_out=None, fields=None):
+    """
+    Iterate over customers from ChartMogul API, fetching one page at a time.
+
+    Without a data_source_uuid, fan_out (SOURCE_FAN_OUT by default) walks the customers of
+    every data source concurrently.
+
+    Returns: An iterable of ChartMogul customers. API errors are raised instead of logged.
+    """
+    if (utils.SOURCE_FAN_OUT if fan_out is None else fan_out) and data_source_uuid is None and cursor is None:
+        return _per_source(config, lambda uuid, fields: iter_customers(config, uuid, external_id, status, system,
+                                                                       limit, fan_out=False, fields=fields),
+                           limit, fields)
+    return Paginator(functools.partial(_request, config, chartmogul.Customer, 'all',
+                                       data_source_uuid=data_source_uuid,
+                                       external_id=external_id,
+                                       status=status,
+                                       system=system),
+                     'entries', limit, parse=_parser(fields), prefetch=utils.PAGE_PREFETCH, cursor=cursor)
 
 
 def create_customer(config, data):
@@ -101,30 +303,88 @@ def create_customer(config, data):
     Returns:
     """
     LOGGER.info(f"Creating customer {data}.")
-    request = chartmogul.Customer.create(config, data=data)
     try:
-        customer = parse_object(request.get())
+        customer = parse_object(_request(config, chartmogul.Customer, 'create', data=data))
     except Exception as e:
         LOGGER.error(f"Error creating customer: {str(e)}", exc_info=True)
         return None
     return customer
 
-def retrieve_customer(config, uuid):
+@_coalesced
+def retrieve_customer(config, uuid, fields=None):
     """
     Retrieve a customer from ChartMogul API.
 
     Returns: The customer.
     """
     LOGGER.info(f"Retrieving customer for {uuid}.")
-    request = chartmogul.Customer.retrieve(config, uuid=uuid)
     try:
-        customer = parse_object(request.get())
+        customer = parse_object(_request(config, chartmogul.Customer, 'retrieve', uuid=uuid), fields)
     except Exception as e:
         LOGGER.error(f"Error retrieving customer: {str(e)}", exc_info=True)
         return None
     return customer
 
 
+def retrieve_customers(config, uuids, fields=None):
+    """
+    Retrieve several customers from ChartMogul API concurrently.
+
+    Returns: A dict with "results" (customers keyed by uuid) and "errors" (messages keyed by uuid).
+    """
+    return _retrieve_many(config, chartmogul.Customer, 'customers', uuids, fields)
+
+
+# Sections of retrieve_customer_360 and the number of records each includes by default.
+CUSTOMER_360_LIMITS = {"subscriptions": 20, "activities": 20, "notes": 10, "opportunities": 10, "tasks": 10}
+
+
+def retrieve_customer_360(config, uuid, limits=None):
+    """
+    Retrieve a customer together with its subscriptions, activities, notes, opportunities and
+    tasks, all fetched concurrently.
+
+    limits maps section names to the number of records to include, overriding CUSTOMER_360_LIMITS;
+    a section with a limit of 0 is left out. The customer's attributes are part of the customer.
+
+    Returns: A dict with the customer and, per section, its "records" and whether it "has_more", with
+    the "error" that ended it if a page failed part way. Sections that could not be fetched are None,
+    named in "failed" and have their message in "errors". None if the customer could not be retrieved.
+    """
+    unknown = set(limits or {}) - set(CUSTOMER_360_LIMITS)
+    if unknown:
+        LOGGER.error(f"Unknown customer 360 sections {sorted(unknown)}, expected some of {list(CUSTOMER_360_LIMITS)}.")
+        return None
+    limits = {**CUSTOMER_360_LIMITS, **(limits or {})}
+    LOGGER.info(f"Retrieving customer 360 for {uuid} with {limits}.")
+    # The iter functions raise API errors, so that each section's message reaches the result.
+    calls = {
+        "customer": lambda: retrieve_customer(config, uuid),
+        "subscriptions": lambda: iter_customer_subscriptions(config, uuid, limits["subscriptions"]).collect(),
+        "activities": lambda: iter_customer_activities(config, uuid, limits["activities"]).collect(),
+        "notes": lambda: iter_customer_notes(config, uuid, limit=limits["notes"]).collect(),
+        "opportunities": lambda: iter_opportunities(config, uuid, limit=limits["opportunities"]).collect(),
+        "tasks": lambda: iter_tasks(config, uuid, limit=limits["tasks"]).collect(),
+    }
+    sections = ["customer"] + [name for name, limit in limits.items() if limit > 0]
+    results, errors = _for_each("customer 360 section", sections, lambda name: calls[name]())
+    customer = results.get("customer")
+    if customer is None:
+        return None
+    combined = {"customer": customer, "failed": [], "errors": {}}
+    for name in sections[1:]:
+        records = results.get(name)
+        if records is None:
+            combined[name] = None
+            combined["failed"].append(name)
+            combined["errors"][name] = errors[name]
+        else:
+            combined[name] = {"records": list(records), "has_more": records.has_more or records.error is not None}
+            if records.error is not None:
+                combined[name]["error"] = records.error
+    return combined
+
+
 def update_customer(config, uuid, data):
     """
     Update a customer from ChartMogul API.
@@ -132,93 +392,99 @@ def update_customer(config, uuid, data):
     Returns:
     """
     LOGGER.info(f"Updating customer {uuid}, {data}.")
-    request = chartmogul.Customer.modify(config, uuid=uuid, data=data)
     try:
-        customer = parse_object(request.get())
+        customer = parse_object(_request(config, chartmogul.Customer, 'modify', uuid=uuid, data=data))
     except Exception as e:
         LOGGER.error(f"Error updating customer: {str(e)}", exc_info=True)
         return None
     return customer
 
 
-def search_customers(config, email, limit=20) -> list:
+@_coalesced
+def search_customers(config, email, limit=20, cursor=None, fields=None) -> list:
     """
     Search all customers by email from ChartMogul API.
 
     Returns: A list of ChartMogul customers.
     """
     LOGGER.info(f"Search customers for {email}.")
-    all_customers = []
-    has_more = True
-    cursor = None
-    per_page = 20
-    total = 0
-    while has_more and total < limit:
-        request = chartmogul.Customer.search(config, email=email, cursor=cursor, per_page=per_page)
-        try:
-            customers = request.get()
-            all_customers.extend([parse_object(entry) for entry in customers.entries])
-            total += per_page
-            has_more = customers.has_more
-            cursor = customers.cursor
-        except Exception as e:
-            LOGGER.error(f"Error searching ChartMogul customers: {str(e)}", exc_info=True)
-            return None
-    return all_customers
-
-
-def list_customer_subscriptions(config, uuid=None, limit=20) -> list:
+    try:
+        records = iter_search_customers(config, email, limit, cursor, fields=fields).collect()
+    except Exception as e:
+        LOGGER.error(f"Error searching ChartMogul customers: {str(e)}", exc_info=True)
+        return None
+    if records.error is not None:
+        LOGGER.error(f"Error searching ChartMogul customers after {len(records)} records: {records.error}")
+    return records
+
+
+def iter_search_customers(config, email, limit=None, cursor=None, fields=None):
+    """
+    Iterate over customers matching an email from ChartMogul API, fetching one page at a time.
+
+    Returns: An iterable of ChartMogul customers. API errors are raised instead of logged.
+    """
+    return Paginator(functools.partial(_request, config, chartmogul.Customer, 'search', email=email),
+                     'entries', limit, parse=_parser(fields), prefetch=utils.PAGE_PREFETCH, cursor=cursor)
+
+
+@_coalesced
+def list_customer_subscriptions(config, uuid=None, limit=20, cursor=None, fields=None) -> list:
     """
     List all subscriptions of a customer from ChartMogul API.
 
     Returns: A list of ChartMogul subscriptions.
     """
     LOGGER.info(f"List subscriptions for {uuid}.")
-    all_subscriptions = []
-    has_more = True
-    cursor = None
-    per_page = 20
-    total = 0
-    while has_more and total < limit:
-        request = chartmogul.CustomerSubscription.all(config, uuid=uuid, cursor=cursor, per_page=per_page)
-        try:
-            subscriptions = request.get()
-            all_subscriptions.extend([parse_object(entry) for entry in subscriptions.entries])
-            total += per_page
-            has_more = subscriptions.has_more
-            cursor = subscriptions.cursor
-        except Exception as e:
-            LOGGER.error(f"Error fetching ChartMogul subscriptions: {str(e)}", exc_info=True)
-            return None
-    return all_subscriptions
-
-
-def list_customer_activities(config, uuid=None, limit=20) -> list:
+    try:
+        records = iter_customer_subscriptions(config, uuid, limit, cursor, fields=fields).collect()
+    except Exception as e:
+        LOGGER.error(f"Error fetching ChartMogul subscriptions: {str(e)}", exc_info=True)
+        return None
+    if records.error is not None:
+        LOGGER.error(f"Error fetching ChartMogul subscriptions after {len(records)} records: {records.error}")
+    return records
+
+
+def iter_customer_subscriptions(config, uuid=None, limit=None, cursor=None, fields=None):
+    """
+    Iterate over subscriptions from ChartMogul API, fetching one page at a time.
+
+    Returns: An iterable of ChartMogul subscriptions. API errors are raised instead of logged.
+    """
+    return Paginator(functools.partial(_request, config, chartmogul.CustomerSubscription, 'all', uuid=uuid),
+                     'entries', limit, parse=_parser(fields), prefetch=utils.PAGE_PREFETCH, cursor=cursor)
+
+
+@_coalesced
+def list_customer_activities(config, uuid=None, limit=20, cursor=None, fields=None) -> list:
     """
     List all activities of a customer from ChartMogul API.
 
     Returns: A list of ChartMogul activities.
     """
     LOGGER.info(f"List activities for {uuid}.")
-    all_activities = []
-    has_more = True
-    cursor = None
-    per_page = 20
-    total = 0
-    while has_more and total < limit:
-        request = chartmogul.CustomerActivity.all(config, uuid=uuid, cursor=cursor, per_page=per_page)
-        try:
-            activities = request.get()
-            all_activities.extend([parse_object(entry) for entry in activities.entries])
-            total += per_page
-            has_more = activities.has_more
-            cursor = activities.cursor
-        except Exception as e:
-            LOGGER.error(f"Error fetching ChartMogul activities: {str(e)}", exc_info=True)
-            return None
-    return all_activities
+    try:
+        records = iter_customer_activities(config, uuid, limit, cursor, fields=fields).collect()
+    except Exception as e:
+        LOGGER.error(f"Error fetching ChartMogul activities: {str(e)}", exc_info=True)
+        return None
+    if records.error is not None:
+        LOGGER.error(f"Error fetching ChartMogul activities after {len(records)} records: {records.error}")
+    return records
+
+
+def iter_customer_activities(config, uuid=None, limit=None, cursor=None, fields=None):
+    """
+    Iterate over activities from ChartMogul API, fetching one page at a time.
+
+    Returns: An iterable of ChartMogul activities. API errors are raised instead of logged.
+    """
+    return Paginator(functools.partial(_request, config, chartmogul.CustomerActivity, 'all', uuid=uuid),
+                     'entries', limit, parse=_parser(fields), prefetch=utils.PAGE_PREFETCH, cursor=cursor)
 
 
+@_coalesced
 def list_customer_attributes(config, uuid) -> list:
     """
     List all attributes of a customer from ChartMogul API.
@@ -226,9 +492,8 @@ def list_customer_attributes(config, uuid) -> list:
     Returns: A list of ChartMogul attributes.
     """
     LOGGER.info(f"List attributes for {uuid}.")
-    request = chartmogul.Attributes.retrieve(config, uuid=uuid)
     try:
-        attributes = parse_object(request.get())
+        attributes = parse_object(_request(config, chartmogul.Attributes, 'retrieve', uuid=uuid))
     except Exception as e:
         LOGGER.error(f"Error fetching attributes: {str(e)}", exc_info=True)
         return None
@@ -242,9 +507,8 @@ def add_customer_tags(config, uuid, data) -> list:
     Returns: A list of ChartMogul tags added.
     """
     LOGGER.info(f"Add tags for {uuid}, {data}.")
-    request = chartmogul.Tags.add(config, uuid=uuid, data={"tags": data})
     try:
-        tags = parse_object(request.get())
+        tags = parse_object(_request(config, chartmogul.Tags, 'add', uuid=uuid, data={"tags": data}))
     except Exception as e:
         LOGGER.error(f"Error adding tags: {str(e)}", exc_info=True)
         return None
@@ -258,63 +522,125 @@ def add_customer_custom_attributes(config, uuid, data) -> list:
     Returns: A list of ChartMogul custom attributes added.
     """
     LOGGER.info(f"Add custom attributes for {uuid}, {data}.")
-    request = chartmogul.CustomAttributes.add(config, uuid=uuid, data={"custom": data})
     try:
-        custom_attributes = parse_object(request.get())
+        custom_attributes = parse_object(_request(config, chartmogul.CustomAttributes, 'add',
+                                        uuid=uuid, data={"custom": data}))
     except Exception as e:
         LOGGER.error(f"Error adding custom attributes: {str(e)}", exc_info=True)
         return None
     return custom_attributes
 
 
+def _bulk_customer_update(config, name, uuids, filters, limit, call, on_progress):
+    """
+    Apply `call(uuid)` concurrently to the given customers, or to the customers matching filters.
+
+    Returns: A dict with the number of customers, the uuids that succeeded and the errors of those that failed.
+    """
+    try:
+        if uuids is None:
+            if all(value is None for value in filters.values()):
+                raise ValueError("Either uuids or at least one customer filter is required.")
+            uuids = [customer['uuid'] for customer in iter_customers(config, limit=limit, **filters)]
+    except Exception as e:
+        LOGGER.error(f"Error selecting customers to {name}: {str(e)}", exc_info=True)
+        return None
+    LOGGER.info(f"Bulk {name} for {len(uuids)} customers.")
+    results, errors = _for_each(name, uuids, call, on_progress)
+    return {"total": len(results) + len(errors), "succeeded": list(results), "failed": errors}
+
+
+def bulk_add_customer_tags(config, data, uuids=None, data_source_uuid=None, status=None, system=None,
+                           limit=1000, on_progress=None) -> dict:
+    """
+    Add tags to many customers using ChartMogul API, concurrently.
+
+    The customers are the given uuids, or at most `limit` customers selected like list_customers.
+    on_progress, if given, is called with the number of finished and total customers.
+
+    Returns: A dict with the "total" of customers, the uuids that "succeeded" and the errors of those that "failed".
+    """
+    filters = {"data_source_uuid": data_source_uuid, "status": status, "system": system}
+    return _bulk_customer_update(config, 'add tags', uuids, filters, limit,
+                                 lambda uuid: _request(config, chartmogul.Tags, 'add',
+                                                       uuid=uuid, data={"tags": data}),
+                                 on_progress)
+
+
+def bulk_add_customer_custom_attributes(config, data, uuids=None, data_source_uuid=None, status=None,
+                                        system=None, limit=1000, on_progress=None) -> dict:
+    """
+    Add custom attributes to many customers using ChartMogul API, concurrently.
+
+    The customers are the given uuids, or at most `limit` customers selected like list_customers.
+    on_progress, if given, is called with the number of finished and total customers.
+
+    Returns: A dict with the "total" of customers, the uuids that "succeeded" and the errors of those that "failed".
+    """
+    filters = {"data_source_uuid": data_source_uuid, "status": status, "system": system}
+    return _bulk_customer_update(config, 'add custom attributes', uuids, filters, limit,
+                                 lambda uuid: _request(config, chartmogul.CustomAttributes, 'add',
+                                                       uuid=uuid, data={"custom": data}),
+                                 on_progress)
+
+
 ## Contacts Endpoints
 
-def list_contacts(config, email=None, customer_external_id=None, limit=20) -> list:
+@_coalesced
+def list_contacts(config, email=None, customer_external_id=None, limit=20, cursor=None, fields=None) -> list:
     """
     List all contacts from ChartMogul API.
 
     Returns: A list of ChartMogul contacts.
     """
     LOGGER.info(f"List contacts for {email}, {customer_external_id}.")
-    all_contacts = []
-    has_more = True
-    cursor = None
-    per_page = 20
-    total = 0
-    while has_more and total < limit:
-        request = chartmogul.Contact.all(config,
-                                         email=email,
-                                         customer_external_id=customer_external_id,
-                                         cursor=cursor,
-                                         per_page=per_page)
-        try:
-            contacts = request.get()
-            all_contacts.extend([parse_object(entry) for entry in contacts.entries])
-            total += per_page
-            has_more = contacts.has_more
-            cursor = contacts.cursor
-        except Exception as e:
-            LOGGER.error(f"Error fetching ChartMogul contacts: {str(e)}", exc_info=True)
-            return None
-    return all_contacts
-
-
-def retrieve_contact(config, uuid):
+    try:
+        records = iter_contacts(config, email, customer_external_id, limit, cursor, fields=fields).collect()
+    except Exception as e:
+        LOGGER.error(f"Error fetching ChartMogul contacts: {str(e)}", exc_info=True)
+        return None
+    if records.error is not None:
+        LOGGER.error(f"Error fetching ChartMogul contacts after {len(records)} records: {records.error}")
+    return records
+
+
+def iter_contacts(config, email=None, customer_external_id=None, limit=None, cursor=None, fields=None):
+    """
+    Iterate over contacts from ChartMogul API, fetching one page at a time.
+
+    Returns: An iterable of ChartMogul contacts. API errors are raised instead of logged.
+    """
+    return Paginator(functools.partial(_request, config, chartmogul.Contact, 'all',
+                                       email=email,
+                                       customer_external_id=customer_external_id),
+                     'entries', limit, parse=_parser(fields), prefetch=utils.PAGE_PREFETCH, cursor=cursor)
+
+
+@_coalesced
+def retrieve_contact(config, uuid, fields=None):
     """
     Retrieve a contact from ChartMogul API.
 
     Returns: The contact.
     """
     LOGGER.info(f"Retrieving contact for {uuid}.")
-    request = chartmogul.Contact.retrieve(config, uuid=uuid)
     try:
-        contact = parse_object(request.get())
+        contact = parse_object(_request(config, chartmogul.Contact, 'retrieve', uuid=uuid), fields)
     except Exception as e:
         LOGGER.error(f"Error retrieving contact: {str(e)}", exc_info=True)
         return None
     return contact
 
 
+def retrieve_contacts(config, uuids, fields=None):
+    """
+    Retrieve several contacts from ChartMogul API concurrently.
+
+    Returns: A dict with "results" (contacts keyed by uuid) and "errors" (messages keyed by uuid).
+    """
+    return _retrieve_many(config, chartmogul.Contact, 'contacts', uuids, fields)
+
+
 def create_contact(config, data):
     """
     Create a contact from ChartMogul API.
@@ -322,9 +648,8 @@ def create_contact(config, data):
     Returns:
     """
     LOGGER.info(f"Creating contact {data}.")
-    request = chartmogul.Contact.create(config, data=data)
     try:
-        contact = parse_object(request.get())
+        contact = parse_object(_request(config, chartmogul.Contact, 'create', data=data))
     except Exception as e:
         LOGGER.error(f"Error creating contact: {str(e)}", exc_info=True)
         return None
@@ -338,9 +663,8 @@ def update_contact(config, uuid, data):
     Returns:
     """
     LOGGER.info(f"Updating contact {uuid}, {data}.")
-    request = chartmogul.Contact.modify(config, uuid=uuid, data=data)
     try:
-        contact = parse_object(request.get())
+        contact = parse_object(_request(config, chartmogul.Contact, 'modify', uuid=uuid, data=data))
     except Exception as e:
         LOGGER.error(f"Error updating contact: {str(e)}", exc_info=True)
         return None
@@ -349,47 +673,50 @@ def update_contact(config, uuid, data):
 
 ## Notes and call logs Endpoints
 
-def list_customer_notes(config, customer_uuid=None, type=None, author_email=None, limit=20) -> list:
+@_coalesced
+def list_customer_notes(config, customer_uuid=None, type=None, author_email=None, limit=20, cursor=None,
+                        fields=None) -> list:
     """
     List all customer_notes from ChartMogul API.
 
     Returns: A list of ChartMogul customer_notes.
     """
     LOGGER.info(f"List customer_notes for {customer_uuid}, {type}, {author_email}.")
-    all_customer_notes = []
-    has_more = True
-    cursor = None
-    per_page = 20
-    total = 0
-    while has_more and total < limit:
-        request = chartmogul.CustomerNote.all(config,
-                                              customer_uuid=customer_uuid,
-                                              author_email=author_email,
-                                              type=type,
-                                              cursor=cursor,
-                                              per_page=per_page)
-        try:
-            customer_notes = request.get()
-            all_customer_notes.extend([parse_object(entry) for entry in customer_notes.entries])
-            total += per_page
-            has_more = customer_notes.has_more
-            cursor = customer_notes.cursor
-        except Exception as e:
-            LOGGER.error(f"Error fetching ChartMogul customer_notes: {str(e)}", exc_info=True)
-            return None
-    return all_customer_notes
-
-
-def retrieve_customer_note(config, uuid):
+    try:
+        records = iter_customer_notes(config, customer_uuid, type, author_email, limit, cursor,
+                                      fields=fields).collect()
+    except Exception as e:
+        LOGGER.error(f"Error fetching ChartMogul customer_notes: {str(e)}", exc_info=True)
+        return None
+    if records.error is not None:
+        LOGGER.error(f"Error fetching ChartMogul customer_notes after {len(records)} records: {records.error}")
+    return records
+
+
+def iter_customer_notes(config, customer_uuid=None, type=None, author_email=None, limit=None, cursor=None,
+                        fields=None):
+    """
+    Iterate over customer notes from ChartMogul API, fetching one page at a time.
+
+    Returns: An iterable of ChartMogul customer_notes. API errors are raised instead of logged.
+    """
+    return Paginator(functools.partial(_request, config, chartmogul.CustomerNote, 'all',
+                                       customer_uuid=customer_uuid,
+                                       author_email=author_email,
+                                       type=type),
+                     'entries', limit, parse=_parser(fields), prefetch=utils.PAGE_PREFETCH, cursor=cursor)
+
+
+@_coalesced
+def retrieve_customer_note(config, uuid, fields=None):
     """
     Retrieve a customer_note from ChartMogul API.
 
     Returns: The customer_note.
     """
     LOGGER.info(f"Retrieving customer_note for {uuid}.")
-    request = chartmogul.CustomerNote.retrieve(config, uuid=uuid)
     try:
-        customer_note = parse_object(request.get())
+        customer_note = parse_object(_request(config, chartmogul.CustomerNote, 'retrieve', uuid=uuid), fields)
     except Exception as e:
         LOGGER.error(f"Error retrieving customer_note: {str(e)}", exc_info=True)
         return None
@@ -403,9 +730,8 @@ def create_customer_note(config, data):
     Returns:
     """
     LOGGER.info(f"Creating contact {data}.")
-    request = chartmogul.CustomerNote.create(config, data=data)
     try:
-        customer_note = parse_object(request.get())
+        customer_note = parse_object(_request(config, chartmogul.CustomerNote, 'create', data=data))
     except Exception as e:
         LOGGER.error(f"Error creating contact: {str(e)}", exc_info=True)
         return None
@@ -419,9 +745,8 @@ def update_customer_note(config, uuid, data):
     Returns:
     """
     LOGGER.info(f"Updating customer_note {uuid}, {data}.")
-    request = chartmogul.CustomerNote.patch(config, uuid=uuid, data=data)
     try:
-        customer_note = parse_object(request.get())
+        customer_note = parse_object(_request(config, chartmogul.CustomerNote, 'patch', uuid=uuid, data=data))
     except Exception as e:
         LOGGER.error(f"Error updating customer_note: {str(e)}", exc_info=True)
         return None
@@ -430,9 +755,10 @@ def update_customer_note(config, uuid, data):
 
 ## Opportunities Endpoints
 
+@_coalesced
 def list_opportunities(config, customer_uuid=None, owner=None, pipeline=None, pipeline_stage=None,
                        estimated_close_date_on_or_after=None, estimated_close_date_on_or_before=None,
-                       limit=20) -> list:
+                       limit=20, cursor=None, fields=None) -> list:
     """
     List all opportunities from ChartMogul API.
 
@@ -440,49 +766,61 @@ def list_opportunities(config, customer_uuid=None, owner=None, pipeline=None, pi
     """
     LOGGER.info(f"List opportunities for {customer_uuid}, {owner}, {pipeline}, {pipeline_stage}, "
           f"{estimated_close_date_on_or_after}, {estimated_close_date_on_or_before}.")
-    all_opportunities = []
-    has_more = True
-    cursor = None
-    per_page = 20
-    total = 0
-    while has_more and total < limit:
-        request = chartmogul.Opportunity.all(config,
-                                             customer_uuid=customer_uuid,
-                                             owner=owner,
-                                             pipeline=pipeline,
-                                             pipeline_stage=pipeline_stage,
-                                             estimated_close_date_on_or_after=estimated_close_date_on_or_after,
-                                             estimated_close_date_on_or_before=estimated_close_date_on_or_before,
-                                             cursor=cursor,
-                                             per_page=per_page)
-        try:
-            opportunities = request.get()
-            all_opportunities.extend([parse_object(entry) for entry in opportunities.entries])
-            total += per_page
-            has_more = opportunities.has_more
-            cursor = opportunities.cursor
-        except Exception as e:
-            LOGGER.error(f"Error fetching ChartMogul opportunities: {str(e)}", exc_info=True)
-            return None
-    return all_opportunities
-
-
-def retrieve_opportunity(config, uuid):
+    try:
+        records = iter_opportunities(config, customer_uuid, owner, pipeline, pipeline_stage,
+                                  estimated_close_date_on_or_after, estimated_close_date_on_or_before,
+                                  limit, cursor, fields=fields).collect()
+    except Exception as e:
+        LOGGER.error(f"Error fetching ChartMogul opportunities: {str(e)}", exc_info=True)
+        return None
+    if records.error is not None:
+        LOGGER.error(f"Error fetching ChartMogul opportunities after {len(records)} records: {records.error}")
+    return records
+
+
+def iter_opportunities(config, customer_uuid=None, owner=None, pipeline=None, pipeline_stage=None,
+                       estimated_close_date_on_or_after=None, estimated_close_date_on_or_before=None,
+                       limit=None, cursor=None, fields=None):
+    """
+    Iterate over opportunities from ChartMogul API, fetching one page at a time.
+
+    Returns: An iterable of ChartMogul opportunities. API errors are raised instead of logged.
+    """
+    return Paginator(functools.partial(_request, config, chartmogul.Opportunity, 'all',
+                                       customer_uuid=customer_uuid,
+                                       owner=owner,
+                                       pipeline=pipeline,
+                                       pipeline_stage=pipeline_stage,
+                                       estimated_close_date_on_or_after=estimated_close_date_on_or_after,
+                                       estimated_close_date_on_or_before=estimated_close_date_on_or_before),
+                     'entries', limit, parse=_parser(fields), prefetch=utils.PAGE_PREFETCH, cursor=cursor)
+
+
+@_coalesced
+def retrieve_opportunity(config, uuid, fields=None):
     """
     Retrieve a opportunity from ChartMogul API.
 
     Returns: The opportunity.
     """
     LOGGER.info(f"Retrieving opportunity for {uuid}.")
-    request = chartmogul.Opportunity.retrieve(config, uuid=uuid)
     try:
-        opportunity = parse_object(request.get())
+        opportunity = parse_object(_request(config, chartmogul.Opportunity, 'retrieve', uuid=uuid), fields)
     except Exception as e:
         LOGGER.error(f"Error retrieving opportunity: {str(e)}", exc_info=True)
         return None
     return opportunity
 
 
+def retrieve_opportunities(config, uuids, fields=None):
+    """
+    Retrieve several opportunities from ChartMogul API concurrently.
+
+    Returns: A dict with "results" (opportunities keyed by uuid) and "errors" (messages keyed by uuid).
+    """
+    return _retrieve_many(config, chartmogul.Opportunity, 'opportunities', uuids, fields)
+
+
 def create_opportunity(config, data):
     """
     Create a opportunity from ChartMogul API.
@@ -490,9 +828,8 @@ def create_opportunity(config, data):
     Returns:
     """
     LOGGER.info(f"Creating opportunity {data}.")
-    request = chartmogul.Opportunity.create(config, data=data)
     try:
-        opportunity = parse_object(request.get())
+        opportunity = parse_object(_request(config, chartmogul.Opportunity, 'create', data=data))
     except Exception as e:
         LOGGER.error(f"Error creating opportunity: {str(e)}", exc_info=True)
         return None
@@ -506,9 +843,8 @@ def update_opportunity(config, uuid, data):
     Returns:
     """
     LOGGER.info(f"Updating opportunity {uuid}, {data}.")
-    request = chartmogul.Opportunity.patch(config, uuid=uuid, data=data)
     try:
-        opportunity = parse_object(request.get())
+        opportunity = parse_object(_request(config, chartmogul.Opportunity, 'patch', uuid=uuid, data=data))
     except Exception as e:
         LOGGER.error(f"Error updating opportunity: {str(e)}", exc_info=True)
         return None
@@ -517,53 +853,63 @@ def update_opportunity(config, uuid, data):
 
 ## Plans Endpoints
 
-def list_plans(config, data_source_uuid=None, external_id=None, system=None, limit=20) -> list:
+@_coalesced
+def list_plans(config, data_source_uuid=None, external_id=None, system=None, limit=20, cursor=None,
+               fields=None) -> list:
     """
     List all plans from ChartMogul API.
 
     Returns: A list of ChartMogul plans.
     """
     LOGGER.info(f"List plans for {data_source_uuid}, {external_id}, {system}.")
-    all_plans = []
-    has_more = True
-    cursor = None
-    per_page = 20
-    total = 0
-    while has_more and total < limit:
-        request = chartmogul.Plan.all(config,
-                                      data_source_uuid=data_source_uuid,
-                                      external_id=external_id,
-                                      system=system,
-                                      cursor=cursor,
-                                      per_page=per_page)
-        try:
-            plans = request.get()
-            all_plans.extend([parse_object(entry) for entry in plans.plans])
-            total += per_page
-            has_more = plans.has_more
-            cursor = plans.cursor
-        except Exception as e:
-            LOGGER.error(f"Error fetching ChartMogul plans: {str(e)}", exc_info=True)
-            return None
-    return all_plans
-
-
-def retrieve_plan(config, uuid):
+    try:
+        records = iter_plans(config, data_source_uuid, external_id, system, limit, cursor, fields=fields).collect()
+    except Exception as e:
+        LOGGER.error(f"Error fetching ChartMogul plans: {str(e)}", exc_info=True)
+        return None
+    if records.error is not None:
+        LOGGER.error(f"Error fetching ChartMogul plans after {len(records)} records: {records.error}")
+    return records
+
+
+def iter_plans(config, data_source_uuid=None, external_id=None, system=None, limit=None, cursor=None, fields=None):
+    """
+    Iterate over plans from ChartMogul API, fetching one page at a time.
+
+    Returns: An iterable of ChartMogul plans. API errors are raised instead of logged.
+    """
+    return Paginator(functools.partial(_request, config, chartmogul.Plan, 'all',
+                                       data_source_uuid=data_source_uuid,
+                                       external_id=external_id,
+                                       system=system),
+                     'plans', limit, parse=_parser(fields), prefetch=utils.PAGE_PREFETCH, cursor=cursor)
+
+
+@_coalesced
+def retrieve_plan(config, uuid, fields=None):
     """
     Retrieve a plan from ChartMogul API.
 
     Returns: The plan.
     """
     LOGGER.info(f"Retrieving plan for {uuid}.")
-    request = chartmogul.Plan.retrieve(config, uuid=uuid)
     try:
-        plan = parse_object(request.get())
+        plan = parse_object(_request(config, chartmogul.Plan, 'retrieve', uuid=uuid), fields)
     except Exception as e:
         LOGGER.error(f"Error retrieving plan: {str(e)}", exc_info=True)
         return None
     return plan
 
 
+def retrieve_plans(config, uuids, fields=None):
+    """
+    Retrieve several plans from ChartMogul API concurrently.
+
+    Returns: A dict with "results" (plans keyed by uuid) and "errors" (messages keyed by uuid).
+    """
+    return _retrieve_many(config, chartmogul.Plan, 'plans', uuids, fields)
+
+
 def create_plan(config, data):
     """
     Create a plan from ChartMogul API.
@@ -571,9 +917,8 @@ def create_plan(config, data):
     Returns:
     """
     LOGGER.info(f"Creating plan {data}.")
-    request = chartmogul.Plan.create(config, data=data)
     try:
-        plan = parse_object(request.get())
+        plan = parse_object(_request(config, chartmogul.Plan, 'create', data=data))
     except Exception as e:
         LOGGER.error(f"Error creating plan: {str(e)}", exc_info=True)
         return None
@@ -587,9 +932,8 @@ def update_plan(config, uuid, data):
     Returns:
     """
     LOGGER.info(f"Updating plan {uuid}, {data}.")
-    request = chartmogul.Plan.modify(config, uuid=uuid, data=data)
     try:
-        plan = parse_object(request.get())
+        plan = parse_object(_request(config, chartmogul.Plan, 'modify', uuid=uuid, data=data))
     except Exception as e:
         LOGGER.error(f"Error updating plan: {str(e)}", exc_info=True)
         return None
@@ -598,68 +942,72 @@ def update_plan(config, uuid, data):
 
 ## Plan groups Endpoints
 
-def list_plan_groups(config, limit=20) -> list:
+@_coalesced
+def list_plan_groups(config, limit=20, cursor=None, fields=None) -> list:
     """
     List all plan groups from ChartMogul API.
 
     Returns: A list of ChartMogul plan groups.
     """
     LOGGER.info(f"List plan groups.")
-    all_plan_groups = []
-    has_more = True
-    cursor = None
-    per_page = 20
-    total = 0
-    while has_more and total < limit:
-        request = chartmogul.PlanGroup.all(config, cursor=cursor, per_page=per_page)
-        try:
-            plan_groups = request.get()
-            all_plan_groups.extend([parse_object(entry) for entry in plan_groups.plan_groups])
-            total += per_page
-            has_more = plan_groups.has_more
-            cursor = plan_groups.cursor
-        except Exception as e:
-            LOGGER.error(f"Error fetching ChartMogul plan groups: {str(e)}", exc_info=True)
-            return None
-    return all_plan_groups
-
-
-def list_plan_group_plans(config, uuid, limit=20) -> list:
+    try:
+        records = iter_plan_groups(config, limit, cursor, fields=fields).collect()
+    except Exception as e:
+        LOGGER.error(f"Error fetching ChartMogul plan groups: {str(e)}", exc_info=True)
+        return None
+    if records.error is not None:
+        LOGGER.error(f"Error fetching ChartMogul plan groups after {len(records)} records: {records.error}")
+    return records
+
+
+def iter_plan_groups(config, limit=None, cursor=None, fields=None):
+    """
+    Iterate over plan groups from ChartMogul API, fetching one page at a time.
+
+    Returns: An iterable of ChartMogul plan groups. API errors are raised instead of logged.
+    """
+    return Paginator(functools.partial(_request, config, chartmogul.PlanGroup, 'all'),
+                     'plan_groups', limit, parse=_parser(fields), prefetch=utils.PAGE_PREFETCH, cursor=cursor)
+
+
+@_coalesced
+def list_plan_group_plans(config, uuid, limit=20, cursor=None, fields=None) -> list:
     """
     List all plans of a plan group from ChartMogul API.
 
     Returns: A list of ChartMogul plans of a plan group.
     """
     LOGGER.info(f"List plans of a plan group {uuid}.")
-    all_plans = []
-    has_more = True
-    cursor = None
-    per_page = 20
-    total = 0
-    while has_more and total < limit:
-        request = chartmogul.PlanGroup.all(config, uuid=uuid, cursor=cursor, per_page=per_page)
-        try:
-            plans = request.get()
-            all_plans.extend([parse_object(entry) for entry in plans.plans])
-            total += per_page
-            has_more = plans.has_more
-            cursor = plans.cursor
-        except Exception as e:
-            LOGGER.error(f"Error fetching ChartMogul plans: {str(e)}", exc_info=True)
-            return None
-    return all_plans
-
-
-def retrieve_plan_group(config, uuid):
+    try:
+        records = iter_plan_group_plans(config, uuid, limit, cursor, fields=fields).collect()
+    except Exception as e:
+        LOGGER.error(f"Error fetching ChartMogul plans: {str(e)}", exc_info=True)
+        return None
+    if records.error is not None:
+        LOGGER.error(f"Error fetching ChartMogul plans after {len(records)} records: {records.error}")
+    return records
+
+
+def iter_plan_group_plans(config, uuid, limit=None, cursor=None, fields=None):
+    """
+    Iterate over plans of a plan group from ChartMogul API, fetching one page at a time.
+
+    Returns: An iterable of ChartMogul plans of a plan group. API errors are raised instead of logged.
+    """
+    return Paginator(functools.partial(_request, config, chartmogul.PlanGroup, 'all', uuid=uuid),
+                     'plans', limit, parse=_parser(fields), prefetch=utils.PAGE_PREFETCH, cursor=cursor)
+
+
+@_coalesced
+def retrieve_plan_group(config, uuid, fields=None):
     """
     Retrieve a plan group from ChartMogul API.
 
     Returns: The plan.
     """
     LOGGER.info(f"Retrieving plan group for {uuid}.")
-    request = chartmogul.PlanGroup.retrieve(config, uuid=uuid)
     try:
-        plan_group = parse_object(request.get())
+        plan_group = parse_object(_request(config, chartmogul.PlanGroup, 'retrieve', uuid=uuid), fields)
     except Exception as e:
         LOGGER.error(f"Error retrieving plan group: {str(e)}", exc_info=True)
         return None
@@ -673,9 +1021,8 @@ def create_plan_group(config, data):
     Returns:
     """
     LOGGER.info(f"Creating plan group {data}.")
-    request = chartmogul.PlanGroup.create(config, data=data)
     try:
-        plan_group = parse_object(request.get())
+        plan_group = parse_object(_request(config, chartmogul.PlanGroup, 'create', data=data))
     except Exception as e:
         LOGGER.error(f"Error creating plan group: {str(e)}", exc_info=True)
         return None
@@ -689,9 +1036,8 @@ def update_plan_group(config, uuid, data):
     Returns:
     """
     LOGGER.info(f"Updating plan group {uuid}, {data}.")
-    request = chartmogul.PlanGroup.modify(config, uuid=uuid, data=data)
     try:
-        plan_group = parse_object(request.get())
+        plan_group = parse_object(_request(config, chartmogul.PlanGroup, 'modify', uuid=uuid, data=data))
     except Exception as e:
         LOGGER.error(f"Error updating plan group: {str(e)}", exc_info=True)
         return None
@@ -701,8 +1047,9 @@ def update_plan_group(config, uuid, data):
 
 ## Tasks Endpoints
 
+@_coalesced
 def list_tasks(config, customer_uuid=None, assignee=None, due_date_on_or_after=None,
-               estimated_close_date_on_or_before=None, completed=None, limit=20) -> list:
+               estimated_close_date_on_or_before=None, completed=None, limit=20, cursor=None, fields=None) -> list:
     """
     List all tasks from ChartMogul API.
 
@@ -710,48 +1057,58 @@ def list_tasks(config, customer_uuid=None, assignee=None, due_date_on_or_after=N
     """
     LOGGER.info(f"List tasks for {customer_uuid}, {assignee}, {due_date_on_or_after}, {estimated_close_date_on_or_before}, "
           f"{completed}.")
-    all_tasks = []
-    has_more = True
-    cursor = None
-    per_page = 20
-    total = 0
-    while has_more and total < limit:
-        request = chartmogul.Task.all(config,
-                                      customer_uuid=customer_uuid,
-                                      assignee=assignee,
-                                      due_date_on_or_after=due_date_on_or_after,
-                                      estimated_close_date_on_or_before=estimated_close_date_on_or_before,
-                                      completed=completed,
-                                      cursor=cursor,
-                                      per_page=per_page)
-        try:
-            tasks = request.get()
-            all_tasks.extend([parse_object(entry) for entry in tasks.entries])
-            total += per_page
-            has_more = tasks.has_more
-            cursor = tasks.cursor
-        except Exception as e:
-            LOGGER.error(f"Error fetching ChartMogul tasks: {str(e)}", exc_info=True)
-            return None
-    return all_tasks
-
-
-def retrieve_task(config, uuid):
+    try:
+        records = iter_tasks(config, customer_uuid, assignee, due_date_on_or_after, estimated_close_date_on_or_before,
+                          completed, limit, cursor, fields=fields).collect()
+    except Exception as e:
+        LOGGER.error(f"Error fetching ChartMogul tasks: {str(e)}", exc_info=True)
+        return None
+    if records.error is not None:
+        LOGGER.error(f"Error fetching ChartMogul tasks after {len(records)} records: {records.error}")
+    return records
+
+
+def iter_tasks(config, customer_uuid=None, assignee=None, due_date_on_or_after=None,
+               estimated_close_date_on_or_before=None, completed=None, limit=None, cursor=None, fields=None):
+    """
+    Iterate over tasks from ChartMogul API, fetching one page at a time.
+
+    Returns: An iterable of ChartMogul tasks. API errors are raised instead of logged.
+    """
+    return Paginator(functools.partial(_request, config, chartmogul.Task, 'all',
+                                       customer_uuid=customer_uuid,
+                                       assignee=assignee,
+                                       due_date_on_or_after=due_date_on_or_after,
+                                       estimated_close_date_on_or_before=estimated_close_date_on_or_before,
+                                       completed=completed),
+                     'entries', limit, parse=_parser(fields), prefetch=utils.PAGE_PREFETCH, cursor=cursor)
+
+
+@_coalesced
+def retrieve_task(config, uuid, fields=None):
     """
     Retrieve a task from ChartMogul API.
 
     Returns: The task.
     """
     LOGGER.info(f"Retrieving task for {uuid}.")
-    request = chartmogul.Task.retrieve(config, uuid=uuid)
     try:
-        task = parse_object(request.get())
+        task = parse_object(_request(config, chartmogul.Task, 'retrieve', uuid=uuid), fields)
     except Exception as e:
         LOGGER.error(f"Error retrieving task: {str(e)}", exc_info=True)
         return None
     return task
 
 
+def retrieve_tasks(config, uuids, fields=None):
+    """
+    Retrieve several tasks from ChartMogul API concurrently.
+
+    Returns: A dict with "results" (tasks keyed by uuid) and "errors" (messages keyed by uuid).
+    """
+    return _retrieve_many(config, chartmogul.Task, 'tasks', uuids, fields)
+
+
 def create_task(config, data):
     """
     Create a task from ChartMogul API.
@@ -759,9 +1116,8 @@ def create_task(config, data):
     Returns:
     """
     LOGGER.info(f"Creating task {data}.")
-    request = chartmogul.Task.create(config, data=data)
     try:
-        task = parse_object(request.get())
+        task = parse_object(_request(config, chartmogul.Task, 'create', data=data))
     except Exception as e:
         LOGGER.error(f"Error creating task: {str(e)}", exc_info=True)
         return None
@@ -775,9 +1131,8 @@ def update_task(config, uuid, data):
     Returns:
     """
     LOGGER.info(f"Updating task {uuid}, {data}.")
-    request = chartmogul.Task.patch(config, uuid=uuid, data=data)
     try:
-        task = parse_object(request.get())
+        task = parse_object(_request(config, chartmogul.Task, 'patch', uuid=uuid, data=data))
     except Exception as e:
         LOGGER.error(f"Error updating task: {str(e)}", exc_info=True)
         return None
@@ -786,27 +1141,86 @@ def update_task(config, uuid, data):
 
 ## Metrics API Endpoints
 
-def all_metrics(config, start_date, end_date, interval, geo=None, plans=None) -> list:
+# Metrics responses keyed on (config, endpoint, start_date, end_date, interval, geo, plans).
+metrics_cache = TTLCache(max_entries=utils.METRICS_CACHE_MAX_ENTRIES, ttl=utils.METRICS_CACHE_TTL)
+
+
+def _metrics_ttl(end_date):
+    # Ranges that end before today cannot change any more and are kept much longer.
+    try:
+        end = datetime.date.fromisoformat(str(end_date)[:10])
+    except ValueError:
+        return utils.METRICS_CACHE_TTL
+    today = datetime.datetime.now(datetime.timezone.utc).date()
+    return utils.METRICS_CACHE_HISTORICAL_TTL if end < today else utils.METRICS_CACHE_TTL
+
+
+@_coalesced
+def _metrics(config, endpoint, name, start_date, end_date, interval, geo, plans):
     """
-    List all metrics from ChartMogul API.
+    Fetch one metrics endpoint from ChartMogul API, served from metrics_cache when possible.
 
-    Returns: A list of all metrics.
+    Returns: A list of metrics entries.
     """
-    LOGGER.info(f"Fetching all metrics for {start_date}, {end_date}, {interval}, {geo}, {plans}.")
-    request = chartmogul.Metrics.all(config,
-                                     start_date=start_date,
-                                     end_date=end_date,
-                                     interval=interval,
-                                     geo=geo,
-                                     plans=plans
-                                     )
+    LOGGER.info(f"Fetching {name} metrics for {start_date}, {end_date}, {interval}, {geo}, {plans}.")
+    key = (config.uri, config.auth, endpoint, str(start_date), str(end_date), interval, str(geo), str(plans))
+    entries = metrics_cache.get(key)
+    if entries is not None:
+        LOGGER.info(f"{name} metrics served from cache ({metrics_cache.hits} hits, {metrics_cache.misses} misses).")
+        return entries
     try:
-        metrics = request.get()
-        all_metrics = [parse_object(entry) for entry in metrics.entries]
+        metrics = _request(config, chartmogul.Metrics, endpoint,
+                           start_date=start_date,
+                           end_date=end_date,
+                           interval=interval,
+                           geo=geo,
+                           plans=plans)
+        entries = [parse_object(entry) for entry in metrics.entries]
     except Exception as e:
-        LOGGER.error(f"Error fetching all metrics: {str(e)}", exc_info=True)
+        LOGGER.error(f"Error fetching {name} metrics: {str(e)}", exc_info=True)
         return None
-    return all_metrics
+    metrics_cache.set(key, entries, _metrics_ttl(end_date))
+    return entries
+
+
+# Field of each single-metric endpoint in the entries of the all metrics endpoint. MRR is not
+# here: its endpoint also returns the MRR movements, which the all metrics entries lack.
+_ALL_METRICS_FIELDS = {
+    'arr': 'arr',
+    'arpa': 'arpa',
+    'asp': 'asp',
+    'customer_count': 'customers',
+    'customer_churn_rate': 'customer_churn_rate',
+    'mrr_churn_rate': 'mrr_churn_rate',
+    'ltv': 'ltv',
+}
+
+
+def _derived_metrics(config, endpoint, name, start_date, end_date, interval, geo, plans):
+    """
+    Serve a single-metric endpoint from the (cached) all metrics response for the same range and filters,
+    so asking for several metrics of one range takes a single API request.
+
+    Falls back to the endpoint itself if the all metrics entries lack the metric or its percentage change.
+
+    Returns: A list of metrics entries shaped like the endpoint's own response.
+    """
+    field = _ALL_METRICS_FIELDS[endpoint]
+    change = f"{field}_percentage_change"
+    entries = _metrics(config, 'all', 'all', start_date, end_date, interval, geo, plans)
+    if entries is None or not all(field in entry and change in entry for entry in entries):
+        return _metrics(config, endpoint, name, start_date, end_date, interval, geo, plans)
+    LOGGER.info(f"{name} metrics derived from all metrics for {start_date}, {end_date}, {interval}, {geo}, {plans}.")
+    return [{'date': entry['date'], field: entry[field], 'percentage_change': entry[change]} for entry in entries]
+
+
+def all_metrics(config, start_date, end_date, interval, geo=None, plans=None) -> list:
+    """
+    List all metrics from ChartMogul API.
+
+    Returns: A list of all metrics.
+    """
+    return _metrics(config, 'all', 'all', start_date, end_date, interval, geo, plans)
 
 
 def mrr_metrics(config, start_date, end_date, interval, geo=None, plans=None) -> list:
@@ -815,21 +1229,7 @@ def mrr_metrics(config, start_date, end_date, interval, geo=None, plans=None) ->
 
     Returns: A list of MRR metrics.
     """
-    LOGGER.info(f"Fetching MRR metrics for {start_date}, {end_date}, {interval}, {geo}, {plans}.")
-    request = chartmogul.Metrics.mrr(config,
-                                     start_date=start_date,
-                                     end_date=end_date,
-                                     interval=interval,
-                                     geo=geo,
-                                     plans=plans
-                                     )
-    try:
-        mrr = request.get()
-        all_mrr = [parse_object(entry) for entry in mrr.entries]
-    except Exception as e:
-        LOGGER.error(f"Error fetching MRR metrics: {str(e)}", exc_info=True)
-        return None
-    return all_mrr
+    return _metrics(config, 'mrr', 'MRR', start_date, end_date, interval, geo, plans)
 
 
 def arr_metrics(config, start_date, end_date, interval, geo=None, plans=None) -> list:
@@ -838,21 +1238,7 @@ def arr_metrics(config, start_date, end_date, interval, geo=None, plans=None) ->
 
     Returns: A list of ARR metrics.
     """
-    LOGGER.info(f"Fetching ARR metrics for {start_date}, {end_date}, {interval}, {geo}, {plans}.")
-    request = chartmogul.Metrics.arr(config,
-                                     start_date=start_date,
-                                     end_date=end_date,
-                                     interval=interval,
-                                     geo=geo,
-                                     plans=plans
-                                     )
-    try:
-        arr = request.get()
-        all_arr = [parse_object(entry) for entry in arr.entries]
-    except Exception as e:
-        LOGGER.error(f"Error fetching ARR metrics: {str(e)}", exc_info=True)
-        return None
-    return all_arr
+    return _derived_metrics(config, 'arr', 'ARR', start_date, end_date, interval, geo, plans)
 
 
 def arpa_metrics(config, start_date, end_date, interval, geo=None, plans=None) -> list:
@@ -861,21 +1247,7 @@ def arpa_metrics(config, start_date, end_date, interval, geo=None, plans=None) -
 
     Returns: A list of ARPA metrics.
     """
-    LOGGER.info(f"Fetching ARPA metrics for {start_date}, {end_date}, {interval}, {geo}, {plans}.")
-    request = chartmogul.Metrics.arpa(config,
-                                      start_date=start_date,
-                                      end_date=end_date,
-                                      interval=interval,
-                                      geo=geo,
-                                      plans=plans
-                                      )
-    try:
-        arpa = request.get()
-        all_arpa = [parse_object(entry) for entry in arpa.entries]
-    except Exception as e:
-        LOGGER.error(f"Error fetching ARPA metrics: {str(e)}", exc_info=True)
-        return None
-    return all_arpa
+    return _derived_metrics(config, 'arpa', 'ARPA', start_date, end_date, interval, geo, plans)
 
 
 def asp_metrics(config, start_date, end_date, interval, geo=None, plans=None) -> list:
@@ -884,21 +1256,7 @@ def asp_metrics(config, start_date, end_date, interval, geo=None, plans=None) ->
 
     Returns: A list of ASP metrics.
     """
-    LOGGER.info(f"Fetching ASP metrics for {start_date}, {end_date}, {interval}, {geo}, {plans}.")
-    request = chartmogul.Metrics.asp(config,
-                                     start_date=start_date,
-                                     end_date=end_date,
-                                     interval=interval,
-                                     geo=geo,
-                                     plans=plans
-                                     )
-    try:
-        asp = request.get()
-        all_asp = [parse_object(entry) for entry in asp.entries]
-    except Exception as e:
-        LOGGER.error(f"Error fetching ASP metrics: {str(e)}", exc_info=True)
-        return None
-    return all_asp
+    return _derived_metrics(config, 'asp', 'ASP', start_date, end_date, interval, geo, plans)
 
 
 def customer_count_metrics(config, start_date, end_date, interval, geo=None, plans=None) -> list:
@@ -907,21 +1265,7 @@ def customer_count_metrics(config, start_date, end_date, interval, geo=None, pla
 
     Returns: A list of Customer count metrics.
     """
-    LOGGER.info(f"Fetching Customer count metrics for {start_date}, {end_date}, {interval}, {geo}, {plans}.")
-    request = chartmogul.Metrics.customer_count(config,
-                                                start_date=start_date,
-                                                end_date=end_date,
-                                                interval=interval,
-                                                geo=geo,
-                                                plans=plans
-                                                )
-    try:
-        customer_count = request.get()
-        all_customer_count = [parse_object(entry) for entry in customer_count.entries]
-    except Exception as e:
-        LOGGER.error(f"Error fetching Customer count metrics: {str(e)}", exc_info=True)
-        return None
-    return all_customer_count
+    return _derived_metrics(config, 'customer_count', 'Customer count', start_date, end_date, interval, geo, plans)
 
 
 def customer_churn_rate_metrics(config, start_date, end_date, interval, geo=None, plans=None) -> list:
@@ -930,21 +1274,8 @@ def customer_churn_rate_metrics(config, start_date, end_date, interval, geo=None
 
     Returns: A list of Customer churn rate metrics.
     """
-    LOGGER.info(f"Fetching Customer churn rate metrics for {start_date}, {end_date}, {interval}, {geo}, {plans}.")
-    request = chartmogul.Metrics.customer_churn_rate(config,
-                                                     start_date=start_date,
-                                                     end_date=end_date,
-                                                     interval=interval,
-                                                     geo=geo,
-                                                     plans=plans
-                                                     )
-    try:
-        customer_churn_rate = request.get()
-        all_customer_churn_rate = [parse_object(entry) for entry in customer_churn_rate.entries]
-    except Exception as e:
-        LOGGER.error(f"Error fetching Customer churn rate metrics: {str(e)}", exc_info=True)
-        return None
-    return all_customer_churn_rate
+    return _derived_metrics(config, 'customer_churn_rate', 'Customer churn rate',
+                            start_date, end_date, interval, geo, plans)
 
 
 def mrr_churn_rate_metrics(config, start_date, end_date, interval, geo=None, plans=None) -> list:
@@ -953,21 +1284,7 @@ def mrr_churn_rate_metrics(config, start_date, end_date, interval, geo=None, pla
 
     Returns: A list of MRR churn rate metrics.
     """
-    LOGGER.info(f"Fetching MRR churn rate metrics for {start_date}, {end_date}, {interval}, {geo}, {plans}.")
-    request = chartmogul.Metrics.mrr_churn_rate(config,
-                                                start_date=start_date,
-                                                end_date=end_date,
-                                                interval=interval,
-                                                geo=geo,
-                                                plans=plans
-                                                )
-    try:
-        mrr_churn_rate = request.get()
-        all_mrr_churn_rate = [parse_object(entry) for entry in mrr_churn_rate.entries]
-    except Exception as e:
-        LOGGER.error(f"Error fetching MRR churn rate metrics: {str(e)}", exc_info=True)
-        return None
-    return all_mrr_churn_rate
+    return _derived_metrics(config, 'mrr_churn_rate', 'MRR churn rate', start_date, end_date, interval, geo, plans)
 
 
 def ltv_metrics(config, start_date, end_date, interval, geo=None, plans=None) -> list:
@@ -976,28 +1293,15 @@ def ltv_metrics(config, start_date, end_date, interval, geo=None, plans=None) ->
 
     Returns: A list of LTV metrics.
     """
-    LOGGER.info(f"Fetching LTV metrics for {start_date}, {end_date}, {interval}, {geo}, {plans}.")
-    request = chartmogul.Metrics.ltv(config,
-                                     start_date=start_date,
-                                     end_date=end_date,
-                                     interval=interval,
-                                     geo=geo,
-                                     plans=plans
-                                     )
-    try:
-        ltv = request.get()
-        all_ltv = [parse_object(entry) for entry in ltv.entries]
-    except Exception as e:
-        LOGGER.error(f"Error fetching LTV metrics: {str(e)}", exc_info=True)
-        return None
-    return all_ltv
+    return _derived_metrics(config, 'ltv', 'LTV', start_date, end_date, interval, geo, plans)
 
 
 ## Subscription Events
 
+@_coalesced
 def list_subscription_events(config, data_source_uuid=None, external_id=None, customer_external_id=None,
                              subscription_external_id=None, event_type=None, event_date=None, effective_date=None,
-                             plan_external_id=None, limit=20) -> list:
+                             plan_external_id=None, limit=20, cursor=None, fields=None) -> list:
     """
     List all subscription events from ChartMogul API.
 
@@ -1005,113 +1309,187 @@ def list_subscription_events(config, data_source_uuid=None, external_id=None, cu
     """
     LOGGER.info(f"List subscription events for {data_source_uuid}, {external_id}, {customer_external_id}, {event_type}, "
                 f"{subscription_external_id}, {event_date}, {effective_date}, {plan_external_id}.")
-    all_subscription_events = []
-    has_more = True
-    cursor = None
-    per_page = 20
-    total = 0
-    while has_more and total < limit:
-        request = chartmogul.SubscriptionEvent.all(config,
-                                                   data_source_uuid=data_source_uuid,
-                                                   external_id=external_id,
-                                                   customer_external_id=customer_external_id,
-                                                   subscription_external_id=subscription_external_id,
-                                                   event_type=event_type,
-                                                   event_date=event_date,
-                                                   effective_date=effective_date,
-                                                   plan_external_id=plan_external_id,
-                                                   cursor=cursor,
-                                                   per_page=per_page)
-        try:
-            subscription_events = request.get()
-            all_subscription_events.extend([parse_object(entry) for entry in subscription_events.subscription_events])
-            total += per_page
-            has_more = subscription_events.has_more
-            cursor = subscription_events.cursor
-        except Exception as e:
-            LOGGER.error(f"Error fetching ChartMogul subscription events: {str(e)}", exc_info=True)
-            return None
-    return all_subscription_events
-
-
-## Invoices
+    try:
+        records = iter_subscription_events(config, data_source_uuid, external_id, customer_external_id,
+                                        subscription_external_id, event_type, event_date, effective_date,
+                                        plan_external_id, limit, cursor, fields=fields).collect()
+    except Exception as e:
+        LOGGER.error(f"Error fetching ChartMogul subscription events: {str(e)}", exc_info=True)
+        return None
+    if records.error is not None:
+        LOGGER.error(f"Error fetching ChartMogul subscription events after {len(records)} records: {records.error}")
+    return records
+
+
+def iter_subscription_events(config, data_source_uuid=None, external_id=None, customer_external_id=None,
+                             subscription_external_id=None, event_type=None, event_date=None, effective_date=None,
+                             plan_external_id=None, limit=None, cursor=None, fields=None):
+    """
+    Iterate over subscription events from ChartMogul API, fetching one page at a time.
+
+    Returns: An iterable of ChartMogul subscription events. API errors are raised instead of logged.
+    """
+    return Paginator(functools.partial(_request, config, chartmogul.SubscriptionEvent, 'all',
+                                       data_source_uuid=data_source_uuid,
+                                       external_id=external_id,
+                                       customer_external_id=customer_external_id,
+                                       subscription_external_id=subscription_external_id,
+                                       event_type=event_type,
+                                       event_date=event_date,
+                                       effective_date=effective_date,
+                                       plan_external_id=plan_external_id),
+                     'subscription_events', limit, parse=_parser(fields), prefetch=utils.PAGE_PREFETCH, cursor=cursor)
+
 
+@_coalesced
 def list_invoices(config, data_source_uuid=None, external_id=None, customer_uuid=None,
-                  validation_type=None, limit=20) -> list:
+                  validation_type=None, limit=20, cursor=None, fan_out=None, fields=None) -> list:
     """
     List all invoices from ChartMogul API.
 
     Returns: A list of ChartMogul invoices.
     """
     LOGGER.info(f"List invoices for {data_source_uuid}, {external_id}, {customer_uuid}, {validation_type}.")
-    all_invoices = []
-    has_more = True
-    cursor = None
-    per_page = 20
-    total = 0
-    while has_more and total < limit:
-        request = chartmogul.Invoice.all(config,
-                                         data_source_uuid=data_source_uuid,
-                                         external_id=external_id,
-                                         customer_uuid=customer_uuid,
-                                         validation_type=validation_type,
-                                         cursor=cursor,
-                                         per_page=per_page)
-        try:
-            invoices = request.get()
-            all_invoices.extend([parse_object(entry) for entry in invoices.invoices])
-            total += per_page
-            has_more = invoices.has_more
-            cursor = invoices.cursor
-        except Exception as e:
-            LOGGER.error(f"Error fetching ChartMogul invoices: {str(e)}", exc_info=True)
-            return None
-    return all_invoices
-
-
-## Activities
-
-def list_activities(config, start_date=None, end_date=None, type=None, order=None, limit=20) -> list:
+    try:
+        records = iter_invoices(config, data_source_uuid, external_id, customer_uuid, validation_type,
+                                limit, cursor, fan_out, fields=fields).collect()
+    except Exception as e:
+        LOGGER.error(f"Error fetching ChartMogul invoices: {str(e)}", exc_info=True)
+        return None
+    if records.error is not None:
+        LOGGER.error(f"Error fetching ChartMogul invoices after {len(records)} records: {records.error}")
+    return records
+
+
+def iter_invoices(config, data_source_uuid=None, external_id=None, customer_uuid=None,
+                  validation_type=None, limit=None, cursor=None, fan_out=None, fields=None):
+    """
+    Iterate over invoices from ChartMogul API, fetching one page at a time.
+
+    Without a data_source_uuid, fan_out (SOURCE_FAN_OUT by default) walks the invoices of
+    every data source concurrently.
+
+    Returns: An iterable of ChartMogul invoices. API errors are raised instead of logged.
+    """
+    if (utils.SOURCE_FAN_OUT if fan_out is None else fan_out) and data_source_uuid is None and cursor is None:
+        return _per_source(config, lambda uuid, fields: iter_invoices(config, uuid, external_id, customer_uuid,
+                                                                      validation_type, limit, fan_out=False,
+                                                                      fields=fields),
+                           limit, fields)
+    return Paginator(functools.partial(_request, config, chartmogul.Invoice, 'all',
+                                       data_source_uuid=data_source_uuid,
+                                       external_id=external_id,
+                                       customer_uuid=customer_uuid,
+                                       validation_type=validation_type),
+                     'invoices', limit, parse=_parser(fields), prefetch=utils.PAGE_PREFETCH, cursor=cursor)
+
+
+@_coalesced
+def list_activities(config, start_date=None, end_date=None, type=None, order=None, limit=20, cursor=None,
+                    shards=None, fields=None) -> list:
     """
     List all activities from ChartMogul API.
 
     Returns: A list of ChartMogul activities.
     """
     LOGGER.info(f"List activities for {start_date}, {end_date}, {type}, {order}.")
-    all_activities = []
-    has_more = True
-    cursor = None
-    per_page = 20
-    total = 0
-    while has_more and total < limit:
-        request = chartmogul.Activity.all(config,
-                                         start_date=start_date,
-                                         end_date=end_date,
-                                         type=type,
-                                         order=order,
-                                         cursor=cursor,
-                                         per_page=per_page)
-        try:
-            activities = request.get()
-            all_activities.extend([parse_object(entry) for entry in activities.entries])
-            total += per_page
-            has_more = activities.has_more
-            cursor = activities.cursor
-        except Exception as e:
-            LOGGER.error(f"Error fetching ChartMogul activities: {str(e)}", exc_info=True)
-            return None
-    return all_activities
-
-
-def parse_object(obj):
-    if isinstance(obj, datetime.datetime) or isinstance(obj, datetime.date):
-        return obj.isoformat() 
-    elif hasattr(obj, '__dict__'):
-        result = {}
-        for key, value in obj.__dict__.items():
-            result[key] = parse_object(value)
-        return result
-    elif isinstance(obj, list):
-        return [parse_object(item) for item in obj]
-    else:
-        return obj
\ No newline at end of file
+    try:
+        records = iter_activities(config, start_date, end_date, type, order, limit, cursor, shards,
+                                  fields=fields).collect()
+    except Exception as e:
+        LOGGER.error(f"Error fetching ChartMogul activities: {str(e)}", exc_info=True)
+        return None
+    if records.error is not None:
+        LOGGER.error(f"Error fetching ChartMogul activities after {len(records)} records: {records.error}")
+    return records
+
+
+def iter_activities(config, start_date=None, end_date=None, type=None, order=None, limit=None, cursor=None,
+                    shards=None, fields=None):
+    """
+    Iterate over activities from ChartMogul API, fetching one page at a time.
+
+    Between start_date and end_date, a listing without a limit, or with a limit of at least a full
+    page per shard, is split into `shards` (LIST_SHARDS by default) equal date ranges, which are
+    walked concurrently. Smaller listings are walked in one chain, as shards would fetch records
+    past the limit.
+
+    Returns: An iterable of ChartMogul activities. API errors are raised instead of logged.
+    """
+    shards = utils.LIST_SHARDS if shards is None else shards
+    ranges = None
+    if shards > 1 and cursor is None and (limit is None or limit >= shards * MAX_PER_PAGE):
+        ranges = _date_ranges(start_date, end_date, shards)
+    if ranges:
+        # Activities are listed oldest first unless ordered by -date.
+        if order == '-date':
+            ranges.reverse()
+        shard_fields, parse = _keyed(fields)
+        return ShardedPaginator([iter_activities(config, start, end, type, order, limit, shards=1,
+                                                 fields=shard_fields)
+                                 for start, end in ranges],
+                                limit, key='uuid', parallelism=utils.BATCH_PARALLELISM, parse=parse)
+    return Paginator(functools.partial(_request, config, chartmogul.Activity, 'all',
+                                       start_date=start_date,
+                                       end_date=end_date,
+                                       type=type,
+                                       order=order),
+                     'entries', limit, parse=_parser(fields), prefetch=utils.PAGE_PREFETCH, cursor=cursor)
+
+
+def _date_ranges(start_date, end_date, count):
+    """
+    Split the time between two ISO 8601 dates or datetimes into `count` ranges of equal length.
+
+    Consecutive ranges share their boundary, so no instant falls between two of them. The first
+    range starts at start_date and the last ends at end_date as given, so that a date-only end
+    keeps meaning what it means to the API.
+
+    Returns: A list of (start, end) pairs in date order, with the inner boundaries as ISO strings,
+    or None if the dates are missing or invalid.
+    """
+    try:
+        start, end = (value if isinstance(value, datetime.datetime) else datetime.datetime.fromisoformat(str(value))
+                      for value in (start_date, end_date))
+        step = (end - start) / count
+    except (TypeError, ValueError):
+        return None
+    if step <= datetime.timedelta(0):
+        return None
+    bounds = [start_date] + [(start + step * n).replace(microsecond=0).isoformat() for n in range(1, count)] + [end_date]
+    return list(zip(bounds, bounds[1:]))
+
+
+def parse_object(obj, only=None):
+    """
+    Convert an SDK object into JSON-ready data, see serializers.serialize.
+
+    only, dotted attribute paths such as 'attributes.tags', keeps only those attributes.
+
+    Returns: A dict, list or value with dates as ISO strings.
+    """
+    return serializers.serialize(obj, serializers.projection(only))
+
+
+def _parser(fields):
+    """
+    Make the parse function of a listing that keeps only `fields`, compiling the selection once.
+
+    Returns: parse_object, or a function converting only the selected attributes.
+    """
+    if not fields:
+        return parse_object
+    node = serializers.projection(fields)
+    return lambda obj: serializers.serialize(obj, node)
+
+
+def _keyed(fields, key='uuid'):
+    """
+    Add the key sharded listings deduplicate records by to a selection of fields.
+
+    Returns: A tuple of the fields to walk the shards with, and the parse that drops the key
+    again from the merged records (None if the key was selected anyway).
+    """
+    if not fields or key in fields:
+        return fields, None
+    return list(fields) + [key], _parser(fields)
@@ -0,0 +1,14 @@
+"""
+ASGI app of the MCP server over HTTP, imported by every worker process of a multi-worker deployment.
+
+Run by ChartMogulMcp.run with CHARTMOGUL_MCP_WORKERS above 1, or directly with an ASGI server,
+e.g. `uvicorn chartmogul_mcp.asgi:app --workers 4`. Each worker has its own caches, connection
+pools and rate limiter, so the configured request rate is split between the workers.
+"""
+from chartmogul_mcp import api_client, mcp_server, utils
+
+if utils.MCP_WORKERS > 1:
+    api_client.rate_limiter.rate = utils.RATE_LIMIT / utils.MCP_WORKERS
+    api_client.rate_limiter.burst = max(1, utils.RATE_LIMIT_BURST // utils.MCP_WORKERS)
+
+app = mcp_server.ChartMogulMcp().http_app(stateless=utils.MCP_WORKERS > 1)
@@ -1,28 +1,176 @@
+import os
 import sys
+import asyncio
 import datetime
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
-from mcp.server.fastmcp import FastMCP
 from chartmogul_mcp import api_client
 from chartmogul_mcp import utils
+from chartmogul_mcp.tool_listing import CachedToolsMCP
+from chartmogul_mcp.tenants import TOKEN_HEADER, ConfigPool, TokenMiddleware, current_token
+from chartmogul_mcp.pagination import PageResult, continuation_token, resume_cursor
 from chartmogul_mcp.utils import LOGGER
-from dotenv import load_dotenv
+
+
+# Transports ChartMogulMcp.http_app can serve.
+HTTP_TRANSPORTS = ('sse', 'streamable-http')
+
+# Appended to the description of every list tool.
+CONTINUATION_HELP = (' Results come as records, has_more and continuation_token: to get the next records, call the '
+                     'tool again with the same filters and the continuation_token instead of raising the limit.')
+
+# Appended to the description of every list and retrieve tool.
+FIELDS_HELP = (' Pass fields to get only the attributes you need, as dotted paths such as '
+               '["uuid", "name", "attributes.tags"]; the output then costs fewer tokens.')
 
 
 class ChartMogulMcp:
 
     def __init__(self):
-        load_dotenv()
-
         # Initialize MCP Server
-        self.mcp = FastMCP(utils.MCP_SERVER_NAME, deps=utils.DEPENDENCIES)
+        self.mcp = CachedToolsMCP(utils.MCP_SERVER_NAME, compact_tools=utils.COMPACT_TOOLS, deps=utils.DEPENDENCIES)
         LOGGER.info("ChartMogul MCP Server initialized")
 
-        self.config = api_client.init_chartmogul_config()
+        # Configs of the accounts whose API key comes with HTTP requests instead of CHARTMOGUL_TOKEN.
+        self.tenants = ConfigPool(api_client.init_tenant_config, max_tenants=utils.MAX_TENANTS,
+                                  idle_ttl=utils.TENANT_IDLE_TTL, on_evict=api_client.forget_tenant)
+
+        # The api_client functions block on HTTP, so they run in a bounded worker pool
+        # to let concurrent tool calls proceed instead of queueing on the event loop.
+        self.executor = ThreadPoolExecutor(max_workers=utils.MAX_WORKERS, thread_name_prefix="chartmogul")
 
         # Register MCP tools
         self._register_tools()
 
 
+    @functools.cached_property
+    def config(self):
+        """The config of the CHARTMOGUL_TOKEN account, created on first use, as it imports the SDK."""
+        return api_client.init_chartmogul_config()
+
+    async def _call(self, func, *args, **kwargs):
+        """Run a blocking api_client function in the worker pool and await its result."""
+        loop = asyncio.get_running_loop()
+        config = self._current_config()
+        limiter = api_client.limiter_of(config)
+        before = limiter.stats()
+        result = await loop.run_in_executor(self.executor, functools.partial(func, config, *args, **kwargs))
+        if isinstance(result, PageResult):
+            await self._report(f"{func.__name__} fetched {len(result)} records in {result.requests} API requests.")
+        after = limiter.stats()
+        # Counted for the account, so concurrent calls of the same account are included.
+        if after["throttled"] > before["throttled"] or after["retries"] > before["retries"]:
+            await self._report(f"{func.__name__}: the ChartMogul API throttled {after['throttled'] - before['throttled']} "
+                               f"requests and {after['retries'] - before['retries']} were retried; "
+                               f"{after['waiting']} requests are queued for the rate limit.")
+        return result
+
+    async def _list(self, func, iter_func, *args, continuation_token=None, fields=None):
+        """
+        Run a list function in the worker pool, or stream its pages if the client asked for progress.
+
+        args are the list function's filters followed by the limit; the listing starts where
+        continuation_token, if given, left off, and fields, if given, selects the attributes of the records.
+        Clients that send a progress token get every page as a log notification as soon as it
+        arrives, followed by a progress notification, before the complete list is returned.
+        """
+        # The filters, without the limit: a continuation may ask for a different number of records.
+        scope = (func.__name__,) + args[:-1]
+        args += (resume_cursor(scope, continuation_token) if continuation_token else None,)
+        ctx = self.mcp.get_context()
+        if self._progress_token(ctx) is None:
+            return self._list_result(scope, await self._call(func, *args, fields=fields))
+
+        loop = asyncio.get_running_loop()
+        pages = iter_func(self._current_config(), *args, fields=fields)
+        page_iter = pages.pages()
+        records = PageResult()
+        try:
+            while (page := await loop.run_in_executor(self.executor, next, page_iter, None)) is not None:
+                records.extend(page)
+                await ctx.session.send_log_message(level="info", data=page, logger=func.__name__)
+                await ctx.report_progress(len(records), pages.limit)
+        except Exception as e:
+            LOGGER.error(f"Error streaming {func.__name__}: {str(e)}", exc_info=True)
+            if not records:
+                return None
+            records.error = str(e)
+        records.requests = pages.requests
+        records.cursor, records.has_more = pages.cursor, pages.has_more
+        await self._report(f"{func.__name__} streamed {len(records)} records in {records.requests} API requests.")
+        return self._list_result(scope, records)
+
+    @staticmethod
+    def _list_result(scope, records):
+        """
+        Shape the result of a list tool: the records, whether there are more, and the token to
+        fetch them. If a page failed part way, the error is included and the token resumes at it.
+        """
+        if not isinstance(records, PageResult):
+            return records
+        more = records.has_more or records.error is not None
+        # Sharded listings have no single cursor to resume from.
+        resumable = more and (records.cursor is not None or records.requests == 0)
+        result = {"records": list(records), "has_more": more,
+                  "continuation_token": continuation_token(scope, records.cursor) if resumable else None}
+        if records.error is not None:
+            result["error"] = records.error
+        return result
+
+    async def _bulk(self, func, *args):
+        """
+        Run a bulk api_client function in the worker pool.
+
+        Clients that send a progress token get a progress notification after every customer.
+        """
+        ctx = self.mcp.get_context()
+        if self._progress_token(ctx) is None:
+            return await self._call(func, *args)
+        loop = asyncio.get_running_loop()
+
+        def on_progress(done, total):
+            # Called from the batch threads; waits for the notification so that they go out in order.
+            try:
+                asyncio.run_coroutine_threadsafe(ctx.report_progress(done, total), loop).result()
+            except Exception as e:
+                LOGGER.warning(f"Could not report progress of {func.__name__}: {str(e)}")
+
+        result = await self._call(func, *args, on_progress=on_progress)
+        if result is not None:
+            await self._report(f"{func.__name__}: {len(result['succeeded'])} of {result['total']} customers updated.")
+        return result
+
+    def _current_config(self):
+        """The config of the account the current request or session works on: its own API key, or CHARTMOGUL_TOKEN."""
+        token = current_token.get()
+        if token is None:
+            # Sessions of newer mcp versions can run outside the request's context, but keep the request.
+            try:
+                request = getattr(self.mcp.get_context().request_context, 'request', None)
+            except ValueError:
+                request = None
+            headers = getattr(request, 'headers', None)
+            token = headers.get(TOKEN_HEADER.decode()) if headers is not None else None
+        return self.config if not token else self.tenants.get(token)
+
+    @staticmethod
+    def _progress_token(ctx):
+        try:
+            meta = ctx.request_context.meta
+        except ValueError:
+            return None
+        return meta.progressToken if meta else None
+
+    async def _report(self, message):
+        """Log a message and forward it to the client of the current tool call, if there is one."""
+        LOGGER.info(message)
+        try:
+            await self.mcp.get_context().info(message)
+        except ValueError:
+            # Called outside of a client request, e.g. from mcp.call_tool in scripts.
+            pass
+
     def _register_tools(self):
         """Register MCP tools to interact with ChartMogul API."""
 
@@ -30,20 +178,21 @@ class ChartMogulMcp:
         @self.mcp.tool(name='retrieve_account',
                        description='Retrieve some useful information about your ChartMogul account.')
         async def retrieve_account() -> Dict:
-            return api_client.retrieve_account(self.config)
+            return await self._call(api_client.retrieve_account)
 
         ## data sources
         @self.mcp.tool(name='list_sources',
                        description='Get a list of all data sources in your ChartMogul account.'
                                    'You can also filter using the data source name or system '
-                                   '(the type of system of the data sources, e.g., Stripe, Recurly, Custom, etc.).')
-        async def list_sources(name: str = None, system: str = None) -> list:
-            return api_client.list_sources(self.config, name, system)
+                                   '(the type of system of the data sources, e.g., Stripe, Recurly, Custom, etc.).'
+                                   + FIELDS_HELP)
+        async def list_sources(name: str = None, system: str = None, fields: list[str] = None) -> list:
+            return await self._call(api_client.list_sources, name, system, fields=fields)
 
         @self.mcp.tool(name='retrieve_source',
-                       description='Retrieve a data source from your ChartMogul account using its UUID.')
-        async def retrieve_source(uuid: str) -> Dict:
-            return api_client.retrieve_source(self.config, uuid)
+                       description='Retrieve a data source from your ChartMogul account using its UUID.' + FIELDS_HELP)
+        async def retrieve_source(uuid: str, fields: list[str] = None) -> Dict:
+            return await self._call(api_client.retrieve_source, uuid, fields=fields)
 
         ## customers
         @self.mcp.tool(name='list_customers',
@@ -53,23 +202,49 @@ class ChartMogulMcp:
                                    'You can also filter based on data_source_uuid, external_id, '
                                    'status (one of New_Lead, Working_Lead, Qualified_Lead, Unqualified_Lead, Active, '
                                    'Past_Due or Cancelled) and system (the type of system of the data sources, '
-                                   'e.g. Stripe, Recurly, Custom, etc.).')
+                                   'e.g. Stripe, Recurly, Custom, etc.).' + CONTINUATION_HELP + FIELDS_HELP)
         async def list_customers(data_source_uuid: str = None, external_id: str = None, status: str = None,
-                                 system: str = None, limit: int = 20) -> list:
-            return api_client.list_customers(self.config, data_source_uuid, external_id, status, system, limit)
+                                 system: str = None, limit: int = 20, continuation_token: str = None,
+                                 fields: list[str] = None) -> Dict:
+            return await self._list(api_client.list_customers, api_client.iter_customers,
+                                    data_source_uuid, external_id, status, system, limit,
+                                    continuation_token=continuation_token, fields=fields)
 
         @self.mcp.tool(name='search_customers',
                        description='Search a list of all customers with the specified email address '
                                    'in your ChartMogul account.'
                                    'We have a default limit of 20 customers, '
-                                   'ask but discourage the user if they want more than 20 as this will exhaust AI tokens.')
-        async def search_customers(email: str, limit: int = 20) -> list:
-            return api_client.search_customers(self.config, email, limit)
+                                   'ask but discourage the user if they want more than 20 as this will exhaust AI tokens.'
+                                   + CONTINUATION_HELP + FIELDS_HELP)
+        async def search_customers(email: str, limit: int = 20, continuation_token: str = None,
+                                   fields: list[str] = None) -> Dict:
+            return await self._list(api_client.search_customers, api_client.iter_search_customers,
+                                    email, limit, continuation_token=continuation_token, fields=fields)
 
         @self.mcp.tool(name='retrieve_customer',
-                       description='Retrieve a customer from your ChartMogul account using its UUID.')
-        async def retrieve_customer(uuid: str) -> Dict:
-            return api_client.retrieve_customer(self.config, uuid)
+                       description='Retrieve a customer from your ChartMogul account using its UUID.' + FIELDS_HELP)
+        async def retrieve_customer(uuid: str, fields: list[str] = None) -> Dict:
+            return await self._call(api_client.retrieve_customer, uuid, fields=fields)
+
+        @self.mcp.tool(name='retrieve_customers',
+                       description='Retrieve several customers from your ChartMogul account using a list of their UUIDs, '
+                                   'in one call. Prefer this over repeated retrieve_customer calls. '
+                                   'Returns the customers found keyed by UUID in "results" and the UUIDs that failed '
+                                   'with their error in "errors".' + FIELDS_HELP)
+        async def retrieve_customers(uuids: list[str], fields: list[str] = None) -> Dict:
+            return await self._call(api_client.retrieve_customers, uuids, fields=fields)
+
+        @self.mcp.tool(name='retrieve_customer_360',
+                       description='Retrieve everything about one customer from your ChartMogul account in one call: '
+                                   'the customer with its attributes, and its subscriptions, activities, notes, '
+                                   'opportunities and tasks. Prefer this over calling those tools one by one to '
+                                   'describe a customer. limits sets the number of records per section (subscriptions '
+                                   'and activities default to 20, notes, opportunities and tasks to 10); a limit of 0 '
+                                   'leaves a section out. Each section has its records and has_more, and the error '
+                                   'that cut it short if a page failed; sections that could not be fetched are listed '
+                                   'in failed, with their error in errors.')
+        async def retrieve_customer_360(uuid: str, limits: Dict[str, int] = None) -> Dict:
+            return await self._call(api_client.retrieve_customer_360, uuid, limits)
 
         @self.mcp.tool(name='create_customer',
                        description='Create a customer in your ChartMogul account. '
@@ -88,7 +263,7 @@ class ChartMogulMcp:
                                    'email, title, phone, linked_in, twitter, notes), website_url.'
                                    'All fields should be included in a data dictionary.')
         async def create_customer(data: dict) -> Dict:
-            return api_client.create_customer(self.config, data)
+            return await self._call(api_client.create_customer, data)
 
         @self.mcp.tool(name='update_customer',
                        description='Update certain modifiable attributes of a customer in your ChartMogul account. '
@@ -98,29 +273,35 @@ class ChartMogulMcp:
                                    'primary_contact, status and website_url, and should be included in a '
                                    'data dictionary.')
         async def update_customer(uuid: str, data: dict) -> Dict:
-            return api_client.update_customer(self.config, uuid, data)
+            return await self._call(api_client.update_customer, uuid, data)
 
         @self.mcp.tool(name='list_customer_subscriptions',
                        description='Get a list of all subscriptions with the specified customer uuid '
                                    'in your ChartMogul account.'
                                    'We have a default limit of 20 subscriptions, '
-                                   'ask but discourage the user if they want more than 20 as this will exhaust AI tokens.')
-        async def list_customer_subscriptions(uuid: str, limit: int = 20) -> list:
-            return api_client.list_customer_subscriptions(self.config, uuid, limit)
+                                   'ask but discourage the user if they want more than 20 as this will exhaust AI tokens.'
+                                   + CONTINUATION_HELP + FIELDS_HELP)
+        async def list_customer_subscriptions(uuid: str, limit: int = 20, continuation_token: str = None,
+                                              fields: list[str] = None) -> Dict:
+            return await self._list(api_client.list_customer_subscriptions, api_client.iter_customer_subscriptions,
+                                    uuid, limit, continuation_token=continuation_token, fields=fields)
 
         @self.mcp.tool(name='list_customer_activities',
                        description='Get a list of all activities with the specified customer uuid '
                                    'in your ChartMogul account.'
                                    'We have a default limit of 20 activities, '
-                                   'ask but discourage the user if they want more than 20 as this will exhaust AI tokens.')
-        async def list_customer_activities(uuid: str, limit: int = 20) -> list:
-            return api_client.list_customer_activities(self.config, uuid, limit)
+                                   'ask but discourage the user if they want more than 20 as this will exhaust AI tokens.'
+                                   + CONTINUATION_HELP + FIELDS_HELP)
+        async def list_customer_activities(uuid: str, limit: int = 20, continuation_token: str = None,
+                                           fields: list[str] = None) -> Dict:
+            return await self._list(api_client.list_customer_activities, api_client.iter_customer_activities,
+                                    uuid, limit, continuation_token=continuation_token, fields=fields)
 
         @self.mcp.tool(name='list_customer_attributes',
                        description='Get a list of all customer attributes with the specified customer uuid '
                                    'in your ChartMogul account.')
         async def list_customer_attributes(uuid: str) -> list:
-            return api_client.list_customer_attributes(self.config, uuid)
+            return await self._call(api_client.list_customer_attributes, uuid)
 
         @self.mcp.tool(name='add_customer_tags',
                        description='Add a list of tags to the specified customer uuid in your ChartMogul account.'
@@ -128,7 +309,7 @@ class ChartMogulMcp:
                                    'tags, no additional tags will be added to the customer. If the endpoint is '
                                    'called with a single new tag, it will be added to previous tags of the user.')
         async def add_customer_tags(uuid: str, tags: list) -> list:
-            return api_client.add_customer_tags(self.config, uuid, tags)
+            return await self._call(api_client.add_customer_tags, uuid, tags)
 
         @self.mcp.tool(name='add_customer_custom_attributes',
                        description='Add a list of custom attributes to the specified customer uuid in your ChartMogul account.'
@@ -141,21 +322,59 @@ class ChartMogulMcp:
                                    'specify where the custom attribute was created, displayed in the ChartMogul UI. '
                                    'Defaults to API.')
         async def add_customer_custom_attributes(uuid: str, custom_attributes: list) -> list:
-            return api_client.add_customer_custom_attributes(self.config, uuid, custom_attributes)
+            return await self._call(api_client.add_customer_custom_attributes, uuid, custom_attributes)
+
+        @self.mcp.tool(name='bulk_add_customer_tags',
+                       description='Add a list of tags to many customers in your ChartMogul account in one call. '
+                                   'Prefer this over repeated add_customer_tags calls. Either pass the customer uuids, '
+                                   'or select customers like list_customers with data_source_uuid, status and system '
+                                   '(up to limit customers, default 1000). Confirm the selection with the user before '
+                                   'tagging by filter. Returns the number of customers, the uuids that succeeded and '
+                                   'the error of every uuid that failed.')
+        async def bulk_add_customer_tags(tags: list, uuids: list[str] = None, data_source_uuid: str = None,
+                                         status: str = None, system: str = None, limit: int = 1000) -> Dict:
+            return await self._bulk(api_client.bulk_add_customer_tags, tags, uuids, data_source_uuid,
+                                    status, system, limit)
+
+        @self.mcp.tool(name='bulk_add_customer_custom_attributes',
+                       description='Add a list of custom attributes to many customers in your ChartMogul account in '
+                                   'one call. Prefer this over repeated add_customer_custom_attributes calls. '
+                                   'custom_attributes has the same format as for add_customer_custom_attributes. '
+                                   'Either pass the customer uuids, or select customers like list_customers with '
+                                   'data_source_uuid, status and system (up to limit customers, default 1000). '
+                                   'Confirm the selection with the user before updating by filter. Returns the number '
+                                   'of customers, the uuids that succeeded and the error of every uuid that failed.')
+        async def bulk_add_customer_custom_attributes(custom_attributes: list, uuids: list[str] = None,
+                                                      data_source_uuid: str = None, status: str = None,
+                                                      system: str = None, limit: int = 1000) -> Dict:
+            return await self._bulk(api_client.bulk_add_customer_custom_attributes, custom_attributes, uuids,
+                                    data_source_uuid, status, system, limit)
 
         ## contacts
         @self.mcp.tool(name='list_contacts',
                        description='Get a list of all contacts in your ChartMogul account.'
                                    'We have a default limit of 20 contacts, '
                                    'ask but discourage the user if they want more than 20 as this will exhaust AI tokens.'
-                                   'You can filter using the contact email address and the customer_external_id.')
-        async def list_contacts(email: str = None, customer_external_id: str = None, limit: int = 20) -> list:
-            return api_client.list_contacts(self.config, email, customer_external_id, limit)
+                                   'You can filter using the contact email address and the customer_external_id.'
+                                   + CONTINUATION_HELP + FIELDS_HELP)
+        async def list_contacts(email: str = None, customer_external_id: str = None, limit: int = 20,
+                                continuation_token: str = None, fields: list[str] = None) -> Dict:
+            return await self._list(api_client.list_contacts, api_client.iter_contacts,
+                                    email, customer_external_id, limit, continuation_token=continuation_token,
+                                    fields=fields)
 
         @self.mcp.tool(name='retrieve_contact',
-                       description='Retrieve a contact from your ChartMogul account using its UUID.')
-        async def retrieve_contact(uuid: str) -> Dict:
-            return api_client.retrieve_contact(self.config, uuid)
+                       description='Retrieve a contact from your ChartMogul account using its UUID.' + FIELDS_HELP)
+        async def retrieve_contact(uuid: str, fields: list[str] = None) -> Dict:
+            return await self._call(api_client.retrieve_contact, uuid, fields=fields)
+
+        @self.mcp.tool(name='retrieve_contacts',
+                       description='Retrieve several contacts from your ChartMogul account using a list of their UUIDs, '
+                                   'in one call. Prefer this over repeated retrieve_contact calls. '
+                                   'Returns the contacts found keyed by UUID in "results" and the UUIDs that failed '
+                                   'with their error in "errors".' + FIELDS_HELP)
+        async def retrieve_contacts(uuids: list[str], fields: list[str] = None) -> Dict:
+            return await self._call(api_client.retrieve_contacts, uuids, fields=fields)
 
         @self.mcp.tool(name='update_contact',
                        description='Update certain modifiable attributes of a contact in your ChartMogul account. '
@@ -165,7 +384,7 @@ class ChartMogulMcp:
                                    'as an object with a key and value), and should be included in a '
                                    'data dictionary.')
         async def update_contact(uuid: str, data: dict) -> Dict:
-            return api_client.update_contact(self.config, uuid, data)
+            return await self._call(api_client.update_contact, uuid, data)
 
         @self.mcp.tool(name='create_contact',
                        description='Create a contact in your ChartMogul account. '
@@ -176,7 +395,7 @@ class ChartMogulMcp:
                                    'custom attribute must be defined as an object with a key and value). '
                                    'All fields should be included in a data dictionary.')
         async def create_contact(data: dict) -> Dict:
-            return api_client.create_contact(self.config, data)
+            return await self._call(api_client.create_contact, data)
 
 
         ## customer_notes
@@ -184,14 +403,19 @@ class ChartMogulMcp:
                        description='Get a list of all customer notes in your ChartMogul account.'
                                    'We have a default limit of 20 customer notes, '
                                    'ask but discourage the user if they want more than 20 as this will exhaust AI tokens.'
-                                   'You can filter using the customer_uuid and the type (note or call).')
-        async def list_customer_notes(customer_uuid: str = None, type: str = None, limit: int = 20) -> list:
-            return api_client.list_customer_notes(self.config, customer_uuid, type, limit)
+                                   'You can filter using the customer_uuid and the type (note or call).'
+                                   + CONTINUATION_HELP + FIELDS_HELP)
+        async def list_customer_notes(customer_uuid: str = None, type: str = None, limit: int = 20,
+                                      continuation_token: str = None, fields: list[str] = None) -> Dict:
+            return await self._list(api_client.list_customer_notes, api_client.iter_customer_notes,
+                                    customer_uuid, type, None, limit, continuation_token=continuation_token,
+                                    fields=fields)
 
         @self.mcp.tool(name='retrieve_customer_note',
-                       description='Retrieve a customer note from your ChartMogul account using its UUID.')
-        async def retrieve_customer_note(uuid: str) -> Dict:
-            return api_client.retrieve_customer_note(self.config, uuid)
+                       description='Retrieve a customer note from your ChartMogul account using its UUID.'
+                                   + FIELDS_HELP)
+        async def retrieve_customer_note(uuid: str, fields: list[str] = None) -> Dict:
+            return await self._call(api_client.retrieve_customer_note, uuid, fields=fields)
 
         @self.mcp.tool(name='update_customer_note',
                        description='Update certain modifiable attributes of a customer note in your ChartMogul account. '
@@ -201,7 +425,7 @@ class ChartMogulMcp:
                                    'updated_at (an ISO 8601-formatted time in the past), and should be included in a '
                                    'data dictionary.')
         async def update_customer_note(uuid: str, data: dict) -> Dict:
-            return api_client.update_customer_note(self.config, uuid, data)
+            return await self._call(api_client.update_customer_note, uuid, data)
 
         @self.mcp.tool(name='create_customer_note',
                        description='Create a customer note in your ChartMogul account. '
@@ -212,7 +436,7 @@ class ChartMogulMcp:
                                    'created_at (an ISO 8601-formatted time in the past). '
                                    'All fields should be included in a data dictionary.')
         async def create_customer_note(data: dict) -> Dict:
-            return api_client.create_customer_note(self.config, data)
+            return await self._call(api_client.create_customer_note, data)
 
 
         ## opportunities
@@ -225,20 +449,29 @@ class ChartMogulMcp:
                                    'pipeline, pipeline_stage, estimated_close_date_on_or_after '
                                    '(lower limit of the estimated close date range; an ISO 8601-formatted date) and '
                                    'estimated_close_date_on_or_before (upper limit of the estimated close date range; '
-                                   'an ISO 8601-formatted date).')
+                                   'an ISO 8601-formatted date).' + CONTINUATION_HELP + FIELDS_HELP)
         async def list_opportunities(customer_uuid: str = None, owner: str = None, pipeline: str = None,
                                      pipeline_stage: str = None,
                                      estimated_close_date_on_or_after: datetime.datetime =None,
                                      estimated_close_date_on_or_before: datetime.datetime =None,
-                                     limit: int = 20) -> list:
-            return api_client.list_opportunities(self.config, customer_uuid, owner, pipeline, pipeline_stage,
-                                                 estimated_close_date_on_or_after, estimated_close_date_on_or_before,
-                                                 limit)
+                                     limit: int = 20, continuation_token: str = None, fields: list[str] = None) -> Dict:
+            return await self._list(api_client.list_opportunities, api_client.iter_opportunities,
+                                    customer_uuid, owner, pipeline, pipeline_stage,
+                                    estimated_close_date_on_or_after, estimated_close_date_on_or_before,
+                                    limit, continuation_token=continuation_token, fields=fields)
 
         @self.mcp.tool(name='retrieve_opportunity',
-                       description='Retrieve an opportunity from your ChartMogul account using its UUID.')
-        async def retrieve_opportunity(uuid: str) -> Dict:
-            return api_client.retrieve_opportunity(self.config, uuid)
+                       description='Retrieve an opportunity from your ChartMogul account using its UUID.' + FIELDS_HELP)
+        async def retrieve_opportunity(uuid: str, fields: list[str] = None) -> Dict:
+            return await self._call(api_client.retrieve_opportunity, uuid, fields=fields)
+
+        @self.mcp.tool(name='retrieve_opportunities',
+                       description='Retrieve several opportunities from your ChartMogul account using a list of their UUIDs, '
+                                   'in one call. Prefer this over repeated retrieve_opportunity calls. '
+                                   'Returns the opportunities found keyed by UUID in "results" and the UUIDs that failed '
+                                   'with their error in "errors".' + FIELDS_HELP)
+        async def retrieve_opportunities(uuids: list[str], fields: list[str] = None) -> Dict:
+            return await self._call(api_client.retrieve_opportunities, uuids, fields=fields)
 
         @self.mcp.tool(name='update_opportunity',
                        description='Update certain modifiable attributes of an opportunity in your ChartMogul account. '
@@ -249,7 +482,7 @@ class ChartMogulMcp:
                                    '(0-100), custom (list of custom attributes as key and value pairs) '
                                    'and should be included in a data dictionary.')
         async def update_opportunity(uuid: str, data: dict) -> Dict:
-            return api_client.update_opportunity(self.config, uuid, data)
+            return await self._call(api_client.update_opportunity, uuid, data)
 
         @self.mcp.tool(name='create_opportunity',
                        description='Create an opportunity in your ChartMogul account. '
@@ -265,7 +498,7 @@ class ChartMogulMcp:
                                    'custom (list of custom attributes as key and value pairs). '
                                    'All fields should be included in a data dictionary.')
         async def create_opportunity(data: dict) -> Dict:
-            return api_client.create_opportunity(self.config, data)
+            return await self._call(api_client.create_opportunity, data)
 
 
         ## plans
@@ -274,15 +507,26 @@ class ChartMogulMcp:
                                    'We have a default limit of 20 plans, '
                                    'ask but discourage the user if they want more than 20 as this will exhaust AI tokens.'
                                    'You can filter using the data_source_uuid, external_id, and system (the billing system '
-                                   'that the plan belongs to, e.g., Stripe, Recurly, Custom).')
+                                   'that the plan belongs to, e.g., Stripe, Recurly, Custom).' + CONTINUATION_HELP
+                                   + FIELDS_HELP)
         async def list_plans(data_source_uuid: str = None, external_id: str = None, system: str = None,
-                             limit: int = 20) -> list:
-            return api_client.list_plans(self.config, data_source_uuid, external_id, system, limit)
+                             limit: int = 20, continuation_token: str = None, fields: list[str] = None) -> Dict:
+            return await self._list(api_client.list_plans, api_client.iter_plans,
+                                    data_source_uuid, external_id, system, limit,
+                                    continuation_token=continuation_token, fields=fields)
 
         @self.mcp.tool(name='retrieve_plan',
-                       description='Retrieve a plan from your ChartMogul account using its UUID.')
-        async def retrieve_plan(uuid: str) -> Dict:
-            return api_client.retrieve_plan(self.config, uuid)
+                       description='Retrieve a plan from your ChartMogul account using its UUID.' + FIELDS_HELP)
+        async def retrieve_plan(uuid: str, fields: list[str] = None) -> Dict:
+            return await self._call(api_client.retrieve_plan, uuid, fields=fields)
+
+        @self.mcp.tool(name='retrieve_plans',
+                       description='Retrieve several plans from your ChartMogul account using a list of their UUIDs, '
+                                   'in one call. Prefer this over repeated retrieve_plan calls. '
+                                   'Returns the plans found keyed by UUID in "results" and the UUIDs that failed '
+                                   'with their error in "errors".' + FIELDS_HELP)
+        async def retrieve_plans(uuids: list[str], fields: list[str] = None) -> Dict:
+            return await self._call(api_client.retrieve_plans, uuids, fields=fields)
 
         @self.mcp.tool(name='update_plan',
                        description='Update certain modifiable attributes of a plan in your ChartMogul account. '
@@ -291,7 +535,7 @@ class ChartMogulMcp:
                                    'e.g., 6 for a half-yearly plan), interval_unit (day, month or year) '
                                    'and should be included in a data dictionary.')
         async def update_plan(uuid: str, data: dict) -> Dict:
-            return api_client.update_plan(self.config, uuid, data)
+            return await self._call(api_client.update_plan, uuid, data)
 
         @self.mcp.tool(name='create_plan',
                        description='Create a plan in your ChartMogul account. '
@@ -302,27 +546,32 @@ class ChartMogulMcp:
                                    'Optional field: external_id. '
                                    'All fields should be included in a data dictionary.')
         async def create_plan(data: dict) -> Dict:
-            return api_client.create_plan(self.config, data)
+            return await self._call(api_client.create_plan, data)
 
 
         ## plan groups
         @self.mcp.tool(name='list_plan_groups',
                        description='Get a list of all plan groups in your ChartMogul account.'
                                    'We have a default limit of 20 plan groups, '
-                                   'ask but discourage the user if they want more than 20 as this will exhaust AI tokens.')
-        async def list_plan_groups(limit: int = 20) -> list:
-            return api_client.list_plan_groups(self.config, limit)
+                                   'ask but discourage the user if they want more than 20 as this will exhaust AI tokens.'
+                                   + CONTINUATION_HELP + FIELDS_HELP)
+        async def list_plan_groups(limit: int = 20, continuation_token: str = None, fields: list[str] = None) -> Dict:
+            return await self._list(api_client.list_plan_groups, api_client.iter_plan_groups,
+                                    limit, continuation_token=continuation_token, fields=fields)
 
         ## plan groups
         @self.mcp.tool(name='list_plan_group_plans',
-                       description='Get a list of all plans in a plan group using its UUID.')
-        async def list_plan_group_plans(uuid: str = None, limit: int = 20) -> list:
-            return api_client.list_plan_group_plans(self.config, uuid, limit)
+                       description='Get a list of all plans in a plan group using its UUID.' + CONTINUATION_HELP
+                                   + FIELDS_HELP)
+        async def list_plan_group_plans(uuid: str = None, limit: int = 20, continuation_token: str = None,
+                                        fields: list[str] = None) -> Dict:
+            return await self._list(api_client.list_plan_group_plans, api_client.iter_plan_group_plans,
+                                    uuid, limit, continuation_token=continuation_token, fields=fields)
 
         @self.mcp.tool(name='retrieve_plan_group',
-                       description='Retrieve a plan group from your ChartMogul account using its UUID.')
-        async def retrieve_plan_group(uuid: str) -> Dict:
-            return api_client.retrieve_plan_group(self.config, uuid)
+                       description='Retrieve a plan group from your ChartMogul account using its UUID.' + FIELDS_HELP)
+        async def retrieve_plan_group(uuid: str, fields: list[str] = None) -> Dict:
+            return await self._call(api_client.retrieve_plan_group, uuid, fields=fields)
 
         @self.mcp.tool(name='update_plan_group',
                        description='Update certain modifiable attributes of a plan group in your ChartMogul account. '
@@ -330,7 +579,7 @@ class ChartMogulMcp:
                                    '(array of the uuids of the plans to be added to the plan group) '
                                    'and should be included in a data dictionary.')
         async def update_plan_group(uuid: str, data: dict) -> Dict:
-            return api_client.update_plan_group(self.config, uuid, data)
+            return await self._call(api_client.update_plan_group, uuid, data)
 
         @self.mcp.tool(name='create_plan_group',
                        description='Create a plan group in your ChartMogul account. '
@@ -339,7 +588,7 @@ class ChartMogulMcp:
                                    '(array of the uuids of the plans to be added to the plan group) '
                                    'and should be included in a data dictionary.')
         async def create_plan_group(data: dict) -> Dict:
-            return api_client.create_plan_group(self.config, data)
+            return await self._call(api_client.create_plan_group, data)
 
 
         ## tasks
@@ -352,18 +601,28 @@ class ChartMogulMcp:
                                    '(lower limit of the due date range; an ISO 8601-formatted date), '
                                    'estimated_close_date_on_or_before (upper limit of the due date range; '
                                    'an ISO 8601-formatted date), completed (true or false).'
-                       )
+                                   + CONTINUATION_HELP + FIELDS_HELP)
         async def list_tasks(customer_uuid: str = None, assignee: str = None,
                              due_date_on_or_after: datetime.datetime = None,
                              estimated_close_date_on_or_before: datetime.datetime = None, completed: bool = None,
-                             limit: int = 20) -> list:
-            return api_client.list_tasks(self.config, customer_uuid, assignee, due_date_on_or_after,
-                                         estimated_close_date_on_or_before, completed, limit)
+                             limit: int = 20, continuation_token: str = None, fields: list[str] = None) -> Dict:
+            return await self._list(api_client.list_tasks, api_client.iter_tasks,
+                                    customer_uuid, assignee, due_date_on_or_after,
+                                    estimated_close_date_on_or_before, completed, limit,
+                                    continuation_token=continuation_token, fields=fields)
 
         @self.mcp.tool(name='retrieve_task',
-                       description='Retrieve a task from your ChartMogul account using its UUID.')
-        async def retrieve_task(uuid: str) -> Dict:
-            return api_client.retrieve_task(self.config, uuid)
+                       description='Retrieve a task from your ChartMogul account using its UUID.' + FIELDS_HELP)
+        async def retrieve_task(uuid: str, fields: list[str] = None) -> Dict:
+            return await self._call(api_client.retrieve_task, uuid, fields=fields)
+
+        @self.mcp.tool(name='retrieve_tasks',
+                       description='Retrieve several tasks from your ChartMogul account using a list of their UUIDs, '
+                                   'in one call. Prefer this over repeated retrieve_task calls. '
+                                   'Returns the tasks found keyed by UUID in "results" and the UUIDs that failed '
+                                   'with their error in "errors".' + FIELDS_HELP)
+        async def retrieve_tasks(uuids: list[str], fields: list[str] = None) -> Dict:
+            return await self._call(api_client.retrieve_tasks, uuids, fields=fields)
 
         @self.mcp.tool(name='update_task',
                        description='Update certain modifiable attributes of a task in your ChartMogul account. '
@@ -373,7 +632,7 @@ class ChartMogulMcp:
                                    'completed_at (an ISO 8601-formatted date) '
                                    'and should be included in a data dictionary.')
         async def update_task(uuid: str, data: dict) -> Dict:
-            return api_client.update_task(self.config, uuid, data)
+            return await self._call(api_client.update_task, uuid, data)
 
         @self.mcp.tool(name='create_task',
                        description='Create a task in your ChartMogul account. '
@@ -384,7 +643,7 @@ class ChartMogulMcp:
                                    'Optional field: completed_at (an ISO 8601-formatted date).'
                                    'All fields should be included in a data dictionary.')
         async def create_task(data: dict) -> Dict:
-            return api_client.create_task(self.config, data)
+            return await self._call(api_client.create_task, data)
 
         ## metrics api
         @self.mcp.tool(name='all_metrics',
@@ -401,7 +660,7 @@ class ChartMogulMcp:
                                    'and are an integer number of cents. Divide by 100 to obtain the actual value.')
         async def all_metrics(start_date: str, end_date: str, interval: str, geo: str = None,
                               plans: str = None) -> list:
-            return api_client.all_metrics(self.config, start_date, end_date, interval, geo, plans)
+            return await self._call(api_client.all_metrics, start_date, end_date, interval, geo, plans)
 
         @self.mcp.tool(name='mrr_metrics',
                        description='Retrieve Monthly Recurring Revenue (MRR) metrics, for the specified time period, interval and filters. '
@@ -415,7 +674,7 @@ class ChartMogulMcp:
                                    'and are an integer number of cents. Divide by 100 to obtain the actual value.')
         async def mrr_metrics(start_date: str, end_date: str, interval: str, geo: str = None,
                               plans: str = None) -> list:
-            return api_client.mrr_metrics(self.config, start_date, end_date, interval, geo, plans)
+            return await self._call(api_client.mrr_metrics, start_date, end_date, interval, geo, plans)
 
         @self.mcp.tool(name='arr_metrics',
                        description='Retrieve Annualized Run Rate (ARR) metrics, for the specified time period, interval and filters. '
@@ -429,7 +688,7 @@ class ChartMogulMcp:
                                    'and are an integer number of cents. Divide by 100 to obtain the actual value.')
         async def arr_metrics(start_date: str, end_date: str, interval: str, geo: str = None,
                               plans: str = None) -> list:
-            return api_client.arr_metrics(self.config, start_date, end_date, interval, geo, plans)
+            return await self._call(api_client.arr_metrics, start_date, end_date, interval, geo, plans)
 
         @self.mcp.tool(name='arpa_metrics',
                        description='Retrieve Average Revenue Per Account (ARPA) metrics, for the specified time period, interval and filters. '
@@ -443,7 +702,7 @@ class ChartMogulMcp:
                                    'and are an integer number of cents. Divide by 100 to obtain the actual value.')
         async def arpa_metrics(start_date: str, end_date: str, interval: str, geo: str = None,
                                plans: str = None) -> list:
-            return api_client.arpa_metrics(self.config, start_date, end_date, interval, geo, plans)
+            return await self._call(api_client.arpa_metrics, start_date, end_date, interval, geo, plans)
 
         @self.mcp.tool(name='asp_metrics',
                        description='Retrieve Average Sale Price (ASP) metrics, for the specified time period, interval and filters. '
@@ -457,7 +716,7 @@ class ChartMogulMcp:
                                    'and are an integer number of cents. Divide by 100 to obtain the actual value.')
         async def asp_metrics(start_date: str, end_date: str, interval: str, geo: str = None,
                               plans: str = None) -> list:
-            return api_client.asp_metrics(self.config, start_date, end_date, interval, geo, plans)
+            return await self._call(api_client.asp_metrics, start_date, end_date, interval, geo, plans)
 
         @self.mcp.tool(name='customer_count_metrics',
                        description='Retrieve customer count metrics, for the specified time period, interval and filters. '
@@ -469,7 +728,7 @@ class ChartMogulMcp:
                                    'e.g., Silver%20plan,Gold%20plan,Enterprise%20plan).')
         async def customer_count_metrics(start_date: str, end_date: str, interval: str, geo: str = None,
                                          plans: str = None) -> list:
-            return api_client.customer_count_metrics(self.config, start_date, end_date, interval, geo, plans)
+            return await self._call(api_client.customer_count_metrics, start_date, end_date, interval, geo, plans)
 
         @self.mcp.tool(name='customer_churn_rate_metrics',
                        description='Retrieve customer churn rate metrics, for the specified time period, interval and filters. '
@@ -481,7 +740,7 @@ class ChartMogulMcp:
                                    'e.g., Silver%20plan,Gold%20plan,Enterprise%20plan).')
         async def customer_churn_rate_metrics(start_date: str, end_date: str, interval: str, geo: str = None,
                                               plans: str = None) -> list:
-            return api_client.customer_churn_rate_metrics(self.config, start_date, end_date, interval, geo, plans)
+            return await self._call(api_client.customer_churn_rate_metrics, start_date, end_date, interval, geo, plans)
 
         @self.mcp.tool(name='mrr_churn_rate_metrics',
                        description='Retrieve Net MRR Churn Rate metrics, for the specified time period, interval and filters. '
@@ -493,7 +752,7 @@ class ChartMogulMcp:
                                    'e.g., Silver%20plan,Gold%20plan,Enterprise%20plan).')
         async def mrr_churn_rate_metrics(start_date: str, end_date: str, interval: str, geo: str = None,
                                          plans: str = None) -> list:
-            return api_client.mrr_churn_rate_metrics(self.config, start_date, end_date, interval, geo, plans)
+            return await self._call(api_client.mrr_churn_rate_metrics, start_date, end_date, interval, geo, plans)
 
         @self.mcp.tool(name='ltv_metrics',
                        description='Retrieve Customer Lifetime Value (LTV) metrics, for the specified time period, and filters. '
@@ -506,7 +765,7 @@ class ChartMogulMcp:
                                    'and are an integer number of cents. Divide by 100 to obtain the actual value.')
         async def ltv_metrics(start_date: str, end_date: str, interval: str, geo: str = None,
                               plans: str = None) -> list:
-            return api_client.ltv_metrics(self.config, start_date, end_date, interval, geo, plans)
+            return await self._call(api_client.ltv_metrics, start_date, end_date, interval, geo, plans)
 
         ## subscription events
         @self.mcp.tool(name='list_subscription_events',
@@ -521,15 +780,17 @@ class ChartMogulMcp:
                                    'subscription_updated, subscription_update_scheduled, '
                                    'scheduled_subscription_update_retracted, subscription_event_retracted), event_date '
                                    '(an ISO 8601 formatted time), effective_date (an ISO 8601 formatted time), '
-                                   'plan_external_id.')
+                                   'plan_external_id.' + CONTINUATION_HELP + FIELDS_HELP)
         async def list_subscription_events(data_source_uuid: str = None, external_id: str = None, customer_external_id: str = None,
                                            subscription_external_id: str = None, event_type: str = None,
                                            event_date: datetime.datetime = None,
                                            effective_date: datetime.datetime = None, plan_external_id: str = None,
-                                           limit: int = 20) -> list:
-            return api_client.list_subscription_events(self.config, data_source_uuid, external_id, customer_external_id,
-                                                       subscription_external_id, event_type, event_date, effective_date,
-                                                       plan_external_id, limit)
+                                           limit: int = 20, continuation_token: str = None,
+                                           fields: list[str] = None) -> Dict:
+            return await self._list(api_client.list_subscription_events, api_client.iter_subscription_events,
+                                    data_source_uuid, external_id, customer_external_id,
+                                    subscription_external_id, event_type, event_date, effective_date,
+                                    plan_external_id, limit, continuation_token=continuation_token, fields=fields)
 
         ## invoices
         @self.mcp.tool(name='list_invoices',
@@ -537,11 +798,13 @@ class ChartMogulMcp:
                                    'We have a default limit of 20 invoices, '
                                    'ask but discourage the user if they want more than 20 as this will exhaust AI tokens.'
                                    'You can filter using the data_source_uuid, invoice external_id, customer_uuid and '
-                                   'validation_type (one of valid, invalid or all).')
+                                   'validation_type (one of valid, invalid or all).' + CONTINUATION_HELP + FIELDS_HELP)
         async def list_invoices(data_source_uuid: str = None, external_id: str = None, customer_uuid: str = None,
-                                validation_type: str = None, limit: int = 20) -> list:
-            return api_client.list_invoices(self.config, data_source_uuid, external_id, customer_uuid, validation_type,
-                                            limit)
+                                validation_type: str = None, limit: int = 20, continuation_token: str = None,
+                                fields: list[str] = None) -> Dict:
+            return await self._list(api_client.list_invoices, api_client.iter_invoices,
+                                    data_source_uuid, external_id, customer_uuid, validation_type,
+                                    limit, continuation_token=continuation_token, fields=fields)
 
         ## activities
         @self.mcp.tool(name='list_activities',
@@ -552,17 +815,69 @@ class ChartMogulMcp:
                                    '(an ISO 8601 formatted time), type (one of new_biz, reactivation, expansion, '
                                    'contraction or churn) and order (Setting value as -date returns results in '
                                    'descending order with the latest activity returned first, while date returns '
-                                   'results in ascending order.). ')
+                                   'results in ascending order.). ' + CONTINUATION_HELP +
+                                   ' If has_more is true without a continuation_token, narrow start_date '
+                                   'and end_date to the records not returned yet.' + FIELDS_HELP)
         async def list_activities(start_date: datetime.datetime = None, end_date: datetime.datetime = None,
-                                  type: str = None, order: str = None, limit: int = 20) -> list:
-            return api_client.list_activities(self.config, start_date, end_date, type, order, limit)
-
-
-    def run(self):
-        """Start the MCP server."""
+                                  type: str = None, order: str = None, limit: int = 20,
+                                  continuation_token: str = None, fields: list[str] = None) -> Dict:
+            return await self._list(api_client.list_activities, api_client.iter_activities,
+                                    start_date, end_date, type, order, limit,
+                                    continuation_token=continuation_token, fields=fields)
+
+
+    @staticmethod
+    def http_transport(transport=None, stateless=False):
+        """
+        Pick the HTTP transport to serve, checking that it can run stateless if asked to.
+
+        transport is sse or streamable-http; it defaults to MCP_TRANSPORT if that is one of them,
+        and to streamable-http otherwise.
+
+        Returns: The transport; raises ValueError if it is unknown or cannot run stateless.
+        """
+        if transport is None:
+            transport = utils.MCP_TRANSPORT if utils.MCP_TRANSPORT in HTTP_TRANSPORTS else 'streamable-http'
+        if transport not in HTTP_TRANSPORTS:
+            raise ValueError(f"Unknown HTTP transport: {transport}, expected one of {', '.join(HTTP_TRANSPORTS)}.")
+        if transport == 'sse' and stateless:
+            raise ValueError("SSE sessions are bound to the process that opened them; "
+                             "use the streamable-http transport for several workers.")
+        return transport
+
+    def http_app(self, transport=None, stateless=False):
+        """
+        Build the ASGI app serving this server over HTTP, to any number of concurrent sessions.
+
+        transport is sse or streamable-http, see http_transport. Stateless streamable HTTP sessions
+        keep no state between requests, so that any worker process can answer any request.
+        Requests with an X-ChartMogul-Token header work on the account of that API key, the others
+        on that of CHARTMOGUL_TOKEN.
+
+        Returns: An ASGI app.
+        """
+        if self.http_transport(transport, stateless) == 'sse':
+            return TokenMiddleware(self.mcp.sse_app())
+        if stateless:
+            self.mcp.settings.stateless_http = True
+        return TokenMiddleware(self.mcp.streamable_http_app())
+
+    def run(self, transport=None):
+        """Start the MCP server on stdio, or over HTTP with MCP_WORKERS worker processes."""
+        transport = transport or utils.MCP_TRANSPORT
         try:
-            LOGGER.info("Running MCP Server for ChartMogul API interactions")
-            self.mcp.run(transport="stdio")
+            LOGGER.info(f"Running MCP Server for ChartMogul API interactions on {transport}")
+            if transport == 'stdio':
+                self.mcp.run(transport="stdio")
+                return
+            import uvicorn
+            if utils.MCP_WORKERS > 1:
+                # Workers are separate processes, which import chartmogul_mcp.asgi and build their own server.
+                os.environ['CHARTMOGUL_MCP_TRANSPORT'] = self.http_transport(transport, stateless=True)
+                uvicorn.run("chartmogul_mcp.asgi:app", host=utils.MCP_HOST, port=utils.MCP_PORT,
+                            workers=utils.MCP_WORKERS)
+            else:
+                uvicorn.run(self.http_app(transport), host=utils.MCP_HOST, port=utils.MCP_PORT)
         except Exception as e:
             LOGGER.error(f"Fatal Error in ChartMogul MCP Server: {str(e)}", exc_info=True)
             sys.exit(1)
@@ -0,0 +1,327 @@
+import base64
+import functools
+import hashlib
+import itertools
+import json
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from chartmogul_mcp import utils
+
+# Largest page the ChartMogul list endpoints accept.
+MAX_PER_PAGE = 200
+
+_DONE = object()
+
+
+@functools.lru_cache(maxsize=None)
+def _prefetch_pool():
+    # Threads fetching pages ahead, shared by all listings: every tool call running at the same time
+    # walks at most BATCH_PARALLELISM listings at once.
+    return ThreadPoolExecutor(max_workers=utils.MAX_WORKERS * utils.BATCH_PARALLELISM,
+                              thread_name_prefix="chartmogul-prefetch")
+
+
+def _scope_digest(scope):
+    return hashlib.sha256(repr(scope).encode()).hexdigest()[:16]
+
+
+def continuation_token(scope, cursor):
+    """
+    Wrap a cursor into an opaque token that is only accepted back for the same scope.
+
+    scope is any value identifying the listing, such as the tool name and its filters.
+
+    Returns: A URL-safe string.
+    """
+    payload = json.dumps([_scope_digest(scope), cursor], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def resume_cursor(scope, token):
+    """
+    Unwrap the cursor of a continuation token made by continuation_token for the same scope.
+
+    Returns: The cursor; raises ValueError if the token is malformed or was made for another scope.
+    """
+    try:
+        digest, cursor = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+    except (ValueError, TypeError):
+        raise ValueError("Malformed continuation token.") from None
+    if digest != _scope_digest(scope):
+        raise ValueError("The continuation token belongs to another listing; "
+                         "pass the same filters as in the call that returned it.")
+    return cursor
+
+
+class PageResult(list):
+    """
+    A list of records that also carries the number of API requests made to fetch them.
+
+    `cursor` resumes the listing after the last record and `has_more` tells whether there is
+    anything left to resume. If a page failed, `error` holds its message; the records are then
+    those of the pages before it, and `cursor` resumes at the failed page.
+    """
+
+    def __init__(self, records=(), requests=0, cursor=None, has_more=False, error=None):
+        super().__init__(records)
+        self.requests = requests
+        self.cursor = cursor
+        self.has_more = has_more
+        self.error = error
+
+
+class Paginator:
+    """
+    Walk a cursor-paginated ChartMogul endpoint, parsing its entries as they arrive.
+
+    fetch_page is called with `cursor` and `per_page` keyword arguments and returns the
+    SDK response for one page; root_key names the attribute that holds its entries, and
+    parse turns each entry into the record handed out. Iterating a Paginator yields the
+    records one at a time, fetching further pages only as they are needed, so a whole
+    export can be consumed in constant memory.
+    Pages are as large as the endpoint allows, the last one only asks for what is still
+    missing to reach `limit` (None for no limit), and no more than `limit` entries are
+    ever parsed. The number of requests made is kept in `requests`.
+    The walk starts at `cursor` (None for the first page); as pages are handed out, `cursor`
+    and `has_more` move on to the page that would come next, so a walk that stopped, or
+    failed, can be resumed by a new Paginator started at `cursor`.
+    With a prefetch depth above 0, a thread of a shared pool keeps fetching while the caller
+    is still busy with the previous page, buffering up to `prefetch` pages; if no thread of the
+    pool is free, the pages are fetched one after the other by the caller. `budget`, if set, is
+    a function returning how many records the caller may still need from the whole walk;
+    fetching ahead pauses while the records fetched so far cover it, until the caller asks for a
+    page that is not buffered.
+    """
+
+    def __init__(self, fetch_page, root_key, limit, parse=None, max_per_page=MAX_PER_PAGE, prefetch=0,
+                 cursor=None):
+        self.fetch_page = fetch_page
+        self.root_key = root_key
+        self.limit = limit
+        self.parse = parse
+        self.max_per_page = max_per_page
+        self.prefetch = prefetch
+        self.requests = 0
+        self.cursor = cursor
+        self.has_more = True
+        self.budget = None
+        self.fetched = 0
+
+    def __iter__(self):
+        for records in self.pages():
+            yield from records
+
+    def pages(self):
+        """
+        Fetch the pages one after the other.
+
+        Returns: A generator of lists with the parsed records of each page.
+        """
+        raw_pages = self._prefetched() if self.prefetch > 0 else self._walk()
+        for entries, cursor, has_more in raw_pages:
+            records = [self.parse(entry) for entry in entries] if self.parse else list(entries)
+            self.cursor, self.has_more = cursor, has_more
+            if records:
+                yield records
+
+    def collect(self):
+        """
+        Fetch and parse records until `limit` of them are collected or the endpoint runs out.
+
+        An error on the first page is raised. An error on a later page ends the walk, and
+        the records collected so far are returned with the error.
+
+        Returns: A PageResult with at most `limit` parsed records.
+        """
+        records = PageResult()
+        try:
+            for page in self.pages():
+                records.extend(page)
+        except Exception as e:
+            if not records:
+                raise
+            records.error = str(e)
+        records.requests = self.requests
+        records.cursor = self.cursor
+        records.has_more = self.has_more
+        return records
+
+    def _remaining(self, total):
+        return self.max_per_page if self.limit is None else self.limit - total
+
+    def _walk(self):
+        has_more = True
+        cursor = self.cursor
+        total = 0
+        while has_more and self._remaining(total) > 0:
+            remaining = self._remaining(total)
+            page = self.fetch_page(cursor=cursor, per_page=min(self.max_per_page, remaining))
+            self.requests += 1
+            # Count what actually arrived: pages can be short, and entries past the limit are
+            # dropped here so they are never parsed.
+            entries = getattr(page, self.root_key)[:remaining]
+            if not entries:
+                # Nothing left: report the end of the listing, without a page to hand out.
+                yield [], None, False
+                return
+            total += len(entries)
+            self.fetched += len(entries)
+            has_more = page.has_more
+            cursor = page.cursor
+            yield entries, cursor, has_more
+
+    def _prefetched(self):
+        pages = queue.Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+        waiting = threading.Event()
+
+        def put(item):
+            # Give up once the consumer is gone, instead of blocking on a full queue forever.
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    # A caller waiting for a page has one now.
+                    waiting.clear()
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def covered():
+            # Stop fetching ahead while the fetched records cover the budget, unless the caller waits for a page.
+            while self.budget is not None and not waiting.is_set() and self.fetched >= self.budget():
+                if stop.wait(0.01):
+                    return False
+            return True
+
+        def produce():
+            try:
+                for page in self._walk():
+                    if not put(page) or not covered():
+                        return
+            except Exception as e:
+                put(e)
+                return
+            put(_DONE)
+
+        producer = _prefetch_pool().submit(produce)
+        try:
+            while True:
+                if pages.empty():
+                    waiting.set()
+                try:
+                    item = pages.get(timeout=0.05)
+                except queue.Empty:
+                    # With every pool thread busy, the producer may not run for a long time: if it has
+                    # not started yet, walk the pages here instead of waiting for it.
+                    if producer.cancel():
+                        yield from self._walk()
+                        return
+                    continue
+                waiting.clear()
+                if item is _DONE:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+
+
+class ShardedPaginator(Paginator):
+    """
+    Walk several Paginators over disjoint parts of one listing concurrently, such as date ranges.
+
+    The shards are given in the order of the listing and each walks its own cursor chain, at most
+    `parallelism` at a time; their records are handed out shard after shard, so the listing keeps
+    its order. A record whose `key` was already handed out is dropped, as shards may share a
+    boundary or a record, and parse, if given, is applied to the records that are kept. `limit`
+    applies to the whole listing: a shard stops walking ahead once it and the shards before it
+    hold enough records, and is only walked on if records turn out to be missing when its turn comes.
+    shards is a list of Paginators, or a function returning one that is called when the walk
+    starts. A walk over several shards cannot be resumed from one cursor, so `cursor` stays None;
+    with a single shard, `cursor` follows that shard's.
+    """
+
+    def __init__(self, shards, limit, key=None, parallelism=8, parse=None):
+        super().__init__(None, None, limit, parse=parse)
+        self.shards = shards
+        self.key = key
+        self.parallelism = parallelism
+
+    def pages(self):
+        """
+        Walk all shards concurrently and hand out their pages in shard order.
+
+        Returns: A generator of lists with the parsed records of each page.
+        """
+        if callable(self.shards):
+            self.shards = self.shards()
+        stop = threading.Event()
+        lock = threading.Lock()
+        fetched = [0] * len(self.shards)
+
+        def budget(index):
+            # What a shard may still have to supply, given what the shards before it fetched, buffered pages included.
+            return self.limit - sum(shard.fetched for shard in self.shards[:index])
+
+        if self.limit is not None:
+            for index, shard in enumerate(self.shards):
+                shard.budget = functools.partial(budget, index)
+
+        def walk(index):
+            # The pages a shard fetched ahead, the error that ended it, and its unfinished walk if it stopped early.
+            walker = self.shards[index].pages()
+            pages = []
+            try:
+                for page in walker:
+                    pages.append(page)
+                    with lock:
+                        fetched[index] += len(page)
+                        enough = self.limit is not None and sum(fetched[:index + 1]) >= self.limit
+                    if enough or stop.is_set():
+                        return pages, None, walker
+            except Exception as e:
+                return pages, e, None
+            return pages, None, None
+
+        seen = set()
+        total = 0
+        pool = ThreadPoolExecutor(max_workers=max(1, min(self.parallelism, len(self.shards))),
+                                  thread_name_prefix="chartmogul-shard")
+        futures = []
+        try:
+            futures.extend(pool.submit(walk, index) for index in range(len(self.shards)))
+            for index, future in enumerate(futures):
+                pages, error, walker = future.result()
+                if walker is not None:
+                    pages = itertools.chain(pages, walker)
+                for page in pages:
+                    self.requests = sum(shard.requests for shard in self.shards)
+                    if self.key is not None:
+                        page = [record for record in page if record.get(self.key) not in seen]
+                        seen.update(record.get(self.key) for record in page)
+                    kept = page if self.limit is None else page[:self.limit - total]
+                    total += len(kept)
+                    if kept:
+                        yield [self.parse(record) for record in kept] if self.parse else kept
+                    if self.limit is not None and total >= self.limit:
+                        # Whatever was not handed out, in this shard or the ones after it, is left over.
+                        self.has_more = (len(kept) < len(page) or self.shards[index].has_more
+                                         or index < len(futures) - 1)
+                        return
+                if error is not None:
+                    raise error
+            self.has_more = False
+        finally:
+            stop.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+            # Release the prefetching threads of shards that stopped walking ahead.
+            for future in futures:
+                if future.done() and not future.cancelled() and future.result()[2] is not None:
+                    future.result()[2].close()
+            self.requests = sum(shard.requests for shard in self.shards)
+            if len(self.shards) == 1:
+                self.cursor = self.shards[0].cursor
@@ -0,0 +1,175 @@
+"""
+Client-side rate limiting and retries for ChartMogul API requests.
+
+Every request takes a token from one shared bucket refilled at `rate` tokens per second,
+so concurrent tool calls and bulk operations together stay under the API's rate limit
+instead of running into it. When the API still answers 429, the whole bucket is paused
+for the Retry-After delay and the request is retried; reads are also retried after
+server and network errors. Retries wait a jittered exponential backoff.
+"""
+import random
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from chartmogul_mcp.utils import LOGGER
+
+# urllib3 reports a status the SDK's own retry policy gave up on as "too many 429 error responses".
+_EXHAUSTED_STATUS = re.compile(r"too many (\d{3}) error responses")
+_RETRY_STATUSES = (429, 500, 502, 503, 504, 520, 524)
+_network_errors = None
+
+
+def _is_network_error(error):
+    global _network_errors
+    if _network_errors is None:
+        # Imported here rather than at start-up, where requests would only slow the server down.
+        import httpx
+        import requests
+        _network_errors = (requests.ConnectionError, requests.Timeout, httpx.TransportError)
+    return isinstance(error, _network_errors)
+
+
+def _response_of(error):
+    # The SDK and the transport keep the HTTP error, which holds the response, as the cause of their APIError.
+    while error is not None:
+        response = getattr(error, 'response', None)
+        if response is not None and hasattr(response, 'status_code'):
+            return response
+        error = error.__cause__
+    return None
+
+
+def http_status(error):
+    """
+    Find the HTTP status behind an exception raised for a ChartMogul API request.
+
+    Returns: The status code, or None if the request did not get a response.
+    """
+    response = _response_of(error)
+    if response is not None:
+        return response.status_code
+    match = _EXHAUSTED_STATUS.search(str(error))
+    return int(match.group(1)) if match else None
+
+
+def retry_after(error):
+    """
+    Read the Retry-After header of the response behind an exception, in seconds or as an HTTP date.
+
+    Returns: The number of seconds to wait, or None if there is no usable header.
+    """
+    response = _response_of(error)
+    value = response.headers.get('Retry-After') if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    A token bucket shared by all API requests, with retries of throttled and failed requests.
+
+    `rate` is the number of requests per second (0 disables limiting) and `burst` the number of
+    requests that may go out at once after a quiet period. `waiting` is the current number of
+    requests queued for a token; `requests`, `throttled` (429 responses) and `retries` count events.
+    """
+
+    def __init__(self, rate=25.0, burst=25, max_retries=5, backoff=0.5, max_backoff=30.0):
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.waiting = 0
+        self.requests = 0
+        self.throttled = 0
+        self.retries = 0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Wait until the bucket has a token and the API is not paused, then take the token."""
+        with self._lock:
+            self.waiting += 1
+        try:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    if self.rate > 0:
+                        self._tokens = min(float(self.burst),
+                                           self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if now >= self._paused_until and (self.rate <= 0 or self._tokens >= 1):
+                        self._tokens -= 1
+                        self.requests += 1
+                        return
+                    delay = max(self._paused_until - now,
+                                (1 - self._tokens) / self.rate if self.rate > 0 else 0.0)
+                time.sleep(delay)
+        finally:
+            with self._lock:
+                self.waiting -= 1
+
+    def pause(self, seconds):
+        """Hold back all requests for `seconds`, and let them resume one token at a time."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = min(self._tokens, 0.0)
+
+    def call(self, func, idempotent=True):
+        """
+        Call func() once a token is available, retrying it when the API throttles or fails.
+
+        429 responses are retried for every request, as the API did not process them; server
+        and network errors only for idempotent ones.
+
+        Returns: The result of func().
+        """
+        attempt = 0
+        while True:
+            self.acquire()
+            try:
+                return func()
+            except Exception as e:
+                status = http_status(e)
+                if status == 429:
+                    wait = retry_after(e)
+                    wait = wait if wait is not None else self._backoff(attempt)
+                    with self._lock:
+                        self.throttled += 1
+                    LOGGER.warning(f"ChartMogul API rate limit hit, pausing requests for {wait:.1f}s.")
+                    self.pause(wait)
+                elif not (idempotent and (status in _RETRY_STATUSES or _is_network_error(e))):
+                    raise
+                if attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                with self._lock:
+                    self.retries += 1
+                if status != 429:
+                    time.sleep(self._backoff(attempt))
+
+    def stats(self):
+        """
+        Report the limiter's state.
+
+        Returns: A dict with the number of queued requests, requests sent, 429 responses and retries.
+        """
+        with self._lock:
+            return {"waiting": self.waiting, "requests": self.requests,
+                    "throttled": self.throttled, "retries": self.retries}
+
+    def _backoff(self, attempt):
+        # Full jitter: a random delay up to the exponential backoff, so retries of parallel requests spread out.
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
@@ -0,0 +1,263 @@
+"""
+Conversion of chartmogul SDK objects into plain, JSON-ready Python data.
+
+The output is the same as that of the original recursive parse_object: dates and
+datetimes become ISO strings, objects become dicts of their attributes, lists are
+converted item by item, and anything else is passed through unchanged. Instead of
+inspecting every value, a field plan is compiled once per SDK class from its
+marshmallow schema: an object's attributes are copied in one go, date fields are
+formatted by name, and only nested values and attributes outside the schema go
+through type dispatch, on an explicit stack rather than by recursion.
+"""
+import datetime
+import functools
+
+from marshmallow import fields
+
+# How a value is converted, decided once per type and once per schema field.
+# The kinds are non-zero so that cache misses are falsy.
+_SCALAR, _ISO, _OBJECT, _LIST = range(1, 5)
+
+_SCALAR_FIELDS = (fields.String, fields.Number, fields.Boolean)
+_DATE_FIELDS = (fields.DateTime, fields.Date)
+
+_type_kinds = {}
+_field_plans = {}
+_json_plans = {}
+
+
+def _type_kind(cls):
+    kind = _type_kinds.get(cls)
+    if kind is None:
+        # Same precedence as parse_object: dates, then anything with a __dict__, then lists.
+        if issubclass(cls, datetime.date):
+            kind = _ISO
+        elif cls.__dictoffset__ != 0:
+            kind = _OBJECT
+        elif issubclass(cls, list):
+            kind = _LIST
+        else:
+            kind = _SCALAR
+        _type_kinds[cls] = kind
+    return kind
+
+
+def _field_plan(cls):
+    # (all schema fields, date fields, fields needing type dispatch) of an SDK class.
+    plan = _field_plans.get(cls)
+    if plan is None:
+        # Resources keep a schema instance in _schema; nested data objects only declare _Schema.
+        schema = getattr(cls, '_schema', None)
+        if schema is None and isinstance(getattr(cls, '_Schema', None), type):
+            schema = cls._Schema()
+        # Loaded objects hold each field under its attribute name, which defaults to the field name.
+        schema_fields = {field.attribute or name: field for name, field in getattr(schema, 'fields', {}).items()}
+        dates = tuple(name for name, field in schema_fields.items() if isinstance(field, _DATE_FIELDS))
+        others = tuple(name for name, field in schema_fields.items()
+                       if not isinstance(field, _DATE_FIELDS + _SCALAR_FIELDS))
+        plan = (frozenset(schema_fields), dates, others)
+        _field_plans[cls] = plan
+    return plan
+
+
+@functools.lru_cache(maxsize=256)
+def _projection(paths):
+    # A tree of the selected attribute names; None selects a whole subtree.
+    tree = {}
+    for path in paths:
+        node = tree
+        names = path.split('.')
+        for name in names[:-1]:
+            child = node.setdefault(name, {})
+            if child is None:
+                break
+            node = child
+        else:
+            node[names[-1]] = None
+    return tree
+
+
+def projection(paths):
+    """
+    Compile a selection of fields, given as dotted paths such as 'attributes.tags', for serialize.
+
+    Returns: The projection, or None to keep everything if paths is empty.
+    """
+    return _projection(tuple(paths)) if paths else None
+
+
+def project(data, node):
+    """
+    Keep only the projected keys of already converted data: dicts, lists of them, or plain values.
+
+    Returns: The projected data; lists are projected item by item.
+    """
+    if node is None:
+        return data
+    if isinstance(data, list):
+        return [project(item, node) for item in data]
+    if isinstance(data, dict):
+        return {key: project(data[key], child) for key, child in node.items() if key in data}
+    return data
+
+
+def serialize(obj, only=None):
+    """
+    Convert an SDK object, a list of them or a single value into JSON-ready Python data.
+
+    only, a projection made by projection(), limits the output of every object to the selected
+    attributes; attributes left out are never converted.
+
+    Returns: The converted data, equal to what the recursive parse_object produced.
+    """
+    type_kinds = _type_kinds
+    field_plans = _field_plans
+    # Records repeat timestamps (invoice date, service periods, transaction dates), and
+    # isoformat() on aware datetimes is the most expensive step, so format each one once.
+    isoformats = {}
+    if only is not None:
+        return _serialize_projected(obj, only, isoformats)
+    root = [None]
+    stack = [(root, 0, obj)]
+    push = stack.append
+    pop = stack.pop
+    while stack:
+        target, slot, value = pop()
+        kind = type_kinds.get(type(value)) or _type_kind(type(value))
+        if kind is _OBJECT:
+            # Copy all attributes at once; string, number and boolean fields are final as they are.
+            result = value.__dict__.copy()
+            known, dates, others = field_plans.get(type(value)) or _field_plan(type(value))
+            for key in dates:
+                item = result.get(key)
+                if item is not None:
+                    # Aware datetimes in different zones can be equal, so the zone is part of the key.
+                    memo_key = (item, getattr(item, 'tzinfo', None))
+                    text = isoformats.get(memo_key)
+                    if text is None:
+                        text = isoformats[memo_key] = item.isoformat()
+                    result[key] = text
+            if not result.keys() <= known:
+                others = [key for key in result if key not in known] + list(others)
+            for key in others:
+                item = result.get(key)
+                if item is None:
+                    continue
+                item_kind = type_kinds.get(type(item)) or _type_kind(type(item))
+                if item_kind is _ISO:
+                    result[key] = item.isoformat()
+                elif item_kind is not _SCALAR:
+                    push((result, key, item))
+            target[slot] = result
+        elif kind is _LIST:
+            result = [None] * len(value)
+            for index, item in enumerate(value):
+                push((result, index, item))
+            target[slot] = result
+        elif kind is _ISO:
+            target[slot] = value.isoformat()
+        else:
+            target[slot] = value
+    return root[0]
+
+
+def _serialize_projected(value, node, isoformats):
+    # Only the selected attributes of objects are converted; whole selected subtrees go to serialize.
+    kind = _type_kinds.get(type(value)) or _type_kind(type(value))
+    if kind is _LIST:
+        return [_serialize_projected(item, node, isoformats) for item in value]
+    if kind is _ISO:
+        return value.isoformat()
+    if kind is not _OBJECT:
+        return project(value, node)
+    attributes = value.__dict__
+    result = {}
+    for key, child in node.items():
+        if key not in attributes:
+            continue
+        item = attributes[key]
+        item_kind = _type_kinds.get(type(item)) or _type_kind(type(item))
+        if item is None or (item_kind is _SCALAR and child is None):
+            result[key] = item
+        elif item_kind is _ISO:
+            memo_key = (item, getattr(item, 'tzinfo', None))
+            text = isoformats.get(memo_key)
+            if text is None:
+                text = isoformats[memo_key] = item.isoformat()
+            result[key] = text
+        elif child is None:
+            result[key] = serialize(item)
+        else:
+            result[key] = _serialize_projected(item, child, isoformats)
+    return result
+
+
+# Timestamps repeat a lot across records, so their conversions are cached; this also
+# makes equal timestamps share one string, as serialize does within a record.
+@functools.lru_cache(maxsize=65536)
+def _datetime_text(value):
+    try:
+        return datetime.datetime.fromisoformat(value).isoformat()
+    except ValueError:
+        # Formats datetime.fromisoformat does not take are left to marshmallow.
+        return fields.DateTime().deserialize(value).isoformat()
+
+
+@functools.lru_cache(maxsize=4096)
+def _date_text(value):
+    return datetime.date.fromisoformat(value).isoformat()
+
+
+def _json_converter(field):
+    # A function turning a non-null JSON value of the field into serialized output, or None to keep it as is.
+    if isinstance(field, fields.Nested):
+        schema, many = field.schema, field.many
+        if many:
+            return lambda value: [load_json(schema, item) for item in value]
+        return lambda value: load_json(schema, value)
+    if isinstance(field, fields.List):
+        inner = _json_converter(field.inner)
+        if inner is None:
+            return list
+        return lambda value: [None if item is None else inner(item) for item in value]
+    # Exact types only: subclasses such as Time, NaiveDateTime or Email behave differently.
+    if type(field) is fields.Date:
+        return _date_text
+    if type(field) is fields.DateTime and field.format in (None, 'iso'):
+        return _datetime_text
+    if type(field) is fields.Integer:
+        return int
+    if type(field) in (fields.Number, fields.Float):
+        return float
+    if type(field) in (fields.String, fields.Raw):
+        return None
+    if type(field) is fields.Dict and field.key_field is None and field.value_field is None:
+        return dict
+    return lambda value: serialize(field.deserialize(value))
+
+
+def _json_plan(schema):
+    # (JSON key, attribute name, converter) for every field of a schema, in declaration order.
+    plan = _json_plans.get(type(schema))
+    if plan is None:
+        plan = tuple((field.data_key or name, field.attribute or name, _json_converter(field))
+                     for name, field in schema.fields.items() if not field.dump_only)
+        _json_plans[type(schema)] = plan
+    return plan
+
+
+def load_json(schema, data):
+    """
+    Convert a decoded API object straight into what serialize(schema.load(data)) would return.
+
+    Keys are renamed to attribute names, fields outside the schema are dropped, and numbers
+    and dates are normalised like marshmallow does, without building any SDK objects.
+
+    Returns: A dict with the same keys, order and values as the serialized SDK object.
+    """
+    result = {}
+    for json_key, name, convert in _json_plan(schema):
+        if json_key in data:
+            value = data[json_key]
+            result[name] = value if convert is None or value is None else convert(value)
+    return result
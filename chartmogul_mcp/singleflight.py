@@ -0,0 +1,64 @@
+import threading
+
+
+class _Flight:
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into one call whose outcome they all share.
+
+    The first caller of a key runs the function; callers arriving while it runs wait for it
+    and get the same result, or the same exception. Once it returns, the next call of the key
+    runs again. `calls` counts all calls and `collapsed` the ones that shared another's result.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.collapsed = 0
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func, *args, **kwargs):
+        """
+        Run func(*args, **kwargs), unless a call with the same key is in flight.
+
+        Returns: The result of the call in flight for the key.
+        """
+        with self._lock:
+            self.calls += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.collapsed += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = func(*args, **kwargs)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    def stats(self):
+        """
+        Report how many calls were collapsed.
+
+        Returns: A dict with the number of calls, collapsed calls and calls in flight.
+        """
+        with self._lock:
+            return {"calls": self.calls, "collapsed": self.collapsed, "in_flight": len(self._flights)}
@@ -0,0 +1,91 @@
+"""
+Serving several ChartMogul accounts from one process.
+
+Over HTTP, every request may carry the API key of the account to use in an X-ChartMogul-Token
+header. TokenMiddleware makes it the current_token of everything the request runs, including
+the tool calls of an SSE session opened by the request, and ConfigPool turns tokens into
+chartmogul.Config objects that are created once and kept while the account is in use.
+"""
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+
+# Header carrying the ChartMogul API key of a request.
+TOKEN_HEADER = b'x-chartmogul-token'
+
+# API key of the account the current request or session works on; None for the default account.
+current_token = ContextVar('chartmogul_token', default=None)
+
+
+class TokenMiddleware:
+    """ASGI middleware setting current_token from the X-ChartMogul-Token header while a request runs."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+        token = next((value.decode('latin-1').strip() for name, value in scope.get('headers', ())
+                      if name.lower() == TOKEN_HEADER), None)
+        reset = current_token.set(token or None)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_token.reset(reset)
+
+
+class ConfigPool:
+    """
+    chartmogul.Config objects per API token, created by `factory(token)` on first use.
+
+    At most `max_tenants` configs are kept, the least recently used going first, and configs
+    unused for `idle_ttl` seconds are dropped. `on_evict`, if given, is called with every dropped
+    config, e.g. to free what is cached for its account.
+    """
+
+    def __init__(self, factory, max_tenants=256, idle_ttl=3600, on_evict=None):
+        self.factory = factory
+        self.max_tenants = max_tenants
+        self.idle_ttl = idle_ttl
+        self.on_evict = on_evict
+        self.created = 0
+        self.evicted = 0
+        self._configs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token):
+        """
+        Look up the config of a token, creating it if needed, and mark it as used.
+
+        Returns: The chartmogul.Config of the token.
+        """
+        now = time.monotonic()
+        dropped = []
+        with self._lock:
+            entry = self._configs.pop(token, None)
+            if entry is None:
+                entry = (now, self.factory(token))
+                self.created += 1
+            self._configs[token] = (now, entry[1])
+            while self._configs:
+                oldest, (used, config) = next(iter(self._configs.items()))
+                if oldest == token or (len(self._configs) <= self.max_tenants and now - used < self.idle_ttl):
+                    break
+                del self._configs[oldest]
+                dropped.append(config)
+            self.evicted += len(dropped)
+        for config in dropped:
+            if self.on_evict is not None:
+                self.on_evict(config)
+        return entry[1]
+
+    def stats(self):
+        """
+        Report the pool usage.
+
+        Returns: A dict with the number of tenants kept, created and evicted.
+        """
+        with self._lock:
+            return {"tenants": len(self._configs), "created": self.created, "evicted": self.evicted}
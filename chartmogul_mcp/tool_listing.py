@@ -0,0 +1,134 @@
+"""
+The tools/list answer of the server, built once instead of on every request.
+
+With 60 tools and paragraph-long descriptions, the list is large: building it for every
+client costs CPU, and every conversation pays for it in tokens. CachedToolsMCP builds it
+on the first request, dumped to JSON-ready data, and keeps it until a tool is added; the
+transports still encode the JSON-RPC message around it, which carries the request id, for
+every response. In compact mode, each tool is
+listed with the first sentence of its description and a compact schema, and the
+full description and schema are read on demand from the chartmogul://tools/{name} resource.
+"""
+import json
+import re
+
+from mcp import types
+from mcp.server.fastmcp import FastMCP
+
+# URI template of the resource holding the full description and input schema of a tool.
+TOOL_DOCS_URI = 'chartmogul://tools/{name}'
+
+# The first sentence ends at a period followed by a space, by a capital (descriptions are
+# often joined without a space), or by the end of the text.
+_FIRST_SENTENCE = re.compile(r'^(.+?\.)(?=\s|[A-Z]|$)', re.DOTALL)
+
+
+def short_description(description):
+    """
+    Shorten a tool description to its first sentence.
+
+    Returns: The first sentence, or the whole description if it has no sentence end.
+    """
+    description = (description or '').strip()
+    match = _FIRST_SENTENCE.match(description)
+    return match.group(1) if match else description
+
+
+def compact_schema(schema):
+    """
+    Shorten a JSON schema generated by pydantic without changing what it accepts.
+
+    Titles are dropped, optional values written as anyOf a simple type and null become a list of
+    types, and null defaults are dropped, as parameters missing from "required" are None anyway.
+
+    Returns: A compact copy of the schema.
+    """
+    if isinstance(schema, list):
+        return [compact_schema(value) for value in schema]
+    if not isinstance(schema, dict):
+        return schema
+    compact = {}
+    for key, value in schema.items():
+        if key == 'title' and isinstance(value, str):
+            continue
+        if key == 'default' and value is None:
+            continue
+        if key == 'anyOf' and len(value) == 2 and {'type': 'null'} in value:
+            other = value[0] if value[1] == {'type': 'null'} else value[1]
+            if set(other) == {'type'} and isinstance(other['type'], str):
+                compact['type'] = [other['type'], 'null']
+                continue
+        compact[key] = compact_schema(value)
+    return compact
+
+
+class _DumpedResult:
+    """A request result dumped once; sessions only call model_dump on results, always with the same options."""
+
+    def __init__(self, result):
+        self._dumped = result.model_dump(by_alias=True, mode="json", exclude_none=True)
+
+    def model_dump(self, **kwargs):
+        return self._dumped
+
+
+class CachedToolsMCP(FastMCP):
+    """
+    FastMCP answering tools/list from a list built once, with compact descriptions if `compact_tools`.
+
+    In compact mode, the server instructions point clients to the tool docs resource.
+    """
+
+    def __init__(self, name=None, instructions=None, compact_tools=False, **settings):
+        if compact_tools:
+            instructions = ((instructions + ' ') if instructions else '') + (
+                'Tool descriptions are shortened: before using a tool for the first time, read the resource '
+                f'{TOOL_DOCS_URI} for its full description and the meaning of its parameters.')
+        super().__init__(name, instructions, **settings)
+        self.compact_tools = compact_tools
+        self._listed_tools = None
+        self._full_tools = None
+        self._dumped_tools = None
+        self._mcp_server.request_handlers[types.ListToolsRequest] = self._list_tools_request
+        if compact_tools:
+            self.add_resource_docs()
+
+    def add_tool(self, *args, **kwargs):
+        super().add_tool(*args, **kwargs)
+        self._listed_tools = self._full_tools = self._dumped_tools = None
+
+    async def list_tools(self):
+        """
+        List all tools, as they are built on the first call after a tool was added.
+
+        Returns: The list of MCP tools.
+        """
+        if self._listed_tools is None:
+            tools = await super().list_tools()
+            listed = tools
+            if self.compact_tools:
+                listed = [tool.model_copy(update={'description': short_description(tool.description),
+                                                  'inputSchema': compact_schema(tool.inputSchema)})
+                          for tool in tools]
+            self._full_tools = {tool.name: tool for tool in tools}
+            self._listed_tools = listed
+        return self._listed_tools
+
+    async def _list_tools_request(self, request):
+        # The tools/list answer, dumped on the first request after a tool was added.
+        if self._dumped_tools is None:
+            tools = await self.list_tools()
+            self._dumped_tools = _DumpedResult(types.ServerResult(types.ListToolsResult(tools=tools)))
+        return self._dumped_tools
+
+    def add_resource_docs(self):
+        """Register the resource with the full description and input schema of every tool."""
+        @self.resource(TOOL_DOCS_URI, name='tool_docs', mime_type='application/json',
+                       description='Full description and input schema of a tool, by tool name.')
+        async def tool_docs(name: str) -> str:
+            await self.list_tools()
+            tool = self._full_tools.get(name)
+            if tool is None:
+                raise ValueError(f"Unknown tool: {name}")
+            return json.dumps({'name': tool.name, 'description': tool.description,
+                               'inputSchema': tool.inputSchema})
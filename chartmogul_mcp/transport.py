@@ -0,0 +1,186 @@
+"""
+Optional asyncio transport for the ChartMogul API.
+
+The chartmogul SDK builds a new requests session for every call, so each request pays
+for a fresh TCP connection and TLS handshake. AsyncTransport keeps a single pooled
+httpx.AsyncClient with keep-alive on a background event loop instead, and hydrates the
+responses with the SDK's own schemas so callers get back the same objects as from the SDK.
+"""
+import asyncio
+import threading
+from json import dumps
+from types import SimpleNamespace
+from urllib.parse import urlsplit
+
+import chartmogul
+import httpx
+from chartmogul.api.plan_group_plans import PlanGroupPlans
+from chartmogul.resource import LIST_PARAMS, MAPPINGS, json_serial
+from chartmogul.version import __version__ as SDK_VERSION
+from chartmogul_mcp import serializers
+from chartmogul_mcp.utils import LOGGER
+
+# Endpoints whose path differs from the `_path` of their resource class.
+PATHS = {
+    (chartmogul.Customer, 'search'): '/customers/search',
+    (chartmogul.Invoice, 'all'): '/invoices',
+    (chartmogul.Invoice, 'retrieve'): '/invoices{/uuid}',
+    (chartmogul.PlanGroup, 'all'): '/plan_groups',
+    (chartmogul.SubscriptionEvent, 'all'): '/subscription_events',
+    (chartmogul.Metrics, 'mrr'): '/metrics/mrr',
+    (chartmogul.Metrics, 'arr'): '/metrics/arr',
+    (chartmogul.Metrics, 'arpa'): '/metrics/arpa',
+    (chartmogul.Metrics, 'asp'): '/metrics/asp',
+    (chartmogul.Metrics, 'customer_count'): '/metrics/customer-count',
+    (chartmogul.Metrics, 'customer_churn_rate'): '/metrics/customer-churn-rate',
+    (chartmogul.Metrics, 'mrr_churn_rate'): '/metrics/mrr-churn-rate',
+    (chartmogul.Metrics, 'ltv'): '/metrics/ltv',
+}
+
+
+def route(resource, method, kwargs):
+    """
+    Resolve the resource class, HTTP verb and path the SDK would use for `resource.method(**kwargs)`.
+
+    Path parameters are expanded and removed from kwargs, which are left holding
+    the query parameters or the request body.
+    """
+    if resource is chartmogul.PlanGroup and method == 'all' and 'uuid' in kwargs:
+        resource = PlanGroupPlans
+    path = resource._expandPath(PATHS.get((resource, method), resource._path), kwargs)
+    kwargs.pop('uuid', None)
+    return resource, MAPPINGS.get(method, 'get'), path
+
+
+def _query_params(resource, kwargs):
+    # Mirror requests: drop None values and send everything else as its string form, booleans
+    # included (True, where httpx would send true).
+    params = resource._preProcessParams(kwargs)
+    return {key: value if isinstance(value, (str, int, float)) and not isinstance(value, bool) else str(value)
+            for key, value in params.items() if value is not None}
+
+
+def _auth(config):
+    # Mirror requests, which sends a missing API key as the string "None" where httpx would fail.
+    return tuple(value if isinstance(value, (str, bytes)) else str(value) for value in config.auth)
+
+
+def _raise_for_status(response):
+    # Like the SDK, keep the HTTP error, and with it the status and headers, as the cause of the APIError.
+    if response.status_code >= 400:
+        error = httpx.HTTPStatusError(f"{response.status_code} error", request=response.request, response=response)
+        raise chartmogul.APIError(response.content) from error
+
+
+def _load(resource, response):
+    # Same handling as chartmogul.Resource._load, minus the requests specifics.
+    _raise_for_status(response)
+    if response.status_code in (202, 204):
+        return None
+    try:
+        json_obj = response.json()
+    except ValueError:
+        return response.content
+    return resource._loadJSON(json_obj)
+
+
+def _load_json(resource, response):
+    # Like _load, but entries are converted by serializers.load_json instead of being hydrated.
+    _raise_for_status(response)
+    if response.status_code in (202, 204):
+        return None
+    try:
+        json_obj = response.json()
+    except ValueError:
+        return response.content
+    root_key = getattr(resource, '_root_key', None)
+    if root_key in json_obj:
+        # Missing list parameters read as None, like on the SDK's namedtuples.
+        return SimpleNamespace(**{**dict.fromkeys(LIST_PARAMS), **json_obj,
+                                  root_key: [serializers.load_json(resource._schema, entry)
+                                             for entry in json_obj[root_key]]})
+    return serializers.load_json(resource._schema, json_obj)
+
+
+class AsyncTransport:
+    """
+    A pooled, keep-alive HTTP client for the ChartMogul API running on its own event loop.
+
+    `request` and `request_json` can be called from any thread; all requests share the same
+    connection pool.
+    """
+
+    def __init__(self, pool_size=20, per_host=10, keepalive_expiry=30.0):
+        self.pool_size = pool_size
+        self.per_host = per_host
+        self.keepalive_expiry = keepalive_expiry
+        self._host_slots = {}
+        self._client = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="chartmogul-transport", daemon=True)
+        self._thread.start()
+        LOGGER.info(f"ChartMogul async transport started (pool size {pool_size}, {per_host} per host).")
+
+    def request(self, config, resource, method, **kwargs):
+        """
+        Send a request and wait for it from synchronous code.
+
+        Returns: The SDK object for the response, as returned by the SDK's request().get().
+        """
+        resource, response = asyncio.run_coroutine_threadsafe(self._send(config, resource, method, kwargs),
+                                                              self._loop).result()
+        return _load(resource, response)
+
+    def request_json(self, config, resource, method, **kwargs):
+        """
+        Send a request and wait for it from synchronous code, without building SDK objects.
+
+        Returns: The response converted to JSON-ready data; list responses are a namespace
+        holding the converted entries under the resource's root key and the list parameters.
+        """
+        resource, response = asyncio.run_coroutine_threadsafe(self._send(config, resource, method, kwargs),
+                                                              self._loop).result()
+        return _load_json(resource, response)
+
+    def close(self):
+        """Close the pooled connections and stop the transport's event loop."""
+        if self._client is not None:
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def _get_client(self):
+        if self._client is None:
+            limits = httpx.Limits(max_connections=self.pool_size,
+                                  max_keepalive_connections=self.pool_size,
+                                  keepalive_expiry=self.keepalive_expiry)
+            self._client = httpx.AsyncClient(limits=limits, headers={
+                "content-type": "application/json",
+                "User-Agent": "chartmogul-python/" + SDK_VERSION,
+            })
+        return self._client
+
+    def _host_slot(self, url):
+        # httpx only caps the pool as a whole, so connections per host are capped here.
+        host = urlsplit(url).netloc
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.per_host)
+        return self._host_slots[host]
+
+    async def _send(self, config, resource, method, kwargs):
+        # Only network I/O happens on the transport loop; responses are decoded by the caller,
+        # so hydrating large pages does not hold up the requests of other threads.
+        resource, http_verb, path = route(resource, method, kwargs)
+        url = config.uri + path
+        if http_verb == 'get':
+            params, content = _query_params(resource, kwargs), None
+        else:
+            data = kwargs.get('data')
+            params, content = None, dumps(data, default=json_serial) if data is not None else None
+        async with self._host_slot(url):
+            response = await self._get_client().request(http_verb.upper(), url,
+                                                        params=params,
+                                                        content=content,
+                                                        auth=_auth(config),
+                                                        timeout=config.request_timeout)
+        return resource, response
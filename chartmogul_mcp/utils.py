@@ -1,3 +1,4 @@
+import importlib
 import os
 from dotenv import load_dotenv
 import logging
@@ -5,13 +6,74 @@ import logging
 load_dotenv()
 
 CHARTMOGUL_TOKEN = os.getenv('CHARTMOGUL_TOKEN')
+# Size of the worker pool that runs the blocking ChartMogul API calls off the event loop.
+MAX_WORKERS = int(os.getenv('CHARTMOGUL_MAX_WORKERS', '8'))
+# Maximum number of concurrent API requests of one batch retrieve or bulk update call.
+BATCH_PARALLELISM = int(os.getenv('CHARTMOGUL_BATCH_PARALLELISM', '8'))
+# Client-side limit on ChartMogul API requests per second shared by all tool calls (0 disables it),
+# and how often a throttled or failed request is retried.
+RATE_LIMIT = float(os.getenv('CHARTMOGUL_RATE_LIMIT', '25'))
+RATE_LIMIT_BURST = int(os.getenv('CHARTMOGUL_RATE_LIMIT_BURST', '25'))
+MAX_RETRIES = int(os.getenv('CHARTMOGUL_MAX_RETRIES', '5'))
+# Opt-in asyncio transport with a shared keep-alive connection pool (see chartmogul_mcp.transport).
+ASYNC_TRANSPORT = os.getenv('CHARTMOGUL_ASYNC_TRANSPORT', 'false').lower() in ('1', 'true', 'yes')
+# Opt-in: list and metrics responses are converted from the API's JSON without building SDK objects.
+# Implies the async transport.
+RAW_JSON = os.getenv('CHARTMOGUL_RAW_JSON', 'false').lower() in ('1', 'true', 'yes')
+HTTP_POOL_SIZE = int(os.getenv('CHARTMOGUL_HTTP_POOL_SIZE', '20'))
+HTTP_POOL_PER_HOST = int(os.getenv('CHARTMOGUL_HTTP_POOL_PER_HOST', '10'))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv('CHARTMOGUL_HTTP_KEEPALIVE_EXPIRY', '30'))
+# Number of pages the list functions fetch ahead while the current page is parsed (0 disables prefetching).
+# Off by default: only parsing overlaps the requests, which bench_pagination measures at a few percent at most.
+PAGE_PREFETCH = int(os.getenv('CHARTMOGUL_PAGE_PREFETCH', '0'))
+# Number of date ranges a long activities listing is split into and walked concurrently (1 disables sharding).
+LIST_SHARDS = int(os.getenv('CHARTMOGUL_LIST_SHARDS', '1'))
+# Walk customer and invoice listings without a data source filter as one listing per data source, concurrently.
+SOURCE_FAN_OUT = os.getenv('CHARTMOGUL_SOURCE_FAN_OUT', 'false').lower() in ('1', 'true', 'yes')
+# Metrics responses are cached in-process; ranges ending before today use the historical TTL.
+METRICS_CACHE_TTL = float(os.getenv('CHARTMOGUL_METRICS_CACHE_TTL', '300'))
+METRICS_CACHE_HISTORICAL_TTL = float(os.getenv('CHARTMOGUL_METRICS_CACHE_HISTORICAL_TTL', '86400'))
+METRICS_CACHE_MAX_ENTRIES = int(os.getenv('CHARTMOGUL_METRICS_CACHE_MAX_ENTRIES', '256'))
+# Transport main.py serves: stdio, or sse or streamable-http to serve many sessions from one process over HTTP.
+MCP_TRANSPORT = os.getenv('CHARTMOGUL_MCP_TRANSPORT', 'stdio')
+# Address of the HTTP transports, and the number of worker processes serving it (more than 1 needs streamable-http).
+MCP_HOST = os.getenv('CHARTMOGUL_MCP_HOST', '127.0.0.1')
+MCP_PORT = int(os.getenv('CHARTMOGUL_MCP_PORT', '8000'))
+MCP_WORKERS = int(os.getenv('CHARTMOGUL_MCP_WORKERS', '1'))
+# Accounts served at once with API keys sent in the X-ChartMogul-Token header of HTTP requests, and the
+# seconds after which an unused account's config, rate limiter and cached metrics are dropped.
+MAX_TENANTS = int(os.getenv('CHARTMOGUL_MAX_TENANTS', '256'))
+TENANT_IDLE_TTL = float(os.getenv('CHARTMOGUL_TENANT_IDLE_TTL', '3600'))
+# List tools with the first sentence of their description only; the full docs are a resource read on demand.
+COMPACT_TOOLS = os.getenv('CHARTMOGUL_COMPACT_TOOLS', 'false').lower() in ('1', 'true', 'yes')
 MCP_SERVER_NAME = "mcp-chartmogul"
 DEPENDENCIES = [
     "chartmogul",
+    "httpx",
     "python-dotenv"
 ]
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
-LOGGER = logging.getLogger(MCP_SERVER_NAME)
\ No newline at end of file
+LOGGER = logging.getLogger(MCP_SERVER_NAME)
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is only imported when one of its attributes is first used.
+
+    Keeps heavy imports, such as the chartmogul SDK with marshmallow and requests, out of the
+    server's start-up until a tool call needs them.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        module = self._module
+        if module is None:
+            # import_module holds the module's import lock, so concurrent first uses import it once.
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, attr)
@@ -0,0 +1,49 @@
+import os
+import shutil
+import subprocess
+
+import pytest
+
+os.environ.setdefault("CHARTMOGUL_TOKEN", "test")
+
+from fake_api import FakeChartMogul  # noqa: E402
+from chartmogul_mcp import api_client  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch):
+    # Tests measure behaviour, not the client-side rate limit; tests of the limiter use their own.
+    monkeypatch.setattr(api_client.rate_limiter, "rate", 0)
+    api_client.metrics_cache.clear()
+
+
+@pytest.fixture
+def fake_api():
+    """Start fake ChartMogul APIs with the given settings, and a config pointing at each of them."""
+    started = []
+
+    def start(**settings):
+        fake = FakeChartMogul(**{"latency": 0, **settings}).__enter__()
+        started.append(fake)
+        config = api_client.init_chartmogul_config()
+        config.uri = fake.uri
+        return fake, config
+
+    yield start
+    for fake in started:
+        fake.__exit__(None, None, None)
+
+
+@pytest.fixture(scope="session")
+def certfile(tmp_path_factory):
+    """A self-signed certificate for 127.0.0.1, followed by its key, in one PEM file."""
+    if shutil.which("openssl") is None:
+        pytest.skip("openssl is needed to serve the fake API over HTTPS")
+    directory = tmp_path_factory.mktemp("tls")
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+                    "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1",
+                    "-keyout", str(key), "-out", str(cert)], check=True, capture_output=True)
+    combined = directory / "combined.pem"
+    combined.write_text(cert.read_text() + key.read_text())
+    return str(combined)
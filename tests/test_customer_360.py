@@ -0,0 +1,45 @@
+import pytest
+
+from chartmogul_mcp import api_client
+
+
+@pytest.fixture(autouse=True)
+def no_retries(monkeypatch):
+    monkeypatch.setattr(api_client.rate_limiter, "max_retries", 0)
+
+
+def test_sections_have_their_records(fake_api):
+    fake, config = fake_api()
+    result = api_client.retrieve_customer_360(config, "cus_00001", {"tasks": 0})
+    assert result["customer"]["uuid"] == "cus_00001"
+    assert "tasks" not in result
+    assert result["failed"] == [] and result["errors"] == {}
+    assert len(result["subscriptions"]["records"]) == 20
+    assert result["notes"]["has_more"]
+    assert fake.requests == 5
+
+
+def test_failed_sections_carry_their_error(fake_api):
+    fake, config = fake_api()
+    fake.fail_at = 0
+    result = api_client.retrieve_customer_360(config, "cus_00001")
+    assert result["customer"]["uuid"] == "cus_00001"
+    assert result["failed"] == list(api_client.CUSTOMER_360_LIMITS)
+    assert set(result["errors"]) == set(result["failed"])
+    assert all("Internal Server Error" in error for error in result["errors"].values())
+    assert result["subscriptions"] is None
+
+
+def test_section_failing_part_way_keeps_its_records(fake_api):
+    fake, config = fake_api(max_per_page=5)
+    fake.fail_at = 5
+    result = api_client.retrieve_customer_360(config, "cus_00001", {"subscriptions": 20})
+    assert result["failed"] == []
+    assert len(result["subscriptions"]["records"]) == 5
+    assert result["subscriptions"]["has_more"]
+    assert "Internal Server Error" in result["subscriptions"]["error"]
+
+
+def test_unknown_section(fake_api):
+    fake, config = fake_api()
+    assert api_client.retrieve_customer_360(config, "cus_00001", {"unknown": 1}) is None
@@ -0,0 +1,49 @@
+import datetime
+
+import pytest
+
+from fake_api import START
+from chartmogul_mcp import api_client
+from chartmogul_mcp.serializers import project, projection
+
+FIELDS = ["uuid", "date", "line_items.amount_in_cents", "line_items.subscription_uuid"]
+
+
+def test_projected_listing_equals_projected_whole_listing(fake_api):
+    fake, config = fake_api(records=300)
+    whole = api_client.list_invoices(config, limit=300)
+    projected = api_client.list_invoices(config, limit=300, fields=FIELDS)
+    assert list(projected) == project(list(whole), projection(FIELDS))
+    assert set(projected[0]) == {"uuid", "date", "line_items"}
+    assert set(projected[0]["line_items"][0]) == {"amount_in_cents", "subscription_uuid"}
+
+
+@pytest.mark.parametrize("fields", [["name", "mrr"], ["uuid", "name"]])
+def test_fan_out_projects_without_the_key_it_deduplicates_by(fake_api, fields):
+    fake, config = fake_api(records=1000)
+    whole = api_client.list_customers(config, limit=None, fan_out=False)
+    fake.reset_counters()
+    fanned = api_client.list_customers(config, limit=None, fan_out=True, fields=fields)
+    # The data sources, then two pages of each of the four sources.
+    assert fake.requests == 1 + 4 * 2
+    assert sorted(map(repr, fanned)) == sorted(map(repr, project(list(whole), projection(fields))))
+
+
+def test_sharded_listing_projects_without_the_key(fake_api):
+    fake, config = fake_api(records=800)
+    end = START + datetime.timedelta(hours=799)
+    whole = api_client.list_activities(config, START, end, None, None, None, shards=1)
+    sharded = api_client.list_activities(config, START, end, None, None, None, shards=4, fields=["date", "type"])
+    assert list(sharded) == project(list(whole), projection(["date", "type"]))
+
+
+def test_retrieve_with_fields(fake_api):
+    fake, config = fake_api()
+    customer = api_client.retrieve_customer(config, "cus_00001", fields=["uuid", "attributes.tags"])
+    assert customer == {"uuid": "cus_00001", "attributes": {"tags": api_client.retrieve_customer(
+        config, "cus_00001")["attributes"]["tags"]}}
+
+
+def test_projection_keeps_everything_without_fields():
+    assert projection([]) is None
+    assert project([{"a": 1}], None) == [{"a": 1}]
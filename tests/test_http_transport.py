@@ -0,0 +1,25 @@
+import pytest
+
+from chartmogul_mcp import utils
+from chartmogul_mcp.mcp_server import ChartMogulMcp
+
+
+def test_default_transport(monkeypatch):
+    monkeypatch.setattr(utils, "MCP_TRANSPORT", "stdio")
+    assert ChartMogulMcp.http_transport() == "streamable-http"
+    monkeypatch.setattr(utils, "MCP_TRANSPORT", "sse")
+    assert ChartMogulMcp.http_transport() == "sse"
+
+
+def test_workers_need_a_stateless_transport():
+    assert ChartMogulMcp.http_transport("streamable-http", stateless=True) == "streamable-http"
+    with pytest.raises(ValueError):
+        ChartMogulMcp.http_transport("sse", stateless=True)
+    with pytest.raises(ValueError):
+        ChartMogulMcp.http_transport("websocket")
+
+
+def test_stateless_app():
+    server = ChartMogulMcp()
+    server.http_app("streamable-http", stateless=True)
+    assert server.mcp.settings.stateless_http
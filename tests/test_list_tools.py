@@ -0,0 +1,69 @@
+import asyncio
+import json
+
+import pytest
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from chartmogul_mcp import api_client
+from chartmogul_mcp.mcp_server import ChartMogulMcp
+from chartmogul_mcp.pagination import continuation_token, resume_cursor
+
+
+@pytest.fixture
+def server(fake_api, monkeypatch):
+    monkeypatch.setattr(api_client.rate_limiter, "max_retries", 0)
+    fake, config = fake_api(records=50, max_per_page=10)
+    server = ChartMogulMcp()
+    server.config = config
+    return fake, server
+
+
+def _call(server, calls):
+    # Call the tools one after the other in one session, and decode their results.
+    async def run():
+        results = []
+        async with create_connected_server_and_client_session(server.mcp._mcp_server) as client:
+            for name, arguments in calls:
+                result = await client.call_tool(name, arguments)
+                results.append(result.content[0].text if result.isError else json.loads(result.content[0].text))
+        return results
+    return asyncio.run(run())
+
+
+def test_continuation_token_resumes_the_listing(server):
+    fake, server = server
+    first, = _call(server, [("list_invoices", {"limit": 25})])
+    assert first["has_more"] and len(first["records"]) == 25
+    second, = _call(server, [("list_invoices", {"limit": 100, "continuation_token": first["continuation_token"]})])
+    assert not second["has_more"] and second["continuation_token"] is None
+    whole, = _call(server, [("list_invoices", {"limit": 100})])
+    assert first["records"] + second["records"] == whole["records"]
+
+
+def test_continuation_token_needs_the_same_filters(server):
+    fake, server = server
+    first, = _call(server, [("list_customers", {"limit": 5, "status": "Active"})])
+    error, = _call(server, [("list_customers", {"limit": 5, "status": "Cancelled",
+                                                "continuation_token": first["continuation_token"]})])
+    assert "another listing" in error
+
+
+def test_failed_page_returns_the_records_before_it(server):
+    fake, server = server
+    fake.fail_at = 20
+    partial, = _call(server, [("list_invoices", {"limit": 50})])
+    assert len(partial["records"]) == 20
+    assert partial["has_more"] and "Internal Server Error" in partial["error"]
+    fake.fail_at = None
+    rest, = _call(server, [("list_invoices", {"limit": 30, "continuation_token": partial["continuation_token"]})])
+    whole, = _call(server, [("list_invoices", {"limit": 50})])
+    assert partial["records"] + rest["records"] == whole["records"]
+
+
+def test_tokens_are_opaque_and_scoped():
+    token = continuation_token(("list_invoices", None), "cursor/1")
+    assert resume_cursor(("list_invoices", None), token) == "cursor/1"
+    with pytest.raises(ValueError):
+        resume_cursor(("list_invoices", "ds_1"), token)
+    with pytest.raises(ValueError):
+        resume_cursor(("list_invoices", None), "not a token")
@@ -0,0 +1,101 @@
+import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fake_api import START
+from chartmogul_mcp import api_client, pagination, utils
+from chartmogul_mcp.pagination import Paginator
+
+
+class _Page:
+
+    def __init__(self, entries, cursor, has_more):
+        self.entries = entries
+        self.cursor = cursor
+        self.has_more = has_more
+
+
+def _pages(records):
+    # A fetch_page over `records` numbered entries, with the cursor as offset.
+    calls = []
+
+    def fetch_page(cursor=None, per_page=None):
+        calls.append(cursor)
+        offset = cursor or 0
+        return _Page(list(range(offset, min(offset + per_page, records))), offset + per_page,
+                     offset + per_page < records)
+    return fetch_page, calls
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+@pytest.mark.parametrize("limit", [None, 450, 1000])
+def test_walk_stops_at_limit(prefetch, limit):
+    fetch_page, calls = _pages(1000)
+    paginator = Paginator(fetch_page, "entries", limit, prefetch=prefetch)
+    assert list(paginator) == list(range(1000))[:limit]
+    assert paginator.requests == len(calls) == (1000 if limit is None else limit + 199) // 200
+    assert paginator.has_more == (limit is not None and limit < 1000)
+
+
+def test_prefetch_pauses_once_the_budget_is_fetched():
+    fetch_page, calls = _pages(1000)
+    paginator = Paginator(fetch_page, "entries", None, prefetch=2)
+    paginator.budget = lambda: 200
+    pages = paginator.pages()
+    assert next(pages) == list(range(200))
+    time.sleep(0.1)
+    assert len(calls) == 1
+    # Asking for a page that is not buffered fetches on.
+    assert next(pages) == list(range(200, 400))
+    pages.close()
+
+
+@pytest.mark.parametrize("limit", [None, 1000])
+def test_prefetched_listing_equals_sequential_listing(fake_api, monkeypatch, limit):
+    fake, config = fake_api(records=1000)
+    monkeypatch.setattr(utils, "PAGE_PREFETCH", 0)
+    sequential = api_client.list_invoices(config, limit=limit)
+    monkeypatch.setattr(utils, "PAGE_PREFETCH", 2)
+    fake.reset_counters()
+    assert api_client.list_invoices(config, limit=limit) == sequential
+    assert fake.requests == 5
+
+
+@pytest.mark.parametrize("shards", [2, 4])
+@pytest.mark.parametrize("limit", [None, 1000])
+def test_sharded_listing_equals_one_chain(fake_api, monkeypatch, shards, limit):
+    fake, config = fake_api(records=2400)
+    end = START + datetime.timedelta(hours=2399)
+    chain = api_client.list_activities(config, START, end, None, None, limit, shards=1)
+    # Shards prefetching with a budget must still hand out the same records.
+    monkeypatch.setattr(utils, "PAGE_PREFETCH", 2)
+    sharded = api_client.list_activities(config, START, end, None, None, limit, shards=shards)
+    assert sharded == chain
+    assert len(chain) == (2400 if limit is None else limit)
+
+
+@pytest.mark.parametrize("order", [None, "-date"])
+def test_sharded_listing_of_whole_days_keeps_the_last_day(fake_api, order):
+    # 30 days of hourly activities; the date-only end includes all of January 30.
+    fake, config = fake_api(records=24 * 31)
+    chain = api_client.list_activities(config, "2024-01-01", "2024-01-30", None, order, None, shards=1)
+    sharded = api_client.list_activities(config, "2024-01-01", "2024-01-30", None, order, None, shards=4)
+    assert len(chain) == 24 * 30
+    assert sharded == chain
+
+
+def test_prefetch_falls_back_to_walking_when_the_pool_is_busy(monkeypatch):
+    busy = ThreadPoolExecutor(max_workers=1)
+    release = threading.Event()
+    busy.submit(release.wait)
+    monkeypatch.setattr(pagination, "_prefetch_pool", lambda: busy)
+    fetch_page, calls = _pages(1000)
+    try:
+        assert list(Paginator(fetch_page, "entries", 500, prefetch=2)) == list(range(500))
+        assert len(calls) == 3
+    finally:
+        release.set()
+        busy.shutdown()
@@ -0,0 +1,138 @@
+import asyncio
+import time
+
+import pytest
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from chartmogul_mcp import api_client
+from chartmogul_mcp.mcp_server import ChartMogulMcp
+from chartmogul_mcp.ratelimit import RateLimiter, http_status, retry_after
+
+
+class _Response:
+
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class _HTTPError(Exception):
+
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.response = _Response(status_code, headers)
+
+
+def _failing(errors):
+    # A call raising the given errors one after the other, then returning "ok".
+    calls = []
+
+    def call():
+        calls.append(None)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return "ok"
+    return call, calls
+
+
+@pytest.mark.parametrize("tls", [False, True], ids=["http", "https"])
+def test_throttled_request_keeps_its_retry_after(fake_api, certfile, monkeypatch, tls):
+    # The SDK mounts its own retrying adapter on https:// only, so both schemes must hand the 429 over.
+    if tls:
+        monkeypatch.setenv("REQUESTS_CA_BUNDLE", certfile)
+    fake, config = fake_api(rate_limit=1, certfile=certfile if tls else None)
+    assert config.uri.startswith("https://" if tls else "http://")
+    api_client._send(config, api_client.chartmogul.Account, 'retrieve')
+    with pytest.raises(Exception) as error:
+        api_client._send(config, api_client.chartmogul.Account, 'retrieve')
+    assert http_status(error.value) == 429
+    assert retry_after(error.value) == 1.0
+    assert fake.requests == 2
+
+
+def test_throttled_request_waits_retry_after_and_succeeds(fake_api):
+    fake, config = fake_api(rate_limit=1)
+    config.rate_limiter = RateLimiter(rate=0, max_retries=3)
+    api_client._request(config, api_client.chartmogul.Account, 'retrieve')
+    start = time.monotonic()
+    account = api_client._request(config, api_client.chartmogul.Account, 'retrieve')
+    assert account.name == "Example"
+    assert time.monotonic() - start >= 0.9
+    assert config.rate_limiter.stats()["throttled"] >= 1
+
+
+def test_server_errors_are_retried_for_reads_only():
+    limiter = RateLimiter(rate=0, max_retries=3, backoff=0)
+    call, calls = _failing([_HTTPError(503), _HTTPError(502)])
+    assert limiter.call(call) == "ok"
+    assert len(calls) == 3
+
+    call, calls = _failing([_HTTPError(503)])
+    with pytest.raises(_HTTPError):
+        limiter.call(call, idempotent=False)
+    assert len(calls) == 1
+
+
+def test_throttled_writes_are_retried():
+    limiter = RateLimiter(rate=0, max_retries=3, backoff=0)
+    call, calls = _failing([_HTTPError(429, {"Retry-After": "0"})])
+    assert limiter.call(call, idempotent=False) == "ok"
+    assert limiter.stats()["throttled"] == 1
+
+
+def test_gives_up_after_max_retries():
+    limiter = RateLimiter(rate=0, max_retries=2, backoff=0)
+    call, calls = _failing([_HTTPError(500)] * 5)
+    with pytest.raises(_HTTPError):
+        limiter.call(call)
+    assert len(calls) == 3
+
+
+def test_client_errors_are_not_retried():
+    limiter = RateLimiter(rate=0, max_retries=3, backoff=0)
+    call, calls = _failing([_HTTPError(404)])
+    with pytest.raises(_HTTPError):
+        limiter.call(call)
+    assert len(calls) == 1
+
+
+def test_bucket_spaces_requests_out():
+    limiter = RateLimiter(rate=20, burst=1)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    # The first request takes the burst token, the other four wait 1/20 s each.
+    assert time.monotonic() - start >= 0.18
+
+
+def test_retry_after_accepts_http_dates():
+    error = _HTTPError(429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    assert retry_after(error) == 0.0
+    assert retry_after(_HTTPError(429)) is None
+
+
+def test_sdk_retry_adapter_must_exist(monkeypatch):
+    monkeypatch.delattr(api_client.chartmogul.retry_request, "_retry_adapter")
+    api_client._patch_sdk_retries.cache_clear()
+    with pytest.raises(RuntimeError):
+        api_client.init_chartmogul_config()
+
+
+def test_throttling_is_reported_to_the_client(fake_api, monkeypatch):
+    fake, config = fake_api(rate_limit=1)
+    monkeypatch.setattr(api_client.rate_limiter, "backoff", 0)
+    server = ChartMogulMcp()
+    server.config = config
+    messages = []
+
+    async def run():
+        async def on_log(params):
+            messages.append(params.data)
+        async with create_connected_server_and_client_session(server.mcp._mcp_server,
+                                                              logging_callback=on_log) as client:
+            await client.call_tool("retrieve_account", {})
+            result = await client.call_tool("retrieve_account", {})
+            assert not result.isError
+
+    asyncio.run(run())
+    assert [message for message in messages if "throttled 1 requests and 1 were retried" in message]
@@ -0,0 +1,56 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from chartmogul_mcp import api_client
+from chartmogul_mcp.singleflight import SingleFlight
+
+
+def test_identical_calls_share_one_request(fake_api):
+    fake, config = fake_api(latency=0.2)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        customers = list(pool.map(lambda _: api_client.retrieve_customer(config, "cus_00001"), range(4)))
+    assert fake.requests == 1
+    assert all(customer == customers[0] for customer in customers)
+
+
+def test_different_calls_are_not_collapsed(fake_api):
+    fake, config = fake_api(latency=0.1)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        list(pool.map(lambda uuid: api_client.retrieve_customer(config, uuid), ["cus_00001", "cus_00002"]))
+    assert fake.requests == 2
+
+
+def test_waiting_callers_share_the_error():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def fail():
+        started.set()
+        release.wait()
+        raise RuntimeError("down")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(flight.do, "key", fail)
+        started.wait()
+        follower = pool.submit(flight.do, "key", fail)
+        while flight.stats()["collapsed"] == 0:
+            time.sleep(0.001)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(RuntimeError):
+                future.result()
+    assert flight.stats() == {"calls": 2, "collapsed": 1, "in_flight": 0}
+
+
+def test_each_caller_gets_its_own_result(fake_api):
+    fake, config = fake_api(latency=0.2)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        listings = list(pool.map(lambda _: api_client.list_invoices(config, limit=5), range(2)))
+    assert fake.requests == 1
+    listings[0].append("added")
+    listings[0].has_more = None
+    assert len(listings[1]) == 5 and listings[1].has_more
+    assert listings[1] == listings[0][:5]
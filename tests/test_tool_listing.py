@@ -0,0 +1,76 @@
+import asyncio
+import json
+
+import pytest
+from mcp import types
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from chartmogul_mcp import utils
+from chartmogul_mcp.mcp_server import ChartMogulMcp
+from chartmogul_mcp.tool_listing import _DumpedResult, compact_schema, short_description
+
+
+async def _listing(mcp, cached=True):
+    if not cached:
+        # The stock FastMCP handler, building the list for every request.
+        mcp._mcp_server.list_tools()(lambda: FastMCP.list_tools(mcp))
+    async with create_connected_server_and_client_session(mcp._mcp_server) as client:
+        first, second = await client.list_tools(), await client.list_tools()
+        templates = await client.list_resource_templates()
+    assert first == second
+    return first, [template.uriTemplate for template in templates.resourceTemplates]
+
+
+def test_cached_listing_equals_uncached_listing(monkeypatch):
+    monkeypatch.setattr(utils, "COMPACT_TOOLS", False)
+    cached, templates = asyncio.run(_listing(ChartMogulMcp().mcp))
+    uncached, _ = asyncio.run(_listing(ChartMogulMcp().mcp, cached=False))
+    assert cached == uncached
+    assert templates == []
+
+
+def test_compact_listing_links_to_tool_docs(monkeypatch):
+    monkeypatch.setattr(utils, "COMPACT_TOOLS", True)
+    mcp = ChartMogulMcp().mcp
+    listing, templates = asyncio.run(_listing(mcp))
+    assert templates == ["chartmogul://tools/{name}"]
+    tool = listing.tools[0]
+    full = json.loads(asyncio.run(mcp.read_resource(f"chartmogul://tools/{tool.name}"))[0].content)
+    assert tool.description == short_description(full["description"])
+    assert tool.inputSchema == compact_schema(full["inputSchema"])
+
+
+def test_adding_a_tool_rebuilds_the_listing(monkeypatch):
+    monkeypatch.setattr(utils, "COMPACT_TOOLS", False)
+    mcp = ChartMogulMcp().mcp
+    count = len(asyncio.run(_listing(mcp))[0].tools)
+    mcp.add_tool(lambda: None, name="noop")
+    assert len(asyncio.run(_listing(mcp))[0].tools) == count + 1
+
+
+@pytest.mark.parametrize("description, short", [
+    ("Retrieve a customer. Returns the customer.", "Retrieve a customer."),
+    ("List plans.Returns plans.", "List plans."),
+    ("No sentence end", "No sentence end"),
+])
+def test_short_description(description, short):
+    assert short_description(description) == short
+
+
+def test_compact_schema():
+    schema = {"title": "Args", "type": "object", "properties": {
+        "limit": {"anyOf": [{"type": "integer"}, {"type": "null"}], "default": None, "title": "Limit"}}}
+    assert compact_schema(schema) == {"type": "object", "properties": {"limit": {"type": ["integer", "null"]}}}
+
+
+def test_mcp_internals_the_cache_relies_on(monkeypatch):
+    # CachedToolsMCP replaces the low-level tools/list handler and hands the session a result that
+    # only has model_dump; an mcp upgrade changing either must fail here.
+    mcp = ChartMogulMcp().mcp
+    assert mcp._mcp_server.request_handlers[types.ListToolsRequest] == mcp._list_tools_request
+    calls = []
+    model_dump = _DumpedResult.model_dump
+    monkeypatch.setattr(_DumpedResult, "model_dump", lambda self, **kwargs: calls.append(kwargs) or model_dump(self))
+    asyncio.run(_listing(mcp))
+    assert calls and all(kwargs == {"by_alias": True, "mode": "json", "exclude_none": True} for kwargs in calls)
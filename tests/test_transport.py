@@ -0,0 +1,44 @@
+import pytest
+
+from chartmogul_mcp import api_client, utils
+from chartmogul_mcp.transport import AsyncTransport
+
+
+@pytest.fixture
+def transport():
+    transport = AsyncTransport(pool_size=4, per_host=2)
+    yield transport
+    transport.close()
+
+
+def _sent(fake, config, send, resource, method, **kwargs):
+    send(config, resource, method, **kwargs)
+    return fake.last_request
+
+
+# requests warns about the missing API key it sends as "None".
+@pytest.mark.filterwarnings("ignore:Non-string usernames:DeprecationWarning")
+@pytest.mark.parametrize("token", ["secret", None], ids=["token", "no-token"])
+def test_transport_sends_what_the_sdk_sends(fake_api, transport, monkeypatch, token):
+    monkeypatch.setattr(utils, "CHARTMOGUL_TOKEN", token)
+    fake, config = fake_api()
+    chartmogul = api_client.chartmogul
+    calls = [
+        (chartmogul.Task, 'all', {"completed": True, "customer_uuid": "cus_1", "assignee": None}),
+        (chartmogul.Activity, 'all', {"start_date": "2024-01-01", "per_page": 10}),
+        (chartmogul.Customer, 'retrieve', {"uuid": "cus_00001"}),
+    ]
+    for resource, method, kwargs in calls:
+        sdk = _sent(fake, config, lambda *args, **kw: getattr(args[1], args[2])(args[0], **kw).get(),
+                    resource, method, **dict(kwargs))
+        pooled = _sent(fake, config, transport.request, resource, method, **dict(kwargs))
+        assert pooled == sdk
+
+
+def test_transport_hydrates_like_the_sdk(fake_api, transport):
+    fake, config = fake_api(records=5)
+    chartmogul = api_client.chartmogul
+    sdk = chartmogul.Customer.all(config).get()
+    pooled = transport.request(config, chartmogul.Customer, 'all')
+    assert api_client.parse_object(pooled.entries) == api_client.parse_object(sdk.entries)
+    assert (pooled.has_more, pooled.cursor) == (sdk.has_more, sdk.cursor)